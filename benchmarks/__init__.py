@@ -0,0 +1,5 @@
+"""Graia Scheduler 的性能基准测试.
+
+使用 `python -m benchmarks.<name>` 运行单项测试,
+或使用 `python -m benchmarks` 运行全部测试并将结果写入 JSON 文件.
+"""
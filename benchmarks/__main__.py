@@ -0,0 +1,84 @@
+"""依次运行各项基准测试, 并将结果写入 JSON 文件以便与此前的结果对比.
+
+用法: `python -m benchmarks [-o results.json] [--compare baseline.json] [suite ...]`
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+SUITES = [
+    "cron",
+    "exec_target",
+    "scale",
+    "lateness",
+    "saya",
+    "simulation",
+    "oneshot",
+    "dst",
+    "shard",
+    "preview",
+]
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any]) -> None:
+    print(f"\n{'metric':<48}{'baseline':>14}{'current':>14}{'ratio':>8}")
+    for suite, metrics in results.items():
+        previous = baseline.get("results", {}).get(suite, {})
+        for name, value in metrics.items():
+            if name not in previous:
+                continue
+            old = previous[name]
+            ratio = value / old if old else float("nan")
+            print(f"{suite + '.' + name:<48}{old:>14.4g}{value:>14.4g}{ratio:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Graia Scheduler benchmarks"
+    )
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        choices=[[], *SUITES],
+        default=[],
+        help="要运行的测试, 默认为全部",
+    )
+    parser.add_argument(
+        "-o", "--output", default="benchmark-results.json", help="结果文件路径"
+    )
+    parser.add_argument("--compare", help="与之对比的此前的结果文件")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for suite in args.suites or SUITES:
+        print(f"running {suite} ...", file=sys.stderr)
+        start = time.perf_counter()
+        results[suite] = importlib.import_module(f"benchmarks.{suite}").collect()
+        print(f"  done in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+    document = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+    print(f"results written to {args.output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""对比 croniter 与 graia.scheduler.cron 求下一次执行时间的吞吐量"""
+
+import timeit
+from datetime import datetime
+from typing import Dict
+
+from croniter import croniter
+
+from graia.scheduler.cron import compile_cron
+
+PATTERNS = [
+    "* * * * * *",
+    "*/5 * * * *",
+    "0 9 * * 1-5",
+    "30 2 L * *",
+    "0 12 * * mon,fri",
+]
+COUNT = 2000
+
+
+def bench_croniter(pattern: str) -> None:
+    iterator = croniter(pattern, datetime(2023, 1, 1))
+    for _ in range(COUNT):
+        iterator.get_next(datetime)
+
+
+def bench_compiled(pattern: str) -> None:
+    compile_cron(pattern).next_n(datetime(2023, 1, 1), COUNT)
+
+
+def collect() -> Dict[str, float]:
+    results = {}
+    for pattern in PATTERNS:
+        old = min(timeit.repeat(lambda: bench_croniter(pattern), number=1, repeat=3))
+        new = min(timeit.repeat(lambda: bench_compiled(pattern), number=1, repeat=3))
+        results[f"croniter_per_s[{pattern}]"] = COUNT / old
+        results[f"compiled_per_s[{pattern}]"] = COUNT / new
+    old = min(
+        timeit.repeat(
+            lambda: [croniter("0 * * * *", datetime(2023, 1, 1)) for _ in range(COUNT)],
+            number=1,
+        )
+    )
+    new = min(
+        timeit.repeat(
+            lambda: [compile_cron("0 * * * *") for _ in range(COUNT)], number=1
+        )
+    )
+    results["croniter_construct_per_s"] = COUNT / old
+    results["compiled_construct_per_s"] = COUNT / new
+    return results
+
+
+def main() -> None:
+    results = collect()
+    print(f"{'pattern':<16}{'croniter (/s)':>16}{'compiled (/s)':>16}{'speedup':>10}")
+    for pattern in PATTERNS:
+        old, new = (
+            results[f"croniter_per_s[{pattern}]"],
+            results[f"compiled_per_s[{pattern}]"],
+        )
+        print(f"{pattern:<16}{old:>16.0f}{new:>16.0f}{new / old:>9.1f}x")
+    old, new = results["croniter_construct_per_s"], results["compiled_construct_per_s"]
+    print(f"{'construct':<16}{old:>16.0f}{new:>16.0f}{new / old:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
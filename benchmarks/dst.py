@@ -0,0 +1,34 @@
+"""带时区的计时器求下一次执行时间的开销, 夏令时边界附近的行为由 tests/test_tz.py 验证"""
+
+import time
+from typing import Dict
+
+from graia.scheduler.timers import SeekableTimer, crontabify
+
+
+def _per_next(timer: SeekableTimer, count: int = 20000) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        next(timer)
+    return (time.perf_counter() - start) / count
+
+
+def collect() -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for pattern, label in (("0 9 * * *", "daily"), ("*/5 * * * *", "5min")):
+        results[f"next_us[{label},naive]"] = (
+            _per_next(crontabify(pattern, "2024-01-01 00:00")) * 1e6
+        )
+        results[f"next_us[{label},tz]"] = (
+            _per_next(crontabify(pattern, "2024-01-01 00:00", tz="Europe/Berlin")) * 1e6
+        )
+    return results
+
+
+def main() -> None:
+    for name, value in collect().items():
+        print(f"{name:<28}{value:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""对比每次执行都新建 ExecTarget 与复用 ExecTarget 时, 单次执行的开销"""
+
+import asyncio
+import time
+from typing import Dict
+
+from graia.broadcast import Broadcast
+from graia.broadcast.entities.dispatcher import BaseDispatcher
+from graia.broadcast.entities.exectarget import ExecTarget
+from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+COUNT = 20000
+
+
+class ValueDispatcher(BaseDispatcher):
+    @staticmethod
+    async def catch(interface: DispatcherInterface):
+        if interface.name == "value":
+            return 1
+        if interface.name == "other":
+            return 2
+
+
+async def target(broadcast: Broadcast, value: int, other: int):
+    pass
+
+
+async def bench(broadcast: Broadcast, cached: bool) -> float:
+    dispatchers = [ValueDispatcher]
+    exec_target = ExecTarget(target, inline_dispatchers=dispatchers)
+    start = time.perf_counter()
+    for _ in range(COUNT):
+        if not cached:
+            exec_target = ExecTarget(target, inline_dispatchers=dispatchers)
+        await broadcast.Executor(target=exec_target)
+    return (time.perf_counter() - start) / COUNT
+
+
+async def measure() -> Dict[str, float]:
+    broadcast = Broadcast()
+    fresh = min([await bench(broadcast, False) for _ in range(3)])
+    cached = min([await bench(broadcast, True) for _ in range(3)])
+    return {"fresh_fire_us": fresh * 1e6, "cached_fire_us": cached * 1e6}
+
+
+def collect() -> Dict[str, float]:
+    return asyncio.run(measure())
+
+
+def main() -> None:
+    results = collect()
+    fresh, cached = results["fresh_fire_us"], results["cached_fire_us"]
+    print(f"fresh ExecTarget:  {fresh:8.2f} us/fire")
+    print(f"cached ExecTarget: {cached:8.2f} us/fire ({fresh / cached:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
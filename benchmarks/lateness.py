@@ -0,0 +1,77 @@
+"""大量任务同时运行时, 实际执行时间相对计划时间的延迟分布"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.task import SchedulerTask
+from graia.scheduler.timers import IntervalTimer
+
+JOBS = 1000
+INTERVAL = timedelta(milliseconds=500)
+DURATION = 5.0
+MODES = ["task", "heap"]
+PERCENTILES = [50, 90, 99]
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def measure(mode: str) -> List[float]:
+    loop = asyncio.get_running_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode)  # type: ignore
+    lateness = []
+
+    def make_job(task_id: str):
+        def job():
+            task: SchedulerTask = scheduler.tasks[task_id]
+            fired: datetime = task.last_fire_time  # type: ignore
+            lateness.append((datetime.now() - fired).total_seconds())
+
+        return job
+
+    for index in range(JOBS):
+        scheduler.add_task(
+            make_job(str(index)), IntervalTimer(INTERVAL, fixed="rate"), id=str(index)
+        )
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(DURATION)
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+    return lateness
+
+
+def collect() -> Dict[str, float]:
+    results = {}
+    for mode in MODES:
+        lateness = asyncio.run(measure(mode))
+        results[f"fires[{mode}]"] = len(lateness)
+        for p in PERCENTILES:
+            results[f"lateness_p{p}_ms[{mode}]"] = percentile(lateness, p) * 1e3
+        results[f"lateness_max_ms[{mode}]"] = max(lateness) * 1e3
+    return results
+
+
+def main() -> None:
+    results = collect()
+    columns = [f"p{p}" for p in PERCENTILES] + ["max"]
+    print(
+        f"{'mode':<6}{'fires':>8}"
+        + "".join(f"{column + ' (ms)':>12}" for column in columns)
+    )
+    for mode in MODES:
+        values = [results[f"lateness_{column}_ms[{mode}]"] for column in columns]
+        print(
+            f"{mode:<6}{results[f'fires[{mode}]']:>8.0f}"
+            + "".join(f"{value:>12.2f}" for value in values)
+        )
+
+
+if __name__ == "__main__":
+    main()
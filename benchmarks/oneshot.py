@@ -0,0 +1,93 @@
+"""一次性任务的加入, 取消与执行吞吐量, 在 100 万个待执行任务的规模下以虚拟时钟测量"""
+
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+
+COUNT = 1_000_000
+MEMORY_COUNT = 100_000
+HORIZON = 86400.0
+
+
+def collect() -> Dict[str, float]:
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    fires = 0
+
+    def remind(user: int) -> None:
+        nonlocal fires
+        fires += 1
+
+    async def measure() -> Dict[str, float]:
+        scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+        rng = random.Random(0)
+        delays = [rng.uniform(0, HORIZON) for _ in range(COUNT)]
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        sample = [
+            scheduler.schedule_after(delays[index], remind, index)
+            for index in range(MEMORY_COUNT)
+        ]
+        memory = (tracemalloc.get_traced_memory()[0] - before) / MEMORY_COUNT
+        tracemalloc.stop()
+        for job in sample:
+            job.cancel()
+        del sample
+
+        start = time.perf_counter()
+        jobs = [
+            scheduler.schedule_after(delay, remind, index)
+            for index, delay in enumerate(delays)
+        ]
+        insert = time.perf_counter() - start
+
+        cancelled = jobs[::2]
+        start = time.perf_counter()
+        for job in cancelled:
+            job.cancel()
+        cancel = time.perf_counter() - start
+        del jobs, cancelled
+
+        remaining = len(scheduler.oneshots)
+        runner = loop.create_task(scheduler.run())
+        start = time.perf_counter()
+        await asyncio.sleep(HORIZON + 1)
+        fire = time.perf_counter() - start
+        scheduler.stop()
+        await runner
+        assert fires == remaining, (fires, remaining)
+        return {
+            "insert_per_s": COUNT / insert,
+            "cancel_per_s": COUNT / 2 / cancel,
+            "fire_per_s": remaining / fire,
+            "bytes_per_job": memory,
+        }
+
+    try:
+        return loop.run_until_complete(measure())
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    results = collect()
+    print(f"pending jobs:  {COUNT}")
+    print(f"insert:        {results['insert_per_s']:.0f} /s")
+    print(f"cancel:        {results['cancel_per_s']:.0f} /s")
+    print(f"fire:          {results['fire_per_s']:.0f} /s")
+    print(f"memory:        {results['bytes_per_job']:.0f} bytes/job")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""预览 10000 个任务在一周内的计划执行时间的开销"""
+
+import asyncio
+import random
+import time
+from datetime import timedelta
+from typing import Callable, Dict
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.timers import IntervalTimer, crontabify
+
+JOBS = 10000
+HORIZON = timedelta(weeks=1)
+COUNT = 10
+LIMIT = 1000
+REPEAT = 5
+
+
+def _best(function: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def collect() -> Dict[str, float]:
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast())
+        rng = random.Random(0)
+        for index in range(JOBS):
+            kind = index % 4
+            if kind == 0:
+                timer = crontabify(f"{rng.randrange(60)} {rng.randrange(24)} * * *")
+            elif kind == 1:
+                timer = crontabify(f"*/{rng.choice([5, 10, 15, 30])} * * * *")
+            elif kind == 2:
+                timer = IntervalTimer(
+                    timedelta(seconds=rng.randrange(30, 3600)), base="2024-01-01 00:00"
+                )
+            else:
+                timer = IntervalTimer(
+                    timedelta(seconds=rng.randrange(30, 3600)), fixed="rate"
+                )
+            scheduler.add_task(lambda: None, timer, id=str(index))
+        return {
+            "upcoming_ms": _best(lambda: scheduler.upcoming_fires(COUNT, HORIZON))
+            * 1e3,
+            "timeline_ms": _best(lambda: scheduler.timeline(HORIZON, LIMIT)) * 1e3,
+        }
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    results = collect()
+    print(f"jobs: {JOBS}, horizon: {HORIZON}")
+    print(f"upcoming_fires(count={COUNT}):  {results['upcoming_ms']:.1f} ms")
+    print(f"timeline(limit={LIMIT}):       {results['timeline_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""GraiaSchedulerBehaviour 的 allocate 与 release 吞吐量, 分别在计划器运行前后测量"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Dict
+
+from graia.broadcast import Broadcast
+from graia.saya.channel import Channel
+from graia.saya.context import channel_instance
+from graia.saya.cube import Cube
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.saya.behaviour import GraiaSchedulerBehaviour
+from graia.scheduler.saya.schema import SchedulerSchema
+from graia.scheduler.timers import IntervalTimer
+
+COUNT = 10000
+MODES = ["task", "heap"]
+
+
+def job():
+    pass
+
+
+async def measure(mode: str, running: bool) -> Dict[str, float]:
+    loop = asyncio.get_running_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode)  # type: ignore
+    behaviour = GraiaSchedulerBehaviour(scheduler)
+    channel_instance.set(Channel(__name__))
+    cubes = [
+        Cube(job, SchedulerSchema(IntervalTimer(timedelta(hours=1))))
+        for _ in range(COUNT)
+    ]
+    runner = None
+    if running:
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for cube in cubes:
+        behaviour.allocate(cube)
+    allocate = time.perf_counter() - start
+    await asyncio.sleep(0)  # 让运行中的计划器启动新加入的任务
+    start = time.perf_counter()
+    for cube in cubes:
+        behaviour.release(cube)
+    release = time.perf_counter() - start
+
+    if runner is not None:
+        scheduler.stop()
+        await scheduler.join()
+        await runner
+    return {"allocate_per_s": COUNT / allocate, "release_per_s": COUNT / release}
+
+
+def collect() -> Dict[str, float]:
+    results = {}
+    for mode in MODES:
+        for running in (False, True):
+            state = "running" if running else "idle"
+            for name, value in asyncio.run(measure(mode, running)).items():
+                results[f"{name}[{mode},{state}]"] = value
+    return results
+
+
+def main() -> None:
+    results = collect()
+    print(f"{'mode':<6}{'state':<10}{'allocate (/s)':>16}{'release (/s)':>16}")
+    for mode in MODES:
+        for state in ("idle", "running"):
+            allocate = results[f"allocate_per_s[{mode},{state}]"]
+            release = results[f"release_per_s[{mode},{state}]"]
+            print(f"{mode:<6}{state:<10}{allocate:>16.0f}{release:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
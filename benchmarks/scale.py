@@ -0,0 +1,88 @@
+"""不同任务数量下, 每个任务占用的内存与 run() 的启动耗时"""
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from datetime import timedelta
+from typing import Dict
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.timers import IntervalTimer
+
+SIZES = [1000, 10000, 100000]
+MODES = ["task", "heap"]
+
+
+def job():
+    pass
+
+
+def _scheduler(size: int, mode: str) -> GraiaScheduler:
+    loop = asyncio.get_running_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode)  # type: ignore
+    for index in range(size):
+        scheduler.add_task(job, IntervalTimer(timedelta(hours=1)), id=str(index))
+    return scheduler
+
+
+async def _start(scheduler: GraiaScheduler) -> asyncio.Task:
+    """开始运行计划器, 在所有任务都进入等待后返回 run() 的 Task."""
+    runner = asyncio.create_task(scheduler.run())
+    tasks = scheduler.schedule_tasks
+    while not (tasks[-1].is_sleeping and all(task.is_sleeping for task in tasks)):
+        await asyncio.sleep(0)
+    return runner
+
+
+async def _stop(scheduler: GraiaScheduler, runner: asyncio.Task) -> None:
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+
+
+async def measure(size: int, mode: str) -> Dict[str, float]:
+    # 内存在所有任务都进入等待后统计, 因此包括 task 模式下每个任务的 asyncio.Task,
+    # 协程帧与 TimerHandle, 以及 heap 模式下的堆条目
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    scheduler = _scheduler(size, mode)
+    runner = await _start(scheduler)
+    gc.collect()
+    resident = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    await _stop(scheduler, runner)
+
+    # tracemalloc 会拖慢启动, 启动耗时在另一个计划器上测量
+    scheduler = _scheduler(size, mode)
+    start = time.perf_counter()
+    runner = await _start(scheduler)
+    startup = time.perf_counter() - start
+    await _stop(scheduler, runner)
+    return {"bytes_per_job": (resident - before) / size, "startup_s": startup}
+
+
+def collect() -> Dict[str, float]:
+    results = {}
+    for mode in MODES:
+        for size in SIZES:
+            for name, value in asyncio.run(measure(size, mode)).items():
+                results[f"{name}[{mode},{size}]"] = value
+    return results
+
+
+def main() -> None:
+    results = collect()
+    print(f"{'mode':<6}{'jobs':>8}{'bytes/job':>12}{'startup (ms)':>14}")
+    for mode in MODES:
+        for size in SIZES:
+            memory = results[f"bytes_per_job[{mode},{size}]"]
+            startup = results[f"startup_s[{mode},{size}]"]
+            print(f"{mode:<6}{size:>8}{memory:>12.0f}{startup * 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""一个任务阻塞事件循环时, 其他任务的执行延迟: 不分片与分片模式的对比"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.task import SchedulerTask
+from graia.scheduler.timers import IntervalTimer
+
+JOBS = 50
+INTERVAL = timedelta(milliseconds=100)
+BLOCK = 0.08
+DURATION = 3.0
+SHARDS = [None, 2]
+# 两个分组在 2 个分片时落入不同的分片
+LIGHT_GROUP = "fast"
+BLOCKING_GROUP = "slow"
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def measure(shards: Optional[int]) -> List[float]:
+    loop = asyncio.get_running_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), shards=shards)
+    lateness = []
+
+    def make_job(task_id: str):
+        def job():
+            task: SchedulerTask = scheduler.tasks[task_id]
+            fired: datetime = task.last_fire_time  # type: ignore
+            lateness.append((datetime.now() - fired).total_seconds())
+
+        return job
+
+    def block():
+        time.sleep(BLOCK)
+
+    for index in range(JOBS):
+        timer = IntervalTimer(INTERVAL, fixed="rate")
+        scheduler.add_task(
+            make_job(str(index)), timer, group=LIGHT_GROUP, id=str(index)
+        )
+    # 阻塞的任务与其他任务错开半个周期, 不分片时其后到期的任务都会被推迟
+    offset = datetime.now() + INTERVAL / 2
+    scheduler.add_task(
+        block, IntervalTimer(INTERVAL, base=offset, fixed="rate"), group=BLOCKING_GROUP
+    )
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(DURATION)
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+    return lateness
+
+
+def collect() -> Dict[str, float]:
+    results = {}
+    for shards in SHARDS:
+        label = shards or 0
+        lateness = asyncio.run(measure(shards))
+        results[f"fires[shards={label}]"] = len(lateness)
+        for p in (50, 99):
+            results[f"lateness_p{p}_ms[shards={label}]"] = percentile(lateness, p) * 1e3
+    return results
+
+
+def main() -> None:
+    results = collect()
+    print(f"{'shards':<8}{'fires':>8}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for shards in SHARDS:
+        label = shards or 0
+        row = [
+            results[f"{name}[shards={label}]"]
+            for name in ("fires", "lateness_p50_ms", "lateness_p99_ms")
+        ]
+        print(f"{label:<8}{row[0]:>8.0f}{row[1]:>12.2f}{row[2]:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
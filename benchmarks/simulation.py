@@ -0,0 +1,58 @@
+"""以虚拟时钟模拟大量任务在一个月内的调度, 用于评估调度密度而无需真实等待"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.timers import crontabify
+
+JOBS = 10000
+DAYS = 30
+
+
+def collect() -> Dict[str, float]:
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    fires = 0
+
+    def job():
+        nonlocal fires
+        fires += 1
+
+    async def simulate():
+        scheduler = GraiaScheduler(loop, Broadcast(), mode="heap", clock=clock)
+        rng = random.Random(0)
+        for index in range(JOBS):
+            pattern = f"{rng.randrange(60)} {rng.randrange(24)} * * *"
+            scheduler.add_task(job, crontabify(pattern), id=f"job-{index}")
+        loop.call_at(timedelta(days=DAYS).total_seconds(), scheduler.stop)
+        await scheduler.run()
+
+    start = time.perf_counter()
+    loop.run_until_complete(simulate())
+    elapsed = time.perf_counter() - start
+    loop.close()
+    return {
+        "jobs": JOBS,
+        "days": DAYS,
+        "fires": fires,
+        "wall_s": elapsed,
+        "fire_us": elapsed / fires * 1e6,
+    }
+
+
+def main() -> None:
+    results = collect()
+    print(f"jobs:       {JOBS}")
+    print(f"simulated:  {DAYS} days")
+    print(f"fires:      {results['fires']:.0f}")
+    print(f"wall time:  {results['wall_s']:.2f} s ({results['fire_us']:.1f} us/fire)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,177 @@
-from datetime import datetime
-from typing import Iterable, List, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, List, Literal, Optional
 
 from graia.broadcast.typing import T_Dispatcher
 
 Timer = Iterable[datetime]
 
 import asyncio
+import zlib
 from asyncio import AbstractEventLoop
-from typing import Callable, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Sequence, Set, TypeVar, Union
 
 from graia.broadcast import Broadcast
 from graia.broadcast.entities.decorator import Decorator
 
-from .task import SchedulerTask
+from .clock import Clock, VirtualClock, system_clock
+from .engine import HeapEngine
+from .exception import AlreadyStarted
+from .hooks import ExecutionHooks, Hook
+from .limiter import ExecutionLimiter
+from .lock import LockBackend
+from .metrics import render_prometheus
+from .oneshot import OneShotJob, OneShotQueue
+from .preview import UpcomingFire, timeline, upcoming
+from .retry import RetryPolicy
+from .shard import SchedulerShard
+from .store import JobStore, MemoryJobStore
+from .task import SchedulerTask, drain
 
 T_Callable = TypeVar("T_Callable", bound=Callable)
+T_ExecutorKind = Literal["inline", "thread", "process"]
+
+
+class _TaskSnapshot(tuple):
+    """schedule_tasks 返回的只读快照, 修改时直接报错, 而不是静默地修改一个副本."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(
+            "GraiaScheduler.schedule_tasks is a read-only snapshot, "
+            "use add_task / remove_task to change the scheduled tasks"
+        )
+
+    append = extend = insert = remove = pop = clear = _read_only
 
 
 class GraiaScheduler:
-    """任务计划器"""
+    """任务计划器
+
+    所有计划任务以任务 id 为键保存在 tasks 中, 计划器运行期间也可随时加入或移除任务.
+    """
 
     loop: AbstractEventLoop
-    schedule_tasks: List[SchedulerTask]
+    tasks: Dict[str, SchedulerTask]
     broadcast: Broadcast
+    mode: Literal["task", "heap"]
+    wakeup_tolerance: float
+    batch_concurrency: Optional[int]
+    max_thread_workers: Optional[int]
+    max_process_workers: Optional[int]
+    executors: Dict[str, Executor]
+    limiter: Optional[ExecutionLimiter]
+    engine: Optional[HeapEngine]
+    running: bool
+    store: JobStore
+    lock: Optional[LockBackend]
+    clock: Clock
+    hooks: ExecutionHooks
+    oneshots: OneShotQueue
+    shards: List[SchedulerShard]
 
-    def __init__(self, loop: AbstractEventLoop, broadcast: Broadcast) -> None:
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        broadcast: Broadcast,
+        mode: Literal["task", "heap"] = "task",
+        wakeup_tolerance: float = 0.0,
+        batch_concurrency: Optional[int] = None,
+        max_thread_workers: Optional[int] = None,
+        max_process_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        group_concurrency: Optional[Dict[str, int]] = None,
+        store: Optional[JobStore] = None,
+        lock: Optional[LockBackend] = None,
+        clock: Optional[Clock] = None,
+        lifecycle_events: bool = False,
+        shards: Optional[int] = None,
+    ) -> None:
         """初始化
 
         Args:
             loop (AbstractEventLoop): 事件循环
             broadcast (Broadcast): 事件总线
+            mode (Literal["task", "heap"], optional): 调度模式.
+                "task" (默认) 为每个任务创建一个 asyncio.Task; "heap" 则由单个调度协程
+                以最小堆管理所有任务的执行时间, 适用于任务数量极多的场景.
+            wakeup_tolerance (float, optional): heap 模式下合并唤醒的时间窗口 (秒), 窗口内到期的任务共享一次唤醒.
+                默认为 0.
+            batch_concurrency (Optional[int], optional): heap 模式下同一批任务的最大并发执行数量. 默认为不限制.
+            max_thread_workers (Optional[int], optional): 计划器所属线程池的最大线程数.
+                默认同 ThreadPoolExecutor.
+            max_process_workers (Optional[int], optional): 计划器所属进程池的最大进程数.
+                默认同 ProcessPoolExecutor.
+            max_concurrency (Optional[int], optional): 所有任务的最大并发执行数量,
+                超出时按任务优先级排队. 默认为不限制.
+            group_concurrency (Optional[Dict[str, int]], optional): 各任务分组的最大并发执行数量.
+                默认为空.
+            store (Optional[JobStore], optional): 保存各任务上一次/下一次执行时间的存储后端. 加入任务时会读取其中
+                同一 id 的状态, 使重启后能从上次的计划继续, 并按 misfire 策略补上停机期间错过的执行.
+                默认为 MemoryJobStore.
+            lock (Optional[LockBackend], optional): 跨进程的执行互斥后端. 设置后,
+                多个进程中 id 相同的任务的同一次计划执行只会在其中一个进程中进行;
+                各进程的计时器须给出相同的计划时间 (如 crontab 或指定了 base 的间隔).
+                默认为 None.
+            clock (Optional[Clock], optional): 计划器与计时器使用的时钟. 使用 VirtualClock 时,
+                loop 须为 clock.new_event_loop() 创建的事件循环. 默认为系统时钟.
+            lifecycle_events (bool, optional): 是否在每次执行开始与结束时广播 SchedulerTaskStarted 与
+                SchedulerTaskFinished 事件. 默认为 False.
+            shards (Optional[int], optional): 分片数量. 设置后计划任务按分组 (未设置分组时按任务 id) 的哈希
+                分散到该数量的工作线程中, 各自在独立的事件循环中调度与执行, 一个分片被阻塞不会推迟其他分片;
+                执行中广播的事件与异常仍在 broadcast 上广播. 此时执行钩子在分片的线程中调用,
+                max_concurrency 与 group_concurrency 在每个分片中分别计算, 一次性任务仍在 loop 中执行.
+                不能与 VirtualClock 同时使用. 默认为 None, 即所有任务都在 loop 中运行.
         """
-        self.schedule_tasks = []
+        if (
+            isinstance(clock, VirtualClock)
+            and getattr(loop, "clock", None) is not clock
+        ):
+            raise ValueError(
+                "a VirtualClock must be used with the event loop "
+                "from clock.new_event_loop()"
+            )
+        if shards is not None and (shards < 1 or isinstance(clock, VirtualClock)):
+            raise ValueError(
+                "shards must be a positive number "
+                "and cannot be used with a VirtualClock"
+            )
+        self.tasks = {}
         self.loop = loop
         self.broadcast = broadcast
+        self.mode = mode
+        self.wakeup_tolerance = wakeup_tolerance
+        self.batch_concurrency = batch_concurrency
+        self.max_thread_workers = max_thread_workers
+        self.max_process_workers = max_process_workers
+        self.executors = {}
+        self.limiter = None
+        if max_concurrency is not None or group_concurrency:
+            self.limiter = ExecutionLimiter(max_concurrency, group_concurrency)
+        self.engine = None
+        self.running = False
+        self.store = MemoryJobStore() if store is None else store
+        self.lock = lock
+        self.clock = clock or system_clock
+        self.hooks = ExecutionHooks(broadcast if lifecycle_events else None)
+        self.oneshots = OneShotQueue(loop, broadcast, self.clock)
+        self.oneshots.on_empty = self._check_idle
+        self.shards = [SchedulerShard(self, index) for index in range(shards or 0)]
+        self._closing: Optional[asyncio.Future] = None
+        self._forever = False
+        self._live: Set[SchedulerTask] = set()
+        self._shutdown: Optional[asyncio.Task] = None
+        self._id_suffixes: Dict[str, int] = {}
+
+    @property
+    def schedule_tasks(self) -> Sequence[SchedulerTask]:
+        """所有计划任务的只读快照, 按加入的顺序排列.
+
+        任务现在以 id 为键保存在 tasks 中, 本属性不再是可修改的列表:
+        对其调用 append, remove 等方法会抛出 TypeError, 请改用 add_task 与 remove_task.
+        """
+        return _TaskSnapshot(self.tasks.values())
 
     def schedule(
         self,
@@ -41,6 +179,15 @@ class GraiaScheduler:
         cancelable: bool = False,
         dispatchers: Optional[List[T_Dispatcher]] = None,
         decorators: Optional[List[Decorator]] = None,
+        executor: T_ExecutorKind = "inline",
+        max_instances: int = 1,
+        coalesce: bool = False,
+        misfire_grace_time: Optional[float] = 0.0,
+        priority: int = 0,
+        group: Optional[str] = None,
+        timeout: Optional[float] = None,
+        id: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
     ) -> Callable[[T_Callable], T_Callable]:
         """计划一个新任务.
 
@@ -49,35 +196,458 @@ class GraiaScheduler:
             cancelable (bool, optional): 能否取消该任务. 默认为 False.
             dispatchers (List[T_Dispatcher], optional): 该任务要使用的 Dispatchers. 默认为空列表.
             decorators (Optional[List[Decorator]], optional): 该任务要使用的 Decorators. 默认为空列表.
+            executor (Literal["inline", "thread", "process"], optional): 任务的执行方式.
+                "inline" (默认) 直接在事件循环中执行; "thread" 与 "process" 则将同步函数放入计划器所属的线程池/进程池,
+                避免阻塞事件循环. 使用 "process" 时, 函数本身及其参数都必须能被 pickle.
+            max_instances (int, optional): 允许同时进行的执行数量. 默认为 1, 即上一次执行结束后才会开始等待下一次.
+            coalesce (bool, optional): 在宽限期内错过了多次执行时, 是否只补执行一次. 默认为 False.
+            misfire_grace_time (Optional[float], optional): 错过执行时间的宽限期 (秒), 在宽限期内会补执行,
+                超出则跳过并计入 misfire_count. 默认为 0, 即跳过所有错过的执行; 为 None 时不限制.
+            priority (int, optional): 受并发限制而排队时的优先级, 越大越先执行. 默认为 0.
+            group (Optional[str], optional): 任务所属分组, 用于分组并发限制. 默认为 None.
+            timeout (Optional[float], optional): 单次执行的超时时间 (秒).
+                超时的执行在 cancelable 时被取消, 否则被放弃, 并广播 SchedulerTaskTimeout 事件.
+                默认为 None, 即不限制.
+            id (Optional[str], optional): 任务 id, 可用于 get_task 与 remove_task.
+                默认由函数的模块与限定名生成, 重复时自动添加序号.
+            retry (Optional[RetryPolicy], optional): 执行失败或超时后的重试策略. 重试作为额外的计划时间进行,
+                不会阻塞之后的常规执行. 默认为 None, 即不重试.
 
         Returns:
             Callable[[T_Callable], T_Callable]: 任务 函数/方法 包装器.
         """
 
         def wrapper(func):
-            task = SchedulerTask(
+            self.add_task(
                 func,
                 timer,
-                self.broadcast,
-                self.loop,
                 cancelable,
                 dispatchers,
                 decorators,
+                executor,
+                max_instances,
+                coalesce,
+                misfire_grace_time,
+                priority,
+                group,
+                timeout,
+                id,
+                retry,
             )
-            self.schedule_tasks.append(task)
             return func
 
         return wrapper
 
-    async def run(self) -> None:
-        """开始所有计划任务, 在所有任务结束后返回"""
-        await asyncio.gather(*(task.setup_task() for task in self.schedule_tasks))
+    def add_task(
+        self,
+        target: Callable,
+        timer: Timer,
+        cancelable: bool = False,
+        dispatchers: Optional[List[T_Dispatcher]] = None,
+        decorators: Optional[List[Decorator]] = None,
+        executor: T_ExecutorKind = "inline",
+        max_instances: int = 1,
+        coalesce: bool = False,
+        misfire_grace_time: Optional[float] = 0.0,
+        priority: int = 0,
+        group: Optional[str] = None,
+        timeout: Optional[float] = None,
+        id: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+    ) -> SchedulerTask:
+        """计划一个新任务并返回它, 可用于 pause, resume 与 reschedule. 计划器运行期间加入的任务会立即开始.
+
+        参数与 schedule 相同, target 为任务 函数/方法.
+
+        Raises:
+            ValueError: 显式指定的任务 id 已被占用.
+
+        Returns:
+            SchedulerTask: 计划任务.
+        """
+        if id is None:
+            id = self._unique_id(f"{target.__module__}.{target.__qualname__}")
+        elif id in self.tasks:
+            raise ValueError(f"task id {id!r} is already in use")
+        loop, broadcast, limiter, hooks = (
+            self.loop,
+            self.broadcast,
+            self.limiter,
+            self.hooks,
+        )
+        if self.shards:
+            shard = self._select_shard(group or id)
+            loop, broadcast, limiter, hooks = (
+                shard.loop or self.loop,  # 分片启动时再转到其事件循环
+                shard.broadcast,
+                shard.limiter,
+                shard.hooks,
+            )
+        task = SchedulerTask(
+            target,
+            timer,
+            broadcast,
+            loop,
+            cancelable,
+            dispatchers,
+            decorators,
+            self.get_executor(executor),
+            max_instances,
+            coalesce,
+            misfire_grace_time,
+            priority,
+            group,
+            limiter,
+            timeout,
+            id,
+            self.store,
+            self.lock,
+            self.clock,
+            hooks,
+            retry,
+        )
+        state = self.store.load(id)
+        if state is not None:
+            task.restore(state)
+        self.tasks[id] = task
+        if self.running:
+            self._live.add(task)
+            self._start(task)
+        return task
+
+    def schedule_at(
+        self, when: datetime, target: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> OneShotJob:
+        """计划在 when 执行一次 target(*args, **kwargs).
+
+        一次性任务不创建 SchedulerTask, 而是由计划器的 oneshots 统一管理, 适用于大量的提醒类任务;
+        其参数直接传入, 不经过 Broadcast 的参数解析. 任务在计划器运行期间才会执行, 启动前已到期的任务会在启动时立即执行.
+
+        Args:
+            when (datetime): 执行时间, 与计划器的时钟比较.
+            target (Callable[..., Any]): 要执行的 函数/异步函数.
+
+        Returns:
+            OneShotJob: 一次性任务, 可通过其 cancel 方法取消.
+        """
+        return self.oneshots.at(when, target, args, kwargs)
+
+    def schedule_after(
+        self,
+        delay: Union[float, timedelta],
+        target: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> OneShotJob:
+        """计划在 delay 之后执行一次 target(*args, **kwargs), 其余同 schedule_at.
+
+        Args:
+            delay (Union[float, timedelta]): 延迟, 数字表示秒数.
+            target (Callable[..., Any]): 要执行的 函数/异步函数.
+
+        Returns:
+            OneShotJob: 一次性任务, 可通过其 cancel 方法取消.
+        """
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        return self.oneshots.after(delay, target, args, kwargs)
+
+    def _unique_id(self, base: str) -> str:
+        id, index = base, self._id_suffixes.get(base, 1)
+        while id in self.tasks:
+            index += 1
+            id = f"{base}#{index}"
+        self._id_suffixes[base] = index  # 同一函数被大量计划时, 避免每次都从头探测序号
+        return id
+
+    def _select_shard(self, key: str) -> SchedulerShard:
+        return self.shards[zlib.crc32(key.encode()) % len(self.shards)]
+
+    def _local_tasks(self) -> Sequence[SchedulerTask]:
+        """在 loop 中运行的计划任务; 分片模式下所有计划任务都属于各个分片."""
+        return () if self.shards else self.schedule_tasks
+
+    def _start(self, task: SchedulerTask) -> None:
+        if self.shards:
+            shard = self._select_shard(task.group or task.id)
+            if shard.alive:
+                shard.call_soon(shard.start_task, task)
+            return
+        if self.engine is not None:
+            self.engine.register(task)
+        else:
+            task.setup_task()
+        task.task.add_done_callback(  # type: ignore
+            lambda _, task=task: self._task_finished(task)
+        )
+
+    def _task_finished(self, task: SchedulerTask) -> None:
+        """任务结束 (计时器耗尽或被停止) 时在 loop 中调用."""
+        self._live.discard(task)
+        self._check_idle()
+
+    def _check_idle(self) -> None:
+        """所有计划任务都已结束, 且没有待执行的一次性任务时, 使未指定 forever 的 run 返回."""
+        if self._closing is None or self._closing.done() or self._forever:
+            return
+        if not self._live and not len(self.oneshots):
+            self._closing.set_result(True)
+
+    def before_execution(self, hook: Hook) -> Hook:
+        """注册在每次执行开始前调用的钩子, 可用作装饰器.
+
+        Args:
+            hook (Hook): 接收 ExecutionContext 的 函数/异步函数.
+
+        Returns:
+            Hook: 原钩子.
+        """
+        self.hooks.add("before", hook)
+        return hook
+
+    def after_execution(self, hook: Hook) -> Hook:
+        """注册在每次执行结束后 (无论成功与否) 调用的钩子, 可用作装饰器.
+
+        Args:
+            hook (Hook): 接收 ExecutionContext 的 函数/异步函数, 此时 duration 与 exception 已被填写.
+
+        Returns:
+            Hook: 原钩子.
+        """
+        self.hooks.add("after", hook)
+        return hook
+
+    def on_execution_error(self, hook: Hook) -> Hook:
+        """注册在执行抛出异常, 超时或被取消时调用的钩子, 先于 after_execution 的钩子调用, 可用作装饰器.
+
+        Args:
+            hook (Hook): 接收 ExecutionContext 的 函数/异步函数.
+
+        Returns:
+            Hook: 原钩子.
+        """
+        self.hooks.add("error", hook)
+        return hook
+
+    def get_task(self, id: str) -> Optional[SchedulerTask]:
+        """按 id 获取计划任务, 不存在时返回 None."""
+        return self.tasks.get(id)
+
+    def remove_task(self, task: Union[str, SchedulerTask]) -> Optional[SchedulerTask]:
+        """停止并移除计划任务.
+
+        Args:
+            task (Union[str, SchedulerTask]): 任务 id 或任务本身.
+
+        Returns:
+            Optional[SchedulerTask]: 被移除的任务, 不存在时返回 None.
+        """
+        id = task if isinstance(task, str) else task.id
+        removed = self.tasks.pop(id, None)
+        if removed is not None:
+            removed.stop_gen_interval()
+            removed.stop()
+            self.store.remove(id)
+            self._live.discard(removed)
+            self._check_idle()
+        return removed
+
+    def get_executor(self, kind: T_ExecutorKind) -> Optional[Executor]:
+        """获取计划器所属的执行器, 线程池与进程池在首次使用时创建.
+
+        Args:
+            kind (Literal["inline", "thread", "process"]): 执行方式.
+
+        Returns:
+            Optional[Executor]: 对应的执行器, "inline" 时为 None.
+        """
+        if kind == "inline":
+            return None
+        if kind not in self.executors:
+            if kind == "thread":
+                self.executors[kind] = ThreadPoolExecutor(
+                    self.max_thread_workers, thread_name_prefix="scheduler"
+                )
+            elif kind == "process":
+                self.executors[kind] = ProcessPoolExecutor(self.max_process_workers)
+            else:
+                raise ValueError(f"unknown executor kind: {kind!r}")
+        return self.executors[kind]
+
+    def shutdown_executors(self, wait: bool = True) -> None:
+        """关闭计划器所属的线程池与进程池.
+
+        Args:
+            wait (bool, optional): 是否等待正在执行的任务完成. 默认为 True.
+        """
+        for executor in self.executors.values():
+            executor.shutdown(wait=wait)
+        self.executors.clear()
+
+    def metrics_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """获取所有计划任务的运行指标.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 以任务 id 为键的指标快照, 内容见 TaskMetrics.snapshot,
+                另有 executing 为正在进行的执行数量.
+        """
+        snapshot = {}
+        for id, task in self.tasks.items():
+            metrics = task.metrics.snapshot()
+            metrics["executing"] = len(task.executions)
+            snapshot[id] = metrics
+        return snapshot
+
+    def export_prometheus(self, prefix: str = "graia_scheduler") -> str:
+        """以 Prometheus 文本格式导出所有计划任务的运行指标.
+
+        Args:
+            prefix (str, optional): 指标名前缀. 默认为 "graia_scheduler".
+
+        Returns:
+            str: Prometheus 文本格式的指标.
+        """
+        return render_prometheus(self.metrics_snapshot(), prefix)
+
+    def _horizon(self, until: Union[datetime, timedelta, None]) -> Optional[datetime]:
+        if isinstance(until, timedelta):
+            return self.clock.now() + until
+        return until
+
+    def upcoming_fires(
+        self,
+        count: Optional[int] = 10,
+        until: Union[datetime, timedelta, None] = None,
+        ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[datetime]]:
+        """预览各任务接下来的计划执行时间.
+
+        时间取自计时器的副本, 不会推进正在运行的任务的计时器; 已停止或已暂停的任务没有计划执行时间.
+        相对于当前时间推算的间隔计时器按每次执行都准时进行推算, 已经开始取值的普通迭代器则只能给出已计划的时间.
+
+        Args:
+            count (Optional[int], optional): 每个任务至多给出的时间数量. 默认为 10, 为 None 时须指定 until.
+            until (Union[datetime, timedelta, None], optional): 预览的截止时间 (含),
+                timedelta 表示相对于当前时间. 默认为 None, 即不限制.
+            ids (Optional[Iterable[str]], optional): 要预览的任务 id. 默认为所有任务.
+
+        Returns:
+            Dict[str, List[datetime]]: 以任务 id 为键的计划执行时间, 按时间升序排列, 不含 spread 与 jitter.
+        """
+        horizon = self._horizon(until)
+        if count is None and horizon is None:
+            raise ValueError("either count or until must be given")
+        now = self.clock.now()
+        tasks = self.schedule_tasks if ids is None else [self.tasks[id] for id in ids]
+        return {task.id: upcoming(task, now, count, horizon) for task in tasks}
+
+    def timeline(
+        self, until: Union[datetime, timedelta], limit: Optional[int] = 1000
+    ) -> List[UpcomingFire]:
+        """将所有任务接下来的计划执行合并为一条按时间排列的时间线, 规则同 upcoming_fires.
+
+        各任务的时间按需逐个生成并以最小堆归并, 开销取决于任务数量与 limit, 而不是时间范围内的执行总数.
+
+        Args:
+            until (Union[datetime, timedelta]): 预览的截止时间 (含), timedelta 表示相对于当前时间.
+            limit (Optional[int], optional): 至多给出的执行数量. 默认为 1000, 为 None 时不限制.
+
+        Returns:
+            List[UpcomingFire]: 计划执行, 按时间升序排列; 同一时间的执行按任务 id 排列.
+        """
+        horizon: datetime = self._horizon(until)  # type: ignore
+        return timeline(self.schedule_tasks, self.clock.now(), horizon, limit)
+
+    async def run(self, forever: bool = False) -> None:
+        """开始所有计划任务, 运行期间加入的任务会立即开始; stop 或 drain 被调用后返回.
+
+        Args:
+            forever (bool, optional): 为 False (默认) 时, 与此前的版本相同, 所有计划任务都已结束
+                (计时器耗尽或被停止) 且没有待执行的一次性任务后, 等待正在进行的执行结束并返回;
+                为 True 时则一直运行直至 stop 被调用, 适用于运行期间还会加入任务的宿主, 如 SchedulerService.
+        """
+        if self.running:
+            raise AlreadyStarted("the scheduler has been started!")
+        self.running = True
+        self._forever = forever
+        self._closing = self.loop.create_future()
+        self._live = set(self.tasks.values())
+        engine_task = None
+        self.oneshots.start()
+        try:
+            if self.shards:
+                for shard in self.shards:
+                    shard.start()
+            else:
+                if self.mode == "heap":
+                    self.engine = HeapEngine(
+                        self.loop, self.wakeup_tolerance, self.batch_concurrency
+                    )
+                    engine_task = self.loop.create_task(self.engine.run())
+                for task in self.schedule_tasks:
+                    self._start(task)
+            self._check_idle()
+            if await self._closing:  # 任务均已结束, 而不是被 stop
+                await self.join()
+        finally:
+            if self.shards:
+                if self._shutdown is None:
+                    self._shutdown = self.loop.create_task(self._shutdown_shards())
+                await self._shutdown
+                self._shutdown = None
+            if engine_task is not None:
+                self.engine.close()  # type: ignore
+                await engine_task
+            self.running = False
+            self.oneshots.close()
+            self.engine = None
+            self._closing = None
+            self._live = set()
+
+    async def _shutdown_shards(self) -> None:
+        await asyncio.gather(*(shard.shutdown() for shard in self.shards))
 
     async def join(self, stop: bool = False) -> None:
-        """等待所有计划任务结束"""
-        await asyncio.gather(*(task.join(stop=stop) for task in self.schedule_tasks))
+        """等待所有计划任务, 以及正在进行的一次性任务结束; 分片模式下 stop 之后还会等待各分片的线程结束"""
+        await asyncio.gather(
+            *(task.join(stop=stop) for task in self._local_tasks()),
+            *(shard.call(shard.join(stop=stop)) for shard in self.shards),
+            self.oneshots.join(),
+        )
+        if self._shutdown is not None:
+            await asyncio.shield(self._shutdown)
+
+    async def drain(self, timeout: Optional[float] = None) -> List[SchedulerTask]:
+        """平滑地停止计划器, 并使 run 返回.
+
+        不再开始新的执行 (包括一次性任务), 但正在等待下一次执行的任务不会被取消, 而是立即退出;
+        正在进行的执行至多等待 timeout 秒, 之后无论任务是否 cancelable, 仍未结束的执行都会被取消.
+
+        Args:
+            timeout (Optional[float], optional): 等待正在进行的执行结束的最长秒数. 默认为 None, 即一直等待.
+
+        Returns:
+            List[SchedulerTask]: 有执行被取消 (即被中断) 的计划任务.
+        """
+        results = await asyncio.gather(
+            drain(self._local_tasks(), timeout),
+            *(shard.call(shard.drain(timeout)) for shard in self.shards),
+            self.oneshots.drain(timeout),
+        )
+        self.stop()
+        return [
+            task for interrupted in results[:-1] if interrupted for task in interrupted
+        ]
 
     def stop(self) -> None:
-        """停止所有计划任务"""
+        """停止所有计划任务, 并使 run 返回"""
         for task in self.schedule_tasks:
             task.stop()
+        self.oneshots.close()
+        if self.engine is not None:
+            self.engine.close()
+        if self._closing is not None and not self._closing.done():
+            self._closing.set_result(False)
+            if self.shards:
+                self._shutdown = self.loop.create_task(self._shutdown_shards())
+        self.store.flush()
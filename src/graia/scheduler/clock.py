@@ -0,0 +1,105 @@
+"""计划器使用的时钟"""
+
+import asyncio
+import selectors
+import time
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+
+
+class Clock:
+    """计划器的时间来源.
+
+    now 给出墙上时钟的时间, 用于计算计划时间; time 给出单调时钟的时间, 与事件循环的 loop.time 一致.
+    """
+
+    def now(self) -> datetime:
+        """当前的墙上时钟时间."""
+        raise NotImplementedError
+
+    def time(self) -> float:
+        """当前的单调时钟时间 (秒)."""
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """系统时钟, 与 asyncio 默认事件循环的 loop.time 相同地使用 time.monotonic."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def time(self) -> float:
+        return time.monotonic()
+
+
+system_clock = SystemClock()
+
+
+class VirtualClock(Clock):
+    """虚拟时钟, 需要与 new_event_loop 创建的事件循环一同使用.
+
+    该事件循环在没有就绪的回调时不会真正等待, 而是将时钟直接推进至下一个定时器的时间,
+    因此跨越数天乃至数月的计划可以在极短的时间内模拟完成. 在线程池/进程池中的执行不会推进虚拟时间.
+    """
+
+    start: datetime
+    offset: float
+
+    def __init__(self, start: Optional[datetime] = None) -> None:
+        """初始化
+
+        Args:
+            start (Optional[datetime], optional): 虚拟时间的起点. 默认为 datetime.now().
+        """
+        self.start = datetime.now() if start is None else start
+        self.offset = 0.0
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=self.offset)
+
+    def time(self) -> float:
+        return self.offset
+
+    def advance(self, seconds: float) -> None:
+        """将虚拟时间向后推进 seconds 秒."""
+        self.offset += seconds
+
+    def new_event_loop(self) -> "VirtualEventLoop":
+        """创建以本时钟为准的事件循环."""
+        return VirtualEventLoop(self)
+
+
+class _VirtualSelector:
+    """包装真实的 selector: 没有就绪的 IO 事件时, 以推进虚拟时间代替阻塞等待."""
+
+    def __init__(self, selector: selectors.BaseSelector, clock: VirtualClock) -> None:
+        self._selector = selector
+        self._clock = clock
+
+    def select(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[selectors.SelectorKey, int]]:
+        events = self._selector.select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:  # 没有任何定时器, 只能等待 IO (如线程池的执行结果)
+            return self._selector.select(None)
+        self._clock.advance(timeout)
+        return []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """以 VirtualClock 为准的事件循环."""
+
+    clock: VirtualClock
+
+    def __init__(self, clock: VirtualClock) -> None:
+        selector = _VirtualSelector(selectors.DefaultSelector(), clock)
+        super().__init__(selector)  # type: ignore
+        self.clock = clock
+
+    def time(self) -> float:
+        return self.clock.time()
@@ -0,0 +1,304 @@
+"""基于位图的 crontab 表达式编译器"""
+
+import calendar
+import itertools
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {
+    name.lower(): index for index, name in enumerate(calendar.month_abbr) if name
+}
+WEEKDAY_NAMES = {"sun": 0, "mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6}
+
+# (最小值, 最大值, 名称表)
+_MINUTE = (0, 59, None)
+_HOUR = (0, 23, None)
+_DAY = (1, 31, None)
+_MONTH = (1, 12, MONTH_NAMES)
+_WEEKDAY = (0, 7, WEEKDAY_NAMES)
+_SECOND = (0, 59, None)
+_ALL_DAYS = ((1 << 32) - 1) & ~1
+_ALL_WEEKDAYS = (1 << 7) - 1
+
+MAX_YEARS_BETWEEN_MATCHES = 50
+
+
+def _parse_value(value: str, names: Optional[Dict[str, int]]) -> int:
+    if names is not None and value in names:
+        return names[value]
+    if not value.isdigit():
+        raise ValueError(f"invalid cron value: {value!r}")
+    return int(value)
+
+
+def _parse_field(field: str, spec: Tuple[int, int, Optional[Dict[str, int]]]) -> int:
+    """将单个字段解析为位图, 第 n 位为 1 表示 n 符合该字段."""
+    low, high, names = spec
+    mask = 0
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            if not step_str.isdigit() or int(step_str) == 0:
+                raise ValueError(f"invalid cron step: {step_str!r}")
+            step = int(step_str)
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = _parse_value(start_str, names), _parse_value(end_str, names)
+        else:
+            start = _parse_value(part, names)
+            end = high if step != 1 else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"cron field out of range: {field!r}")
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+def _next_bit(mask: int, start: int) -> int:
+    """返回 mask 中不小于 start 的最低置位, 不存在时返回 -1."""
+    rest = mask >> start
+    if not rest:
+        return -1
+    return start + (rest & -rest).bit_length() - 1
+
+
+def _bits(mask: int) -> List[int]:
+    """返回 mask 中所有置位的位置, 升序."""
+    return [index for index in range(mask.bit_length()) if mask >> index & 1]
+
+
+class CronPattern:
+    """编译后的 crontab 表达式.
+
+    每个字段被编译为一个整数位图, 求下一次执行时间时逐级查找最低置位, 而非逐秒/逐分枚举.
+    字段顺序与 croniter 一致: 分 时 日 月 周 [秒].
+    """
+
+    expression: str
+    seconds: int
+    minutes: int
+    hours: int
+    days: int
+    months: int
+    weekdays: int
+    last_day: bool
+    has_seconds: bool
+    match_days: bool
+    match_weekdays: bool
+
+    def __init__(self, expression: str) -> None:
+        """编译表达式
+
+        Args:
+            expression (str): crontab 表达式, 支持 5 个字段或带秒的 6 个字段.
+
+        Raises:
+            ValueError: 表达式格式错误或使用了不受支持的语法.
+        """
+        self.expression = expression
+        normalized = expression.lower()
+        fields = ALIASES.get(normalized, normalized).split()
+        if len(fields) not in (5, 6):
+            raise ValueError(
+                f"expected 5 or 6 fields in cron expression: {expression!r}"
+            )
+        minute, hour, day, month, weekday = fields[:5]
+        self.has_seconds = len(fields) == 6
+        self.seconds = _parse_field(fields[5], _SECOND) if self.has_seconds else 1
+        self.minutes = _parse_field(minute, _MINUTE)
+        self.hours = _parse_field(hour, _HOUR)
+        self.months = _parse_field(month, _MONTH)
+        self.last_day = False
+        day_parts = day.split(",")
+        if "l" in day_parts:
+            self.last_day = True
+            day_parts.remove("l")
+        self.days = _parse_field(",".join(day_parts), _DAY) if day_parts else 0
+        weekdays = _parse_field(weekday, _WEEKDAY)
+        if weekdays & 1 << 7:
+            weekdays = (weekdays | 1) & ~(1 << 7)
+        self.weekdays = weekdays
+        # 与 croniter 相同: 取遍整个范围的字段 (如 *, ?, */1, 1-31) 不受限;
+        # 日与周同时受限时, 满足其一即可
+        day_restricted = self.last_day or self.days != _ALL_DAYS
+        weekday_restricted = weekdays != _ALL_WEEKDAYS
+        self.match_days = day_restricted or not weekday_restricted
+        self.match_weekdays = weekday_restricted
+        self._day_masks: Dict[Tuple[int, int], int] = {}
+        self._bits: Optional[Tuple[List[int], List[int], List[int]]] = None
+
+    def __repr__(self) -> str:
+        return f"CronPattern({self.expression!r})"
+
+    def day_mask(self, year: int, month: int) -> int:
+        """返回某月中符合 日/周 字段的日期位图."""
+        first_weekday, days_in_month = calendar.monthrange(year, month)
+        first_weekday = (first_weekday + 1) % 7  # cron 中 0 为周日
+        key = (first_weekday, days_in_month)
+        mask = self._day_masks.get(key)
+        if mask is None:
+            mask = 0
+            if self.match_days:
+                mask |= self.days & ((1 << days_in_month + 1) - 1)
+                if self.last_day:
+                    mask |= 1 << days_in_month
+            if self.match_weekdays:
+                for day in range(1, days_in_month + 1):
+                    if self.weekdays >> (first_weekday + day - 1) % 7 & 1:
+                        mask |= 1 << day
+            self._day_masks[key] = mask
+        return mask
+
+    def next(self, base: datetime) -> datetime:
+        """求严格晚于 base 的下一次执行时间.
+
+        Args:
+            base (datetime): 起始时间, 其 tzinfo 会被保留.
+
+        Raises:
+            ValueError: 表达式在可接受的年限内没有任何匹配 (如 2 月 30 日).
+
+        Returns:
+            datetime: 下一次执行时间.
+        """
+        # 以整数逐级查找; 某一级超出范围 (如第 60 分钟, 第 32 日) 时查找失败, 自然进位到上一级
+        year, month, day, hour, minute = (
+            base.year,
+            base.month,
+            base.day,
+            base.hour,
+            base.minute,
+        )
+        if self.has_seconds:
+            second = base.second + 1
+        else:
+            minute, second = minute + 1, 0
+        limit = year + MAX_YEARS_BETWEEN_MATCHES
+        while year <= limit:
+            found = _next_bit(self.months, month)
+            if found < 0:
+                year, month, day, hour, minute, second = year + 1, 1, 1, 0, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 1, 0, 0, 0
+            found = _next_bit(self.day_mask(year, month), day)
+            if found < 0:
+                month, day, hour, minute, second = month + 1, 1, 0, 0, 0
+                continue
+            if found != day:
+                day, hour, minute, second = found, 0, 0, 0
+            found = _next_bit(self.hours, hour)
+            if found < 0:
+                day, hour, minute, second = day + 1, 0, 0, 0
+                continue
+            if found != hour:
+                hour, minute, second = found, 0, 0
+            found = _next_bit(self.minutes, minute)
+            if found < 0:
+                hour, minute, second = hour + 1, 0, 0
+                continue
+            if found != minute:
+                minute, second = found, 0
+            found = _next_bit(self.seconds, second)
+            if found < 0:
+                minute, second = minute + 1, 0
+                continue
+            return datetime(year, month, day, hour, minute, found, tzinfo=base.tzinfo)
+        raise ValueError(
+            f"no match for cron expression {self.expression!r} after {base}"
+        )
+
+    def next_n(self, base: datetime, n: int) -> List[datetime]:
+        """批量求 base 之后的 n 个执行时间.
+
+        Args:
+            base (datetime): 起始时间.
+            n (int): 数量.
+
+        Returns:
+            List[datetime]: 按时间顺序排列的执行时间.
+        """
+        return list(itertools.islice(self.iterate(base), n))
+
+    def iterate(self, base: datetime) -> Iterator[datetime]:
+        """按顺序生成严格晚于 base 的所有执行时间, 结果与反复调用 next 相同.
+
+        同一天内的时间直接按 时/分/秒 的位图枚举, 只在跨日时调用 next 查找, 适合批量求值.
+
+        Args:
+            base (datetime): 起始时间, 其 tzinfo 会被保留.
+
+        Returns:
+            Iterator[datetime]: 无限的执行时间序列.
+        """
+        tzinfo = base.tzinfo
+        if self._bits is None:
+            self._bits = (_bits(self.hours), _bits(self.minutes), _bits(self.seconds))
+        hours, minutes, seconds = self._bits
+        current = self.next(base)
+        while True:
+            year, month, day = current.year, current.month, current.day
+            days = self.day_mask(year, month)
+            hour_from, minute_from, second_from = (
+                current.hour,
+                current.minute,
+                current.second,
+            )
+            while day > 0:
+                for hour in hours[bisect_left(hours, hour_from) :]:
+                    for minute in minutes[bisect_left(minutes, minute_from) :]:
+                        for second in seconds[bisect_left(seconds, second_from) :]:
+                            yield datetime(
+                                year, month, day, hour, minute, second, tzinfo=tzinfo
+                            )
+                        second_from = 0
+                    minute_from = 0
+                hour_from = 0
+                day = _next_bit(days, day + 1)
+            # 本月已无匹配的日期, 由 next 查找之后的月份
+            current = self.next(
+                datetime(
+                    year,
+                    month,
+                    calendar.monthrange(year, month)[1],
+                    23,
+                    59,
+                    59,
+                    tzinfo=tzinfo,
+                )
+            )
+
+
+@lru_cache(maxsize=None)
+def _compile(expression: str) -> CronPattern:
+    return CronPattern(expression)
+
+
+def compile_cron(expression: str) -> CronPattern:
+    """编译 crontab 表达式, 相同的表达式共享同一个编译结果.
+
+    Args:
+        expression (str): crontab 表达式.
+
+    Raises:
+        ValueError: 表达式格式错误或使用了不受支持的语法 (如 `#`, `W`).
+
+    Returns:
+        CronPattern: 编译后的表达式.
+    """
+    return _compile(" ".join(expression.lower().split()))
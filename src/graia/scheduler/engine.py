@@ -0,0 +1,183 @@
+"""单协程调度引擎"""
+
+import asyncio
+import heapq
+import itertools
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .task import SchedulerTask
+
+
+class HeapEngine:
+    """以最小堆维护所有 SchedulerTask 的下一次执行时间的调度引擎.
+
+    与默认的 "每个任务一个 asyncio.Task" 不同, 本引擎只使用一个调度协程,
+    该协程仅休眠至堆顶 (最早) 的截止时间, 到期后再按需为任务创建执行用的 asyncio.Task.
+
+    截止时间会被向上取整到 tolerance 的整数倍, 因此在同一时间窗口内到期的任务共享一次唤醒,
+    并作为一批被派发; 同一批任务的并发执行数量受 batch_concurrency 限制.
+
+    堆中的条目在任务被暂停, 重新计划或停止时只做标记而不立即移除, 出堆时再丢弃.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    tolerance: float
+    batch_concurrency: Optional[int]
+    queue: List[List[Any]]
+    tasks: Set["SchedulerTask"]
+    entries: Dict["SchedulerTask", List[Any]]
+    closed: bool
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        tolerance: float = 0.0,
+        batch_concurrency: Optional[int] = None,
+    ) -> None:
+        """初始化
+
+        Args:
+            loop (AbstractEventLoop): 事件循环
+            tolerance (float, optional): 合并唤醒的时间窗口, 单位为秒. 任务至多因此推迟该时长, 但不会提前. 默认为 0.
+            batch_concurrency (Optional[int], optional): 同一批任务的最大并发执行数量. 默认为 None, 即不限制.
+        """
+        self.loop = loop
+        self.tolerance = tolerance
+        self.batch_concurrency = batch_concurrency
+        self.queue = []
+        self.tasks = set()
+        self.entries = {}
+        self.closed = False
+        self._counter = itertools.count()
+        self._waiter: Optional[asyncio.Future] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def register(self, task: "SchedulerTask") -> None:
+        """将 SchedulerTask 交由本引擎调度.
+
+        Args:
+            task (SchedulerTask): 要调度的任务.
+        """
+        task.attach(self)
+        self.tasks.add(task)
+        task.run_record.entered = True
+        self.release(task)
+
+    def push(self, task: "SchedulerTask") -> None:
+        """从任务的计时器中取出下一次执行时间并放入堆中, 计时器耗尽时结束该任务."""
+        interval = task.next_sleep_interval()
+        if interval is None:
+            self.discard(task)
+            return
+        task.sleep_record.entered = True
+        deadline = self.loop.time() + interval
+        if self.tolerance > 0:
+            deadline = math.ceil(deadline / self.tolerance) * self.tolerance
+        entry = [deadline, next(self._counter), task]
+        self.entries[task] = entry
+        heapq.heappush(self.queue, entry)
+        if self.queue[0] is entry and (
+            self._timer is None or deadline < self._timer.when()
+        ):
+            self.wakeup()
+
+    def unqueue(self, task: "SchedulerTask") -> None:
+        """将任务在堆中的条目标记为失效, 任务仍由本引擎管理."""
+        entry = self.entries.pop(task, None)
+        if entry is not None:
+            entry[2] = None
+        task.sleep_record.entered = False
+
+    def requeue(self, task: "SchedulerTask") -> None:
+        """任务的计时器被替换后调用, 丢弃原先的计划时间并重新入堆."""
+        self.unqueue(task)
+        self.release(task)
+
+    def discard(self, task: "SchedulerTask", cancel: bool = True) -> None:
+        """停止调度某个任务.
+
+        Args:
+            task (SchedulerTask): 任务.
+            cancel (bool, optional): 是否一并取消可取消的任务正在进行的执行. 默认为 True.
+        """
+        if task not in self.tasks:
+            return
+        self.tasks.discard(task)
+        self.unqueue(task)
+        task.run_record.entered = False
+        if cancel and task.cancelable:
+            task.cancel_executions()
+        if task.task is not None and not task.task.done():
+            task.task.set_result(None)
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        """唤醒调度协程, 使其重新计算需要休眠的时间."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self.wakeup()
+
+    def _arm(self) -> None:
+        """确保恰好有一个定时器在堆顶的截止时间唤醒调度协程."""
+        if not self.queue:
+            return
+        when = self.queue[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = self.loop.call_at(when, self._on_timer)
+
+    def dispatch(self, batch: List["SchedulerTask"]) -> None:
+        """派发同一次唤醒中到期的所有任务."""
+        semaphore = None
+        if self.batch_concurrency is not None and len(batch) > self.batch_concurrency:
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+        for task in batch:
+            task.sleep_record.entered = False
+            execution = task.spawn(semaphore)
+            execution.add_done_callback(lambda _, task=task: self.release(task))
+            self.release(task)
+
+    def release(self, task: "SchedulerTask") -> None:
+        """若任务未在堆中 (同时执行的数量曾达到上限, 或刚被恢复/重新计划), 且可以开始新的执行, 则重新放入."""
+        if (
+            task in self.tasks
+            and task not in self.entries
+            and not task.paused
+            and len(task.executions) < task.max_instances
+        ):
+            self.push(task)
+
+    def close(self) -> None:
+        """使调度协程退出."""
+        self.closed = True
+        self.wakeup()
+
+    async def run(self) -> None:
+        """运行调度协程, 直至 close 被调用; 运行期间可随时注册新的任务."""
+        queue = self.queue
+        while not self.closed:
+            now = self.loop.time()
+            batch = []
+            while queue and queue[0][0] <= now:
+                task = heapq.heappop(queue)[2]
+                if task is not None:
+                    del self.entries[task]
+                    batch.append(task)
+            if batch:
+                self.dispatch(batch)
+            self._arm()
+            self._waiter = self.loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,76 @@
+"""计划器通过 Broadcast 广播的事件"""
+
+from typing import TYPE_CHECKING
+
+from graia.broadcast.entities.dispatcher import BaseDispatcher
+from graia.broadcast.entities.event import Dispatchable
+
+if TYPE_CHECKING:
+    from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+    from .hooks import ExecutionContext
+    from .task import SchedulerTask
+
+
+class SchedulerTaskTimeout(Dispatchable):
+    """计划任务的某次执行超出了 timeout.
+
+    若任务可取消 (cancelable), 该次执行已被取消; 否则该次执行被放弃, 会在后台继续运行, 但不再占用执行名额.
+    """
+
+    task: "SchedulerTask"
+    timeout: float
+    cancelled: bool
+
+    def __init__(self, task: "SchedulerTask", timeout: float, cancelled: bool) -> None:
+        self.task = task
+        self.timeout = timeout
+        self.cancelled = cancelled
+
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: "DispatcherInterface[SchedulerTaskTimeout]"):
+            from .task import SchedulerTask
+
+            if interface.annotation is SchedulerTask:
+                return interface.event.task
+
+
+class SchedulerTaskStarted(Dispatchable):
+    """计划任务的某次执行即将开始. 仅在计划器开启了 lifecycle_events 时广播."""
+
+    context: "ExecutionContext"
+
+    def __init__(self, context: "ExecutionContext") -> None:
+        self.context = context
+
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: "DispatcherInterface[SchedulerTaskStarted]"):
+            from .hooks import ExecutionContext
+            from .task import SchedulerTask
+
+            if interface.annotation is SchedulerTask:
+                return interface.event.context.task
+            if interface.annotation is ExecutionContext:
+                return interface.event.context
+
+
+class SchedulerTaskFinished(Dispatchable):
+    """计划任务的某次执行已经结束, 无论成功与否. 仅在计划器开启了 lifecycle_events 时广播."""
+
+    context: "ExecutionContext"
+
+    def __init__(self, context: "ExecutionContext") -> None:
+        self.context = context
+
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: "DispatcherInterface[SchedulerTaskFinished]"):
+            from .hooks import ExecutionContext
+            from .task import SchedulerTask
+
+            if interface.annotation is SchedulerTask:
+                return interface.event.context.task
+            if interface.annotation is ExecutionContext:
+                return interface.event.context
@@ -0,0 +1,140 @@
+"""计划任务执行前后的钩子"""
+
+import inspect
+import traceback
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional
+
+from graia.broadcast import Broadcast
+
+from .event import SchedulerTaskFinished, SchedulerTaskStarted
+
+if TYPE_CHECKING:
+    from .task import SchedulerTask
+
+HookStage = Literal["before", "after", "error"]
+
+
+class ExecutionContext:
+    """一次计划执行的信息, 在同一次执行的各个钩子之间共享."""
+
+    task: "SchedulerTask"
+    planned: Optional[datetime]
+    """计划时间, 已叠加计时器的 spread 与 jitter."""
+    started: datetime
+    """实际开始执行的时间."""
+    duration: Optional[float]
+    """执行耗时 (秒), 执行结束前为 None."""
+    exception: Optional[BaseException]
+    """执行中抛出的异常; 超时为 asyncio.TimeoutError, 被取消为 asyncio.CancelledError."""
+    extra: Dict[str, Any]
+    """供钩子之间传递数据 (如追踪的 span)."""
+
+    def __init__(
+        self, task: "SchedulerTask", planned: Optional[datetime], started: datetime
+    ) -> None:
+        self.task = task
+        self.planned = planned
+        self.started = started
+        self.duration = None
+        self.exception = None
+        self.extra = {}
+
+    @property
+    def id(self) -> str:
+        """任务 id."""
+        return self.task.id
+
+    def __repr__(self) -> str:
+        return (
+            f"<ExecutionContext id={self.id!r} "
+            f"planned={self.planned} started={self.started}>"
+        )
+
+
+Hook = Callable[[ExecutionContext], Any]
+
+
+class ExecutionHooks:
+    """计划器范围的执行钩子.
+
+    钩子可以是普通函数或异步函数, 接收 ExecutionContext; 钩子抛出的异常会被打印, 但不会影响执行本身.
+    未注册任何钩子且未开启事件广播时 active 为 False, 执行路径上不会创建 ExecutionContext.
+    """
+
+    before: List[Hook]
+    after: List[Hook]
+    error: List[Hook]
+    broadcast: Optional[Broadcast]
+    active: bool
+
+    def __init__(self, broadcast: Optional[Broadcast] = None) -> None:
+        """初始化
+
+        Args:
+            broadcast (Optional[Broadcast], optional): 若提供, 每次执行开始与结束时会在其上广播
+                SchedulerTaskStarted 与 SchedulerTaskFinished 事件. 默认为 None.
+        """
+        self.before = []
+        self.after = []
+        self.error = []
+        self.broadcast = broadcast
+        self._forks: List[ExecutionHooks] = []
+        self._update()
+
+    def _update(self) -> None:
+        self.active = bool(self.before or self.after or self.error or self.broadcast)
+        for fork in self._forks:
+            fork._update()
+
+    def fork(self, broadcast: Broadcast) -> "ExecutionHooks":
+        """创建与本对象共享同一组钩子的副本, 供分片使用.
+
+        Args:
+            broadcast (Broadcast): 副本广播 SchedulerTaskStarted 与 SchedulerTaskFinished
+                事件所用的事件总线, 仅在本对象开启了事件广播时使用.
+
+        Returns:
+            ExecutionHooks: 副本; 之后在本对象上注册或移除的钩子同样对副本生效.
+        """
+        fork = ExecutionHooks(broadcast if self.broadcast is not None else None)
+        fork.before, fork.after, fork.error = self.before, self.after, self.error
+        self._forks.append(fork)
+        fork._update()
+        return fork
+
+    def add(self, stage: HookStage, hook: Hook) -> None:
+        """注册钩子.
+
+        Args:
+            stage (Literal["before", "after", "error"]): 执行开始前, 执行结束后 (无论成功与否), 或执行失败时.
+            hook (Hook): 钩子.
+        """
+        getattr(self, stage).append(hook)
+        self._update()
+
+    def remove(self, stage: HookStage, hook: Hook) -> None:
+        """移除已注册的钩子."""
+        getattr(self, stage).remove(hook)
+        self._update()
+
+    async def _call(self, hooks: List[Hook], context: ExecutionContext) -> None:
+        for hook in hooks:
+            try:
+                result = hook(context)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                traceback.print_exc()
+
+    async def on_before(self, context: ExecutionContext) -> None:
+        if self.broadcast is not None:
+            self.broadcast.postEvent(SchedulerTaskStarted(context))
+        await self._call(self.before, context)
+
+    async def on_after(self, context: ExecutionContext) -> None:
+        if context.exception is not None:
+            await self._call(self.error, context)
+        await self._call(self.after, context)
+        if self.broadcast is not None:
+            self.broadcast.postEvent(SchedulerTaskFinished(context))
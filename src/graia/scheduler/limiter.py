@@ -0,0 +1,98 @@
+"""计划器范围的执行并发限制"""
+
+import asyncio
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+
+class ExecutionLimiter:
+    """按优先级排队的执行并发限制器.
+
+    同时限制全局与每个分组的并发执行数量; 排队中的执行按优先级 (越大越先) 与到达顺序获得执行机会,
+    分组已满的执行不会阻塞其他分组.
+    """
+
+    limit: Optional[int]
+    group_limits: Dict[str, int]
+    active: int
+    group_active: Dict[str, int]
+
+    def __init__(
+        self, limit: Optional[int] = None, group_limits: Optional[Dict[str, int]] = None
+    ) -> None:
+        """初始化
+
+        Args:
+            limit (Optional[int], optional): 全局最大并发执行数量. 默认为 None, 即不限制.
+            group_limits (Optional[Dict[str, int]], optional): 各分组的最大并发执行数量. 默认为空.
+        """
+        self.limit = limit
+        self.group_limits = group_limits or {}
+        self.active = 0
+        self.group_active = {}
+        self._waiters: List[Tuple[int, int, Optional[str], asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def pending(self) -> int:
+        """排队中的执行数量."""
+        return sum(not future.done() for *_, future in self._waiters)
+
+    def _available(self, group: Optional[str]) -> bool:
+        if self.limit is not None and self.active >= self.limit:
+            return False
+        if group is None or group not in self.group_limits:
+            return True
+        return self.group_active.get(group, 0) < self.group_limits[group]
+
+    def _take(self, group: Optional[str]) -> None:
+        self.active += 1
+        if group is not None:
+            self.group_active[group] = self.group_active.get(group, 0) + 1
+
+    def _wake(self) -> None:
+        blocked = []
+        while self._waiters and (self.limit is None or self.active < self.limit):
+            entry = heapq.heappop(self._waiters)
+            future, group = entry[3], entry[2]
+            if future.done():  # 已被取消
+                continue
+            if self._available(group):
+                self._take(group)
+                future.set_result(None)
+            else:
+                blocked.append(entry)
+        for entry in blocked:
+            heapq.heappush(self._waiters, entry)
+
+    async def acquire(self, priority: int = 0, group: Optional[str] = None) -> None:
+        """等待直至获得一个执行名额.
+
+        Args:
+            priority (int, optional): 优先级, 越大越先获得名额. 默认为 0.
+            group (Optional[str], optional): 所属分组. 默认为 None.
+        """
+        if not self._waiters and self._available(group):
+            self._take(group)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), group, future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():  # 已获得名额后才被取消
+                self.release(group)
+            raise
+
+    def release(self, group: Optional[str] = None) -> None:
+        """归还一个执行名额.
+
+        Args:
+            group (Optional[str], optional): 所属分组, 须与 acquire 时相同. 默认为 None.
+        """
+        self.active -= 1
+        if group is not None:
+            self.group_active[group] -= 1
+        self._wake()
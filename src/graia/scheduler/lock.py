@@ -0,0 +1,95 @@
+"""跨进程的执行互斥"""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+
+class LockBackend:
+    """为每一次计划执行 (任务 id 与计划时间) 发放租约的后端.
+
+    同一个 key 的租约在到期前只能被一个进程获得. 租约在执行结束后不会被主动释放,
+    以免时钟略有偏差的其他进程稍后再次执行同一次计划, 因此 lease_time 应大于各进程之间的时钟偏差.
+    """
+
+    owner: str
+    lease_time: float
+
+    def __init__(self, lease_time: float = 60.0) -> None:
+        """初始化
+
+        Args:
+            lease_time (float, optional): 租约的有效时长 (秒). 默认为 60.
+        """
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_time = lease_time
+
+    async def acquire(self, key: str) -> bool:
+        """尝试获取 key 的租约.
+
+        Args:
+            key (str): 租约的键.
+
+        Returns:
+            bool: 是否获得了租约; 为 False 时说明其他进程已经获得.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """释放后端占用的资源."""
+
+
+class SQLiteLockBackend(LockBackend):
+    """基于 SQLite 的 LockBackend, 适用于同一主机上的多个进程.
+
+    租约以 key 为主键保存, 由 SQLite 的文件锁保证插入的原子性; 数据库操作在线程池中进行, 不会阻塞事件循环,
+    同一进程内对连接的使用由一把线程锁串行化.
+    """
+
+    connection: sqlite3.Connection
+    table: str
+
+    def __init__(
+        self, path: str, lease_time: float = 60.0, table: str = "graia_scheduler_leases"
+    ) -> None:
+        """初始化
+
+        Args:
+            path (str): 数据库文件路径, 所有进程须使用同一个文件.
+            lease_time (float, optional): 租约的有效时长 (秒). 默认为 60.
+            table (str, optional): 表名. 默认为 "graia_scheduler_leases".
+        """
+        super().__init__(lease_time)
+        self.connection = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self.table = table
+        self._mutex = threading.Lock()
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, owner TEXT, expires_at REAL)"
+            )
+
+    def _acquire(self, key: str) -> bool:
+        now = time.time()
+        with self._mutex, self.connection:
+            self.connection.execute(
+                f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,)
+            )
+            cursor = self.connection.execute(
+                f"INSERT OR IGNORE INTO {self.table} VALUES (?, ?, ?)",
+                (key, self.owner, now + self.lease_time),
+            )
+        return cursor.rowcount == 1
+
+    async def acquire(self, key: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._acquire, key
+        )
+
+    def close(self) -> None:
+        with self._mutex:
+            self.connection.close()
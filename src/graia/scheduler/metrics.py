@@ -0,0 +1,178 @@
+"""计划任务的运行指标"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+DURATION_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0, 300.0)
+
+
+class Histogram:
+    """固定分桶的直方图, 记录一次观测只需一次二分查找.
+
+    各分桶的计数在首次观测时才分配, 从未执行过的任务不为此占用内存.
+    """
+
+    __slots__ = ("bounds", "_counts", "sum", "count")
+
+    bounds: Sequence[float]
+    sum: float
+    count: int
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """初始化
+
+        Args:
+            bounds (Sequence[float]): 升序排列的各分桶上界, 超出最后一个上界的观测计入额外的 +Inf 分桶.
+        """
+        self.bounds = bounds
+        self._counts: Optional[List[int]] = None
+        self.sum = 0.0
+        self.count = 0
+
+    @property
+    def counts(self) -> List[int]:
+        """各分桶 (含 +Inf) 的计数."""
+        if self._counts is None:
+            return [0] * (len(self.bounds) + 1)
+        return self._counts
+
+    def observe(self, value: float) -> None:
+        counts = self._counts
+        if counts is None:
+            counts = self._counts = [0] * (len(self.bounds) + 1)
+        counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class TaskMetrics:
+    """单个计划任务的计数器与直方图."""
+
+    __slots__ = (
+        "fires",
+        "failures",
+        "timeouts",
+        "misfires",
+        "skipped",
+        "retries",
+        "lateness",
+        "duration",
+    )
+
+    fires: int
+    """开始的执行次数."""
+    failures: int
+    """抛出异常的执行次数."""
+    timeouts: int
+    """超时的执行次数."""
+    misfires: int
+    """因晚于 misfire_grace_time 而跳过的计划执行数, 一次快进跳过多个时间时逐个计入."""
+    skipped: int
+    """因其他进程持有租约而跳过的次数."""
+    retries: int
+    """按重试策略安排的重试次数."""
+    lateness: Histogram
+    """实际开始执行的时间相对计划时间的延迟 (秒)."""
+    duration: Histogram
+    """执行耗时 (秒)."""
+
+    def __init__(self) -> None:
+        self.fires = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.misfires = 0
+        self.skipped = 0
+        self.retries = 0
+        self.lateness = Histogram(LATENCY_BUCKETS)
+        self.duration = Histogram(DURATION_BUCKETS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """以普通字典的形式返回当前的所有指标."""
+        return {
+            "fires": self.fires,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "misfires": self.misfires,
+            "skipped": self.skipped,
+            "retries": self.retries,
+            "lateness": self.lateness.snapshot(),
+            "duration": self.duration.snapshot(),
+        }
+
+
+_COUNTERS = {
+    "fires": "Executions started.",
+    "failures": "Executions that raised an exception.",
+    "timeouts": "Executions that exceeded their timeout.",
+    "misfires": (
+        "Scheduled occurrences skipped for being later than misfire_grace_time, "
+        "counted once per skipped occurrence."
+    ),
+    "skipped": "Occurrences skipped because another process held the lease.",
+    "retries": "Retries scheduled after a failed execution.",
+}
+_HISTOGRAMS = {
+    "lateness": (
+        "lateness_seconds",
+        "Delay between the scheduled and the actual start of an execution.",
+    ),
+    "duration": ("duration_seconds", "Execution duration."),
+}
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(
+    snapshot: Dict[str, Dict[str, Any]], prefix: str = "graia_scheduler"
+) -> str:
+    """将 GraiaScheduler.metrics_snapshot 的结果转换为 Prometheus 文本格式.
+
+    Args:
+        snapshot (Dict[str, Dict[str, Any]]): 以任务 id 为键的指标快照.
+        prefix (str, optional): 指标名前缀. 默认为 "graia_scheduler".
+
+    Returns:
+        str: Prometheus 文本格式 (0.0.4) 的指标.
+    """
+    lines = []
+    for key, help_text in _COUNTERS.items():
+        name = f"{prefix}_{key}_total"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for id, metrics in snapshot.items():
+            lines.append(f'{name}{{task="{_label(id)}"}} {metrics[key]}')
+    name = f"{prefix}_executing"
+    lines.append(f"# HELP {name} Executions currently in progress.")
+    lines.append(f"# TYPE {name} gauge")
+    for id, metrics in snapshot.items():
+        lines.append(f'{name}{{task="{_label(id)}"}} {metrics["executing"]}')
+    for key, (suffix, help_text) in _HISTOGRAMS.items():
+        name = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for id, metrics in snapshot.items():
+            label = _label(id)
+            histogram = metrics[key]
+            cumulative = 0
+            for bound, count in zip(histogram["bounds"], histogram["counts"]):
+                cumulative += count
+                lines.append(
+                    f'{name}_bucket{{task="{label}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'{name}_bucket{{task="{label}",le="+Inf"}} {histogram["count"]}'
+            )
+            lines.append(f'{name}_sum{{task="{label}"}} {histogram["sum"]}')
+            lines.append(f'{name}_count{{task="{label}"}} {histogram["count"]}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,241 @@
+"""大量一次性延时任务的调度"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from graia.broadcast import Broadcast
+from graia.broadcast.builtin.event import ExceptionThrown
+
+from .clock import Clock
+
+_PENDING = 0
+_CANCELLED = 1
+_STARTED = 2
+
+
+class OneShotJob:
+    """由 schedule_at 或 schedule_after 计划的一次性任务, 同时作为取消它的凭据.
+
+    为了容纳数十万乃至上百万个待执行的任务, 本类只保存最少的状态;
+    取消时仅做标记, 堆中的条目在出堆或堆被压缩时才被丢弃.
+    """
+
+    __slots__ = ("deadline", "target", "args", "kwargs", "state", "_queue")
+
+    deadline: float
+    """执行时间, 以事件循环的时间 (loop.time) 表示."""
+    target: Optional[Callable[..., Any]]
+    args: Optional[Tuple[Any, ...]]
+    kwargs: Optional[Dict[str, Any]]
+    state: int
+
+    def __init__(
+        self,
+        queue: "OneShotQueue",
+        deadline: float,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Optional[Dict[str, Any]],
+    ) -> None:
+        self._queue = queue
+        self.deadline = deadline
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.state = _PENDING
+
+    @property
+    def pending(self) -> bool:
+        """是否仍在等待执行."""
+        return self.state == _PENDING
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已被取消."""
+        return self.state == _CANCELLED
+
+    @property
+    def when(self) -> datetime:
+        """以计划器时钟表示的执行时间."""
+        return self._queue.clock.now() + timedelta(
+            seconds=self.deadline - self._queue.loop.time()
+        )
+
+    def cancel(self) -> bool:
+        """取消本任务.
+
+        Returns:
+            bool: 是否成功取消; 已经开始执行或已被取消的任务返回 False.
+        """
+        if self.state != _PENDING:
+            return False
+        self.state = _CANCELLED
+        self.target = self.args = self.kwargs = None
+        self._queue._discard()
+        return True
+
+    def __repr__(self) -> str:
+        state = ("pending", "cancelled", "started")[self.state]
+        return f"<OneShotJob {state} deadline={self.deadline:.3f}>"
+
+
+class OneShotQueue:
+    """以最小堆保存所有一次性任务, 并只在堆顶的执行时间唤醒一次.
+
+    加入任务为 O(log n), 取消为 O(1): 取消只做标记, 被取消的条目超过堆的一半时整体压缩一次, 均摊仍为 O(1).
+    同步函数直接在事件循环的回调中执行, 异步函数则为其创建 asyncio.Task.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    broadcast: Broadcast
+    clock: Clock
+    queue: List[Tuple[float, int, OneShotJob]]
+    executions: Set[asyncio.Task]
+    running: bool
+    on_empty: Optional[Callable[[], None]]
+    """待执行的任务全部执行或被取消时调用."""
+
+    compact_threshold = 1024
+    """被取消的条目至少达到该数量时才考虑压缩堆."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, broadcast: Broadcast, clock: Clock
+    ) -> None:
+        """初始化
+
+        Args:
+            loop (AbstractEventLoop): 事件循环
+            broadcast (Broadcast): 事件总线, 用于广播执行中抛出的异常.
+            clock (Clock): 计划器的时钟, 用于将 datetime 换算为事件循环的时间.
+        """
+        self.loop = loop
+        self.broadcast = broadcast
+        self.clock = clock
+        self.queue = []
+        self.executions = set()
+        self.running = False
+        self.on_empty = None
+        self._cancelled = 0
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """尚未执行且未被取消的任务数量."""
+        return len(self.queue) - self._cancelled
+
+    def at(
+        self,
+        when: datetime,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> OneShotJob:
+        """计划在 when 执行 target(*args, **kwargs)."""
+        return self.after(
+            (when - self.clock.now()).total_seconds(), target, args, kwargs
+        )
+
+    def after(
+        self,
+        delay: float,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> OneShotJob:
+        """计划在 delay 秒后执行 target(*args, **kwargs)."""
+        deadline = self.loop.time() + delay
+        job = OneShotJob(self, deadline, target, args, kwargs or None)
+        heapq.heappush(self.queue, (deadline, next(self._counter), job))
+        if self.running and (self._timer is None or deadline < self._timer.when()):
+            self._arm()
+        return job
+
+    def _discard(self) -> None:
+        self._cancelled += 1
+        if self._cancelled >= self.compact_threshold and self._cancelled * 2 > len(
+            self.queue
+        ):
+            self.queue = [entry for entry in self.queue if entry[2].state == _PENDING]
+            heapq.heapify(self.queue)
+            self._cancelled = 0
+        self._notify()
+
+    def _notify(self) -> None:
+        if self.on_empty is not None and not len(self):
+            self.on_empty()
+
+    def _arm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.queue:
+            self._timer = self.loop.call_at(self.queue[0][0], self._fire)
+
+    def _fire(self) -> None:
+        self._timer = None
+        queue = self.queue
+        now = self.loop.time()
+        while queue and queue[0][0] <= now:
+            job = heapq.heappop(queue)[2]
+            if job.state == _PENDING:
+                self._run(job)
+            else:
+                self._cancelled -= 1
+        if self.running:
+            self._arm()
+        self._notify()
+
+    def _run(self, job: OneShotJob) -> None:
+        job.state = _STARTED
+        target, args, kwargs = job.target, job.args, job.kwargs
+        job.target = job.args = job.kwargs = None
+        try:
+            result = target(*args, **(kwargs or {}))  # type: ignore
+        except Exception as e:
+            self._report(e)
+            return
+        if inspect.isawaitable(result):
+            execution = self.loop.create_task(self._wait(result))
+            self.executions.add(execution)
+            execution.add_done_callback(self.executions.discard)
+
+    async def _wait(self, result: Awaitable[Any]) -> None:
+        try:
+            await result
+        except Exception as e:
+            self._report(e)
+
+    def _report(self, exception: Exception) -> None:
+        traceback.print_exception(type(exception), exception, exception.__traceback__)
+        self.broadcast.postEvent(ExceptionThrown(exception, None))
+
+    def start(self) -> None:
+        """开始按时执行任务, 启动前已经到期的任务会立即执行."""
+        self.running = True
+        self._arm()
+
+    def close(self) -> None:
+        """停止执行任务; 尚未执行的任务会被保留, 再次 start 后继续."""
+        self.running = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """停止执行任务, 等待正在进行的异步执行至多 timeout 秒, 然后取消仍未结束的执行."""
+        self.close()
+        if not self.executions:
+            return
+        _, pending = await asyncio.wait(self.executions, timeout=timeout)
+        for execution in pending:
+            execution.cancel()
+
+    async def join(self) -> None:
+        """等待正在进行的异步执行结束."""
+        if self.executions:
+            await asyncio.wait(self.executions)
@@ -0,0 +1,110 @@
+"""预览计划任务之后的执行时间, 不改变任务与其计时器的状态"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .timers import SeekableTimer
+
+if TYPE_CHECKING:
+    from .task import SchedulerTask
+
+
+class UpcomingFire(NamedTuple):
+    """合并后的时间线中的一次计划执行."""
+
+    time: datetime
+    """计划时间, 与 SchedulerTask.next_fire_time 相同, 不含 spread 与 jitter."""
+    id: str
+    """任务 id."""
+
+
+def _timer_times(
+    task: "SchedulerTask", start: datetime
+) -> Optional[Iterator[datetime]]:
+    """任务的计时器之后给出的不早于 start 的时间; 已经开始取值的普通迭代器无法复制, 返回 None."""
+    timer = task.timer if task._timer_iter is None else task._timer_iter
+    if isinstance(timer, SeekableTimer):
+        return timer.preview(
+            start, task._pending if task._pending is not None else task.next_fire_time
+        )
+    if task._timer_iter is None:
+        iterator = iter(timer)
+        if iterator is not timer:  # 可重复迭代的对象 (如列表), 新的迭代器即是副本
+            return (value for value in iterator if value >= start)
+    return None
+
+
+def fire_times(task: "SchedulerTask", start: datetime) -> Iterator[datetime]:
+    """按时间顺序生成任务在 start 及之后的计划执行时间.
+
+    已计划但尚未开始的执行 (next_fire_time), 已从计时器取出而尚未计划的时间与待进行的重试会首先被合并进来,
+    之后的时间取自计时器的 preview (即计时器的副本). 已停止或已暂停的任务不会产生任何时间.
+
+    Args:
+        task (SchedulerTask): 计划任务.
+        start (datetime): 起始时间, 与计划器的时钟比较.
+
+    Returns:
+        Iterator[datetime]: 惰性的时间序列, 计时器不会耗尽时为无限序列.
+    """
+    if task.stopped or task.paused:
+        return iter(())
+    seeds = []
+    if task.next_fire_time is not None and task.next_fire_time != task.last_fire_time:
+        seeds.append(task.next_fire_time)
+    if task._pending is not None:
+        seeds.append(task._pending)
+    if task._retry is not None:
+        seeds.append(task._retry[0])
+    seeds = sorted(value for value in seeds if value >= start)
+    stream = _timer_times(task, start)
+    if stream is None:
+        return iter(seeds)
+    if not seeds:
+        return stream
+    return (value for value, _ in itertools.groupby(heapq.merge(seeds, stream)))
+
+
+def upcoming(
+    task: "SchedulerTask",
+    start: datetime,
+    count: Optional[int],
+    until: Optional[datetime],
+) -> List[datetime]:
+    """任务在 start 之后, 至 until (含) 为止的至多 count 个计划执行时间."""
+    times = fire_times(task, start)
+    if until is not None:
+        times = itertools.takewhile(lambda value: value <= until, times)
+    return list(itertools.islice(times, count))
+
+
+def timeline(
+    tasks: Iterable["SchedulerTask"],
+    start: datetime,
+    until: datetime,
+    limit: Optional[int],
+) -> List[UpcomingFire]:
+    """将各任务在 start 至 until (含) 之间的计划执行时间合并为一条时间线, 至多 limit 项.
+
+    各任务的时间序列都是惰性的, 以最小堆做多路归并: 堆中每个任务只有一项, 取出后才求该任务的下一个时间,
+    因此开销取决于任务数量与 limit, 而不是时间范围内的执行总数.
+    """
+    heap: List[Tuple[datetime, str, Iterator[datetime]]] = []
+    for task in tasks:
+        times = fire_times(task, start)
+        value = next(times, None)
+        if value is not None and value <= until:
+            heap.append((value, task.id, times))
+    heapq.heapify(heap)  # 任务 id 互不相同, 比较不会进行到迭代器
+    result: List[UpcomingFire] = []
+    while heap and (limit is None or len(result) < limit):
+        value, id, times = heap[0]
+        result.append(UpcomingFire(value, id))
+        value = next(times, None)
+        if value is None or value > until:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (value, id, times))
+    return result
@@ -0,0 +1,46 @@
+"""执行失败后的重试策略"""
+
+import random
+from dataclasses import dataclass
+from typing import Tuple, Type
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """执行失败 (抛出异常或超时) 后按指数退避重试的策略.
+
+    重试并不在执行内部等待, 而是作为一次额外的计划时间交由计划器调度;
+    若下一次常规执行早于重试时间, 则常规执行优先, 重试随后进行.
+    """
+
+    max_attempts: int = 3
+    """包括首次执行在内的最大尝试次数."""
+    initial_delay: float = 1.0
+    """首次重试前等待的秒数."""
+    multiplier: float = 2.0
+    """每次重试后等待时间的倍数."""
+    max_delay: float = 300.0
+    """等待时间的上限 (秒)."""
+    jitter: float = 0.1
+    """等待时间随机浮动的比例, 如 0.1 表示 ±10%."""
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    """需要重试的异常类型, 超时对应 asyncio.TimeoutError."""
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.initial_delay < 0 or self.max_delay < 0 or not 0 <= self.jitter <= 1:
+            raise ValueError(
+                "delays must not be negative and jitter must be within [0, 1]"
+            )
+
+    def should_retry(self, exception: BaseException, attempt: int) -> bool:
+        """第 attempt 次尝试抛出 exception 后是否应当重试."""
+        return attempt < self.max_attempts and isinstance(exception, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """第 attempt 次尝试失败后, 距下一次重试的秒数."""
+        delay = self.initial_delay * self.multiplier ** (attempt - 1)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return min(delay, self.max_delay)
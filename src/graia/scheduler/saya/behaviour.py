@@ -1,26 +1,39 @@
-from typing import Any, Union
+from typing import Any, Dict, Union
 
 from graia.saya.behaviour import Behaviour
 from graia.saya.cube import Cube
 
 from graia.scheduler import GraiaScheduler
 from graia.scheduler.saya.schema import SchedulerSchema
+from graia.scheduler.task import SchedulerTask
 
 
 class GraiaSchedulerBehaviour(Behaviour):
     scheduler: GraiaScheduler
+    allocated: Dict[int, SchedulerTask]
 
     def __init__(self, scheduler: GraiaScheduler) -> None:
         self.scheduler = scheduler
+        self.allocated = {}  # id(cube) -> 该 Cube 对应的计划任务
 
     def allocate(self, cube: Cube[SchedulerSchema]):
         if isinstance(cube.metaclass, SchedulerSchema):
-            self.scheduler.schedule(
+            self.allocated[id(cube)] = self.scheduler.add_task(
+                cube.content,
                 cube.metaclass.timer,
                 cube.metaclass.cancelable,
                 cube.metaclass.dispatchers,
                 cube.metaclass.decorators,
-            )(cube.content)
+                executor=cube.metaclass.executor,
+                max_instances=cube.metaclass.max_instances,
+                coalesce=cube.metaclass.coalesce,
+                misfire_grace_time=cube.metaclass.misfire_grace_time,
+                priority=cube.metaclass.priority,
+                group=cube.metaclass.group,
+                timeout=cube.metaclass.timeout,
+                id=cube.metaclass.id,
+                retry=cube.metaclass.retry,
+            )
         else:
             return
 
@@ -28,16 +41,9 @@ class GraiaSchedulerBehaviour(Behaviour):
 
     def release(self, cube: Cube) -> Any:
         if isinstance(cube.metaclass, SchedulerSchema):
-            target_tasks = list(
-                filter(
-                    lambda x: x.target is cube.content, self.scheduler.schedule_tasks
-                )
-            )
-            if target_tasks:
-                target = target_tasks[0]
-                target.stop_gen_interval()
-                target.stop()
-                self.scheduler.schedule_tasks.remove(target)
+            task = self.allocated.pop(id(cube), None)
+            if task is not None:
+                self.scheduler.remove_task(task)
         else:
             return
 
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 from graia.broadcast.entities.decorator import Decorator
 from graia.broadcast.typing import T_Dispatcher
 from graia.saya.schema import BaseSchema
 
-from .. import Timer
+from .. import T_ExecutorKind, Timer
+from ..retry import RetryPolicy
 
 
 @dataclass
@@ -14,3 +15,12 @@ class SchedulerSchema(BaseSchema):
     cancelable: bool = field(default=False)
     decorators: List[Decorator] = field(default_factory=list)
     dispatchers: List[T_Dispatcher] = field(default_factory=list)
+    executor: T_ExecutorKind = field(default="inline")
+    max_instances: int = field(default=1)
+    coalesce: bool = field(default=False)
+    misfire_grace_time: Optional[float] = field(default=0.0)
+    priority: int = field(default=0)
+    group: Optional[str] = field(default=None)
+    timeout: Optional[float] = field(default=None)
+    id: Optional[str] = field(default=None)
+    retry: Optional[RetryPolicy] = field(default=None)
@@ -1,10 +1,8 @@
 """Saya 相关的工具"""
 from __future__ import annotations
 
-from datetime import datetime
 from typing import (
     Dict,
-    Generator,
     Literal,
     Optional,
     Protocol,
@@ -15,33 +13,76 @@ from graia.saya.factory import SchemaWrapper, factory
 
 from .. import Timer
 from ..timers import (
+    FixedMode,
+    SeekableTimer,
     crontabify,
     every_custom_hours,
     every_custom_minutes,
     every_custom_seconds,
 )
+from ..tz import TimeZone
 from ..utilles import TimeObject
 from .schema import SchedulerSchema
 
 
+def _with_offsets(timer: Timer, jitter: float, spread: float) -> Timer:
+    if not jitter and not spread:
+        return timer
+    if not isinstance(timer, SeekableTimer):
+        raise TypeError("jitter and spread require a SeekableTimer")
+    timer = timer.clone()  # 同一个计时器可能被多个任务共用, 偏移只作用于本任务
+    timer._set_offsets(jitter, spread)
+    return timer
+
+
 @factory
-def schedule(timer: Union[Timer, str], cancelable: bool = True) -> SchemaWrapper:
+def schedule(
+    timer: Union[Timer, str],
+    cancelable: bool = True,
+    max_instances: int = 1,
+    coalesce: bool = False,
+    misfire_grace_time: Optional[float] = 0.0,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+) -> SchemaWrapper:
     """在当前 Saya Channel 中设置定时任务
 
     Args:
         timer (Union[Timer, str]): 定时器或者类似 crontab 的定时模板
         cancelable (bool): 是否能够取消定时任务, 默认为 True
+        max_instances (int): 允许同时进行的执行数量, 默认为 1
+        coalesce (bool): 在宽限期内错过了多次执行时, 是否只补执行一次, 默认为 False
+        misfire_grace_time (Optional[float]): 错过执行时间的宽限期 (秒), 默认为 0; 为 None 时不限制
+        jitter (float): 每次执行随机推迟的最大秒数, 默认为 0
+        spread (float): 按任务 id 固定推迟的时间窗口 (秒), 用于错开同时触发的任务, 默认为 0
     Returns:
         Callable[[T_Callable], T_Callable]: 装饰器
     """
 
     return lambda _, buffer: SchedulerSchema(
-        timer=crontabify(timer) if isinstance(timer, str) else timer, cancelable=cancelable, **buffer
+        timer=_with_offsets(
+            crontabify(timer) if isinstance(timer, str) else timer, jitter, spread
+        ),
+        cancelable=cancelable,
+        max_instances=max_instances,
+        coalesce=coalesce,
+        misfire_grace_time=misfire_grace_time,
+        **buffer,
     )
 
 
 class _TimerProtocol(Protocol):
-    def __call__(self, value: int, /, *, base: Optional[TimeObject] = None) -> Generator[datetime, None, None]:
+    def __call__(
+        self,
+        value: int,
+        /,
+        *,
+        base: Optional[TimeObject] = None,
+        fixed: Optional[FixedMode] = None,
+        jitter: float = 0.0,
+        spread: float = 0.0,
+        tz: Optional[TimeZone] = None,
+    ) -> SeekableTimer:
         ...
 
 
@@ -58,6 +99,13 @@ def every(
     mode: Literal["second", "minute", "hour"] = "second",
     start: Optional[TimeObject] = None,
     cancelable: bool = True,
+    fixed: Optional[FixedMode] = None,
+    max_instances: int = 1,
+    coalesce: bool = False,
+    misfire_grace_time: Optional[float] = 0.0,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
 ) -> SchemaWrapper:
     """在当前 Saya Channel 中设置基本的定时任务
 
@@ -66,28 +114,66 @@ def every(
         mode (Literal["second", "minute", "hour"]): 定时模式, 默认为 ’second‘
         start (Optional[Union[datetime, time, str, float]]): 定时起始时间, 默认为 datetime.now()
         cancelable (bool): 是否能够取消定时任务, 默认为 True
+        fixed (Optional[Literal["rate", "delay"]]): 固定频率或固定延迟模式,
+            详见 IntervalTimer, 默认为 None
+        max_instances (int): 允许同时进行的执行数量, 默认为 1
+        coalesce (bool): 在宽限期内错过了多次执行时, 是否只补执行一次, 默认为 False
+        misfire_grace_time (Optional[float]): 错过执行时间的宽限期 (秒), 默认为 0; 为 None 时不限制
+        jitter (float): 每次执行随机推迟的最大秒数, 默认为 0
+        spread (float): 按任务 id 固定推迟的时间窗口 (秒), 用于错开同时触发的任务, 默认为 0
+        tz (Optional[TimeZone]): 时区名或 tzinfo, 如 "Asia/Shanghai", start 也按该时区解释, 默认为本地时间
     Returns:
         Callable[[T_Callable], T_Callable]: 装饰器
     """
 
     return lambda _, buffer: SchedulerSchema(
-        timer=_TIMER_MAPPING[mode](value, base=start), cancelable=cancelable, **buffer
+        timer=_TIMER_MAPPING[mode](
+            value, base=start, fixed=fixed, jitter=jitter, spread=spread, tz=tz
+        ),
+        cancelable=cancelable,
+        max_instances=max_instances,
+        coalesce=coalesce,
+        misfire_grace_time=misfire_grace_time,
+        **buffer,
     )
 
 
 @factory
-def crontab(pattern: str, start: Optional[TimeObject] = None, cancelable: bool = True) -> SchemaWrapper:
+def crontab(
+    pattern: str,
+    start: Optional[TimeObject] = None,
+    cancelable: bool = True,
+    max_instances: int = 1,
+    coalesce: bool = False,
+    misfire_grace_time: Optional[float] = 0.0,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> SchemaWrapper:
     """在当前 Saya Channel 中设置类似于 crontab 模板的定时任务
 
     Args:
         pattern (str): 类似 crontab 的定时模板
         start (Optional[Union[datetime, time, str, float]]): 定时起始时间, 默认为 datetime.now()
         cancelable (bool): 是否能够取消定时任务, 默认为 True
+        max_instances (int): 允许同时进行的执行数量, 默认为 1
+        coalesce (bool): 在宽限期内错过了多次执行时, 是否只补执行一次, 默认为 False
+        misfire_grace_time (Optional[float]): 错过执行时间的宽限期 (秒), 默认为 0; 为 None 时不限制
+        jitter (float): 每次执行随机推迟的最大秒数, 默认为 0
+        spread (float): 按任务 id 固定推迟的时间窗口 (秒), 用于错开同时触发的任务, 默认为 0
+        tz (Optional[TimeZone]): 时区名或 tzinfo, 如 "Asia/Shanghai", start 也按该时区解释, 默认为本地时间
     Returns:
         Callable[[T_Callable], T_Callable]: 装饰器
     """
 
-    return lambda _, buffer: SchedulerSchema(timer=crontabify(pattern, start), cancelable=cancelable, **buffer)
+    return lambda _, buffer: SchedulerSchema(
+        timer=crontabify(pattern, start, jitter, spread, tz),
+        cancelable=cancelable,
+        max_instances=max_instances,
+        coalesce=coalesce,
+        misfire_grace_time=misfire_grace_time,
+        **buffer,
+    )
 
 
 on_timer = schedule
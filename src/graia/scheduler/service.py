@@ -1,21 +1,35 @@
-from typing import Literal, Set
+from typing import List, Literal, Optional, Set
 from launart import Service, Launart
 from . import GraiaScheduler
+from .task import SchedulerTask
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class SchedulerService(Service):
     """GraiaScheduler 的 Launart 服务
 
+    退出时平滑地停止计划器: 不再开始新的执行, 正在进行的执行至多等待 drain_timeout 秒, 之后被取消,
+    被中断的任务会记录在 interrupted 中并输出警告. 分片模式下的计划器同样适用.
+
     Args:
         scheduler (GraiaScheduler): 任务计划器
+        drain_timeout (Optional[float], optional): 等待正在进行的执行结束的最长秒数.
+            默认为 10, 为 None 时一直等待.
     """
 
     id = "scheduler.service"
+    interrupted: List[SchedulerTask]
 
-    def __init__(self, scheduler: GraiaScheduler) -> None:
+    def __init__(
+        self, scheduler: GraiaScheduler, drain_timeout: Optional[float] = 10.0
+    ) -> None:
         super().__init__()
         self.scheduler = scheduler
+        self.drain_timeout = drain_timeout
+        self.interrupted = []
 
     @property
     def required(self):
@@ -29,10 +43,20 @@ class SchedulerService(Service):
         async with self.stage("preparing"):
             pass  # Wait for preparation to complete, then we run tasks
         async with self.stage("blocking"):
-            tsk = asyncio.create_task(self.scheduler.run())
+            tsk = asyncio.create_task(self.scheduler.run(forever=True))
             await manager.status.wait_for_sigexit()
         async with self.stage("cleanup"):
-            # Stop all schedule tasks
-            self.scheduler.stop()
-            await self.scheduler.join()
+            # Stop planning new fires, drain in-flight executions, then cancel the rest
+            self.interrupted = await self.scheduler.drain(self.drain_timeout)
+            if self.interrupted:
+                ids = ", ".join(task.id for task in self.interrupted)
+                logger.warning(
+                    "scheduler tasks interrupted after %ss drain timeout: %s",
+                    self.drain_timeout,
+                    ids,
+                )
             await tsk
+            self.scheduler.shutdown_executors(wait=False)
+            self.scheduler.store.close()
+            if self.scheduler.lock is not None:
+                self.scheduler.lock.close()
@@ -0,0 +1,218 @@
+"""分片模式: 将计划任务分散到多个线程中各自的事件循环上运行"""
+
+import asyncio
+import threading
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, List, Optional, Set, TypeVar
+
+from graia.broadcast import Broadcast
+from graia.broadcast.entities.event import Dispatchable
+
+from .engine import HeapEngine
+from .exception import AlreadyStarted
+from .limiter import ExecutionLimiter
+from .task import SchedulerTask, drain
+
+if TYPE_CHECKING:
+    from . import GraiaScheduler
+    from .hooks import ExecutionHooks
+
+T = TypeVar("T")
+
+
+class ShardBroadcast(Broadcast):
+    """分片使用的事件总线.
+
+    任务本身在分片的事件循环中经由本事件总线执行, 使用的全局 Dispatcher 与计划器的事件总线共享同一组列表;
+    执行中广播的事件 (如 ExceptionThrown, SchedulerTaskTimeout) 则被转发到主事件循环,
+    在计划器的事件总线上广播, 因此监听者仍然只需监听主事件总线.
+    """
+
+    target: Broadcast
+    target_loop: AbstractEventLoop
+
+    def __init__(self, target: Broadcast, target_loop: AbstractEventLoop) -> None:
+        """初始化
+
+        Args:
+            target (Broadcast): 接收转发事件的事件总线.
+            target_loop (AbstractEventLoop): target 所在的事件循环.
+        """
+        super().__init__()
+        self.target = target
+        self.target_loop = target_loop
+        self.prelude_dispatchers = target.prelude_dispatchers
+        self.finale_dispatchers = target.finale_dispatchers
+
+    def postEvent(
+        self, event: Dispatchable, upper_event: Optional[Dispatchable] = None
+    ):
+        """将事件转发给主事件总线. 返回的 Task 在转发后即完成, 不等待监听者执行完毕."""
+        self.target_loop.call_soon_threadsafe(self.target.postEvent, event, upper_event)
+        return asyncio.get_running_loop().create_task(asyncio.sleep(0))
+
+
+class SchedulerShard:
+    """运行一部分计划任务的工作线程.
+
+    每个分片拥有独立的线程与事件循环, 以及各自的事件总线, 执行钩子, 并发限制器与 (heap 模式下的) 调度引擎;
+    一个分片中的任务阻塞了事件循环, 不会推迟其他分片中任务的执行.
+    分片由 GraiaScheduler 在 run 时启动, 在 stop 后排空并结束线程.
+    """
+
+    index: int
+    scheduler: "GraiaScheduler"
+    loop: Optional[AbstractEventLoop]
+    broadcast: ShardBroadcast
+    hooks: "ExecutionHooks"
+    limiter: Optional[ExecutionLimiter]
+    engine: Optional[HeapEngine]
+    thread: Optional[threading.Thread]
+    closing: bool
+
+    def __init__(self, scheduler: "GraiaScheduler", index: int) -> None:
+        """初始化
+
+        Args:
+            scheduler (GraiaScheduler): 所属的计划器.
+            index (int): 分片序号.
+        """
+        self.index = index
+        self.scheduler = scheduler
+        self.loop = None
+        self.broadcast = ShardBroadcast(scheduler.broadcast, scheduler.loop)
+        self.hooks = scheduler.hooks.fork(self.broadcast)
+        self.limiter = None
+        if scheduler.limiter is not None:
+            self.limiter = ExecutionLimiter(
+                scheduler.limiter.limit, scheduler.limiter.group_limits
+            )
+        self.engine = None
+        self.thread = None
+        self.closing = False
+        self._engine_task: Optional[asyncio.Task] = None
+        self._calls: Set[Future] = set()
+
+    @property
+    def alive(self) -> bool:
+        """线程是否正在运行且未在关闭中."""
+        return self.thread is not None and not self.closing
+
+    @property
+    def tasks(self) -> List[SchedulerTask]:
+        """属于本分片的计划任务."""
+        select = self.scheduler._select_shard
+        return [
+            task
+            for task in list(self.scheduler.tasks.values())
+            if select(task.group or task.id) is self
+        ]
+
+    def start(self) -> None:
+        """启动线程, 并在其事件循环中开始本分片的所有任务.
+
+        事件循环在线程中创建, 本方法在其创建后返回; 从未启动的分片不持有事件循环.
+        """
+        if self.loop is not None:
+            raise AlreadyStarted("the shard has been started and cannot be restarted!")
+        ready = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run,
+            args=(ready,),
+            name=f"scheduler-shard-{self.index}",
+            daemon=True,
+        )
+        self.thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event) -> None:
+        self.loop = loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.call_soon(self._begin)
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _begin(self) -> None:
+        loop: AbstractEventLoop = self.loop  # type: ignore
+        if self.scheduler.mode == "heap":
+            self.engine = HeapEngine(
+                loop,
+                self.scheduler.wakeup_tolerance,
+                self.scheduler.batch_concurrency,
+            )
+            self._engine_task = loop.create_task(self.engine.run())
+        for task in self.tasks:
+            task.loop = loop  # 启动前加入的任务暂时以主事件循环创建
+            self.start_task(task)
+
+    def start_task(self, task: SchedulerTask) -> None:
+        """开始本分片中的任务, 须在分片的事件循环中调用; 已经开始的任务会被忽略."""
+        if task.task is not None:  # 在 _begin 之前加入, 已由 _begin 开始
+            return
+        if self.engine is not None:
+            self.engine.register(task)
+        else:
+            task.setup_task()
+        scheduler = self.scheduler
+        task.task.add_done_callback(  # type: ignore
+            lambda _: scheduler.loop.call_soon_threadsafe(
+                scheduler._task_finished, task
+            )
+        )
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """在分片的事件循环中调用 callback, 可从任意线程调用."""
+        self.loop.call_soon_threadsafe(callback, *args)  # type: ignore
+
+    async def call(self, coroutine: Coroutine[Any, Any, T]) -> Optional[T]:
+        """在分片的事件循环中运行协程并等待其结果; 分片未运行或正在关闭时直接返回 None."""
+        if not self.alive:
+            coroutine.close()
+            return None
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)  # type: ignore
+        self._calls.add(future)
+        future.add_done_callback(self._calls.discard)
+        return await asyncio.wrap_future(future)
+
+    async def join(self, stop: bool = False) -> None:
+        """等待本分片的所有任务结束, 须在分片的事件循环中运行."""
+        await asyncio.gather(*(task.join(stop=stop) for task in self.tasks))
+
+    async def drain(self, timeout: Optional[float] = None) -> List[SchedulerTask]:
+        """平滑地停止本分片的所有任务, 见 task.drain; 须在分片的事件循环中运行."""
+        return await drain(self.tasks, timeout)
+
+    async def _drain(self) -> None:
+        tasks = self.tasks
+        for task in tasks:
+            task.stop()
+        if self.engine is not None:
+            self.engine.close()
+            await self._engine_task  # type: ignore
+            self.engine = self._engine_task = None
+        await asyncio.gather(*(task.join() for task in tasks))
+
+    async def shutdown(self) -> None:
+        """停止本分片的所有任务, 等待正在进行的执行结束, 然后结束线程."""
+        if self.thread is None:
+            return
+        loop: AbstractEventLoop = self.loop  # type: ignore
+        self.closing = True
+        try:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._drain(), loop)
+            )
+            if self._calls:
+                await asyncio.wait(
+                    [asyncio.wrap_future(future) for future in list(self._calls)]
+                )
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            await asyncio.get_running_loop().run_in_executor(None, self.thread.join)
+            self.thread = None
+            self.closing = False
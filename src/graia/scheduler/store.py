@@ -0,0 +1,172 @@
+"""计划任务执行状态的持久化"""
+
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional
+
+
+class JobState(NamedTuple):
+    """某个计划任务的执行状态."""
+
+    next_fire_time: Optional[datetime]
+    """下一次执行的计划时间."""
+    last_fire_time: Optional[datetime]
+    """最近一次开始执行时的计划时间."""
+
+
+class JobStore:
+    """以任务 id 为键保存 JobState 的存储后端.
+
+    update 与 remove 可以是延迟写入的, 调用 flush 后才保证所有变更已持久化.
+    """
+
+    def load(self, id: str) -> Optional[JobState]:
+        """读取任务的执行状态, 不存在时返回 None."""
+        raise NotImplementedError
+
+    def update(self, id: str, state: JobState) -> None:
+        """写入任务的执行状态."""
+        raise NotImplementedError
+
+    def remove(self, id: str) -> None:
+        """删除任务的执行状态."""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """持久化所有尚未写入的变更."""
+
+    def close(self) -> None:
+        """持久化所有尚未写入的变更并释放资源."""
+        self.flush()
+
+
+class MemoryJobStore(JobStore):
+    """保存在内存中的 JobStore, 进程退出后状态即丢失."""
+
+    states: Dict[str, JobState]
+
+    def __init__(self) -> None:
+        self.states = {}
+
+    def load(self, id: str) -> Optional[JobState]:
+        return self.states.get(id)
+
+    def update(self, id: str, state: JobState) -> None:
+        self.states[id] = state
+
+    def remove(self, id: str) -> None:
+        self.states.pop(id, None)
+
+
+def _dump(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+class SQLiteJobStore(JobStore):
+    """基于 SQLite 的 JobStore.
+
+    变更先在内存中按任务 id 合并, 在 flush_interval 秒后或积压达到 max_pending 个任务时,
+    于同一个事务中批量写入, 因此频繁执行的任务不会在每次执行时都产生一次磁盘写入.
+    积压的变更与写入由一把线程锁保护, 可供分片模式下的多个线程同时使用.
+    """
+
+    connection: sqlite3.Connection
+    table: str
+    flush_interval: float
+    max_pending: int
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "graia_scheduler_jobs",
+        flush_interval: float = 1.0,
+        max_pending: int = 1024,
+    ) -> None:
+        """初始化
+
+        Args:
+            path (str): 数据库文件路径.
+            table (str, optional): 表名. 默认为 "graia_scheduler_jobs".
+            flush_interval (float, optional): 变更最多在内存中停留的秒数. 默认为 1.
+            max_pending (int, optional): 积压的任务数量达到该值时立即写入. 默认为 1024.
+        """
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.table = table
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._dirty: Dict[str, Optional[JobState]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._mutex = threading.RLock()
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(id TEXT PRIMARY KEY, next_fire_time TEXT, last_fire_time TEXT)"
+            )
+
+    def load(self, id: str) -> Optional[JobState]:
+        with self._mutex:
+            if id in self._dirty:
+                return self._dirty[id]
+            row = self.connection.execute(
+                f"SELECT next_fire_time, last_fire_time FROM {self.table} WHERE id = ?",
+                (id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return JobState(_parse(row[0]), _parse(row[1]))
+
+    def update(self, id: str, state: JobState) -> None:
+        with self._mutex:
+            self._dirty[id] = state
+            self._schedule_flush()
+
+    def remove(self, id: str) -> None:
+        with self._mutex:
+            self._dirty[id] = None
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if len(self._dirty) >= self.max_pending:
+            self.flush()
+            return
+        if self._handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # 不在事件循环中时直接写入
+            self.flush()
+            return
+        self._handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        with self._mutex:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, {}
+            with self.connection:
+                self.connection.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?)",
+                    [
+                        (id, _dump(state.next_fire_time), _dump(state.last_fire_time))
+                        for id, state in dirty.items()
+                        if state is not None
+                    ],
+                )
+                self.connection.executemany(
+                    f"DELETE FROM {self.table} WHERE id = ?",
+                    [(id,) for id, state in dirty.items() if state is None],
+                )
+
+    def close(self) -> None:
+        with self._mutex:
+            self.flush()
+            self.connection.close()
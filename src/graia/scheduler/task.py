@@ -1,7 +1,26 @@
 import asyncio
+import functools
+import inspect
+import random
 import traceback
-from datetime import datetime
-from typing import Any, Callable, Generator, List, Optional, Tuple, Awaitable
+import zlib
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from graia.broadcast import Broadcast
 from graia.broadcast.entities.decorator import Decorator
@@ -9,36 +28,244 @@ from graia.broadcast.entities.exectarget import ExecTarget
 from graia.broadcast.exceptions import ExecutionStop, PropagationCancelled
 from graia.broadcast.typing import T_Dispatcher
 from graia.broadcast.builtin.event import ExceptionThrown
+from graia.scheduler.clock import Clock, system_clock
+from graia.scheduler.event import SchedulerTaskTimeout
 from graia.scheduler.exception import AlreadyStarted
-from graia.scheduler.utilles import EnteredRecord, print_track_async
+from graia.scheduler.hooks import ExecutionContext, ExecutionHooks
+from graia.scheduler.metrics import TaskMetrics
+from graia.scheduler.retry import RetryPolicy
+from graia.scheduler.store import JobState
+from graia.scheduler.utilles import Flag, FlagRecord, print_track_async
 
 from . import Timer
 
+if TYPE_CHECKING:
+    from .engine import HeapEngine
+    from .limiter import ExecutionLimiter
+    from .lock import LockBackend
+    from .store import JobStore
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _on_own_loop(method: Callable[..., None]) -> Callable[..., None]:
+    """使方法总在任务所属的事件循环中执行: 从其他线程调用时 (分片模式下), 转交给任务的事件循环."""
+
+    @functools.wraps(method)
+    def wrapper(self: "SchedulerTask", *args: Any) -> None:
+        if self.loop.is_running():
+            try:
+                own = asyncio.get_running_loop() is self.loop
+            except RuntimeError:  # 调用方的线程中没有正在运行的事件循环
+                own = False
+            if not own:
+                self.loop.call_soon_threadsafe(method, self, *args)
+                return
+        method(self, *args)
+
+    return wrapper
+
+
+_CANCELABLE = 1 << 0
+_COALESCE = 1 << 1
+_STOPPED = 1 << 2
+_PAUSED = 1 << 3
+_SLEEPING = 1 << 4
+_RUNNING = 1 << 5
+
+_NO_EXECUTIONS: Set[asyncio.Task] = frozenset()  # type: ignore
+"""尚未执行过的任务共享的空集合, 首次执行时才分配各自的集合."""
+
+_CANCEL_GRACE = 1.0
+"""排空时取消执行后, 等待其响应取消的最长秒数."""
+
 
 class SchedulerTask:
+    """计划任务.
+
+    为了支持数以十万计的任务, 实例使用 __slots__, 布尔状态集中在一个整数位域中,
+    空的 dispatchers 与 decorators 共享同一个空元组, executions 与 abandoned 在首次用到时才分配.
+    """
+
+    __slots__ = (
+        "id",
+        "target",
+        "timer",
+        "task",
+        "engine",
+        "broadcast",
+        "executor",
+        "max_instances",
+        "misfire_grace_time",
+        "next_fire_time",
+        "last_fire_time",
+        "jitter",
+        "spread_offset",
+        "executions",
+        "priority",
+        "group",
+        "limiter",
+        "timeout",
+        "metrics",
+        "hooks",
+        "retry",
+        "store",
+        "lock",
+        "loop",
+        "clock",
+        "_flags",
+        "_abandoned",
+        "_dispatchers",
+        "_decorators",
+        "_exec_target",
+        "_timer_iter",
+        "_pending",
+        "_waiter",
+        "_resumed",
+        "_fire_offset",
+        "_retry",
+        "_fire_attempt",
+    )
+
+    id: str
     target: Callable[..., Any]
     timer: Timer
-    task: Optional[asyncio.Task]
+    task: Optional[asyncio.Future]
+    engine: Optional["HeapEngine"]
 
     broadcast: Broadcast
-    dispatchers: List[T_Dispatcher]
-    decorators: List[Decorator]
+    executor: Optional[Executor]
 
-    cancelable: bool
-    stopped: bool
+    cancelable = Flag(_CANCELABLE)
+    stopped = Flag(_STOPPED)
+    paused = Flag(_PAUSED)
 
-    sleep_record: EnteredRecord
-    run_record: EnteredRecord
+    max_instances: int
+    coalesce = Flag(_COALESCE)
+    misfire_grace_time: Optional[float]
+    next_fire_time: Optional[datetime]
+    last_fire_time: Optional[datetime]
+    jitter: float
+    spread_offset: float
+    executions: Set[asyncio.Task]
+
+    priority: int
+    group: Optional[str]
+    limiter: Optional["ExecutionLimiter"]
+
+    timeout: Optional[float]
+
+    metrics: TaskMetrics
+    hooks: Optional[ExecutionHooks]
+    retry: Optional[RetryPolicy]
+
+    store: Optional["JobStore"]
+    lock: Optional["LockBackend"]
 
     loop: asyncio.AbstractEventLoop
+    clock: Clock
+
+    _flags: int
+    _abandoned: Optional[Set[asyncio.Task]]
+    _dispatchers: Sequence[T_Dispatcher]
+    _decorators: Sequence[Decorator]
+    _exec_target: Optional[ExecTarget]
+    _timer_iter: Optional[Iterator[datetime]]
+    _pending: Optional[datetime]
+    _waiter: Optional[asyncio.Future]
+    _resumed: Optional[asyncio.Future]
+    _fire_offset: float
+    _retry: Optional[Tuple[datetime, int]]
+    _fire_attempt: int
+
+    @property
+    def sleep_record(self) -> FlagRecord:
+        return FlagRecord(self, _SLEEPING)
+
+    @property
+    def run_record(self) -> FlagRecord:
+        return FlagRecord(self, _RUNNING)
 
     @property
     def is_sleeping(self) -> bool:
-        return self.sleep_record.entered
+        return bool(self._flags & _SLEEPING)
+
+    @property
+    def abandoned(self) -> Set[asyncio.Task]:
+        """超时后被放弃, 仍在后台运行的执行."""
+        if self._abandoned is None:
+            self._abandoned = set()
+        return self._abandoned
 
     @property
     def is_executing(self) -> bool:
-        return self.run_record.entered and not self.sleep_record.entered
+        return bool(self.executions)
+
+    @property
+    def misfire_count(self) -> int:
+        return self.metrics.misfires
+
+    @property
+    def timeout_count(self) -> int:
+        return self.metrics.timeouts
+
+    @property
+    def dispatchers(self) -> Sequence[T_Dispatcher]:
+        return self._dispatchers
+
+    @dispatchers.setter
+    def dispatchers(self, dispatchers: Sequence[T_Dispatcher]) -> None:
+        self._dispatchers = dispatchers
+        self._exec_target = None
+
+    @property
+    def decorators(self) -> Sequence[Decorator]:
+        return self._decorators
+
+    @decorators.setter
+    def decorators(self, decorators: Sequence[Decorator]) -> None:
+        self._decorators = decorators
+        self._exec_target = None
+
+    @property
+    def exec_target(self) -> ExecTarget:
+        """本任务的 ExecTarget.
+
+        ExecTarget 在多次执行之间复用, 以保留 Broadcast 记录在其上的参数解析缓存 (oplog);
+        替换 dispatchers 或 decorators 时会自动重建, 就地修改它们后则需调用 invalidate.
+        """
+        if self._exec_target is None:
+            self._exec_target = ExecTarget(
+                callable=(
+                    self.target
+                    if self.executor is None
+                    else self._offload(self.target, self.executor)
+                ),
+                inline_dispatchers=list(self.dispatchers),
+                decorators=list(self.decorators),
+            )
+        return self._exec_target
+
+    def invalidate(self) -> None:
+        """丢弃缓存的 ExecTarget, 使其在下一次执行时重新构建."""
+        self._exec_target = None
+
+    def _offload(
+        self, target: Callable[..., Any], executor: Executor
+    ) -> Callable[..., Any]:
+        """包装 target, 使其在 executor 中执行; 签名保持不变, 因此 Broadcast 仍可为其解析参数."""
+        loop = self.loop
+
+        @functools.wraps(target)
+        async def wrapper(*args, **kwargs):
+            return await loop.run_in_executor(
+                executor, functools.partial(target, *args, **kwargs)
+            )
+
+        return wrapper
 
     def __init__(
         self,
@@ -49,18 +276,77 @@ class SchedulerTask:
         cancelable: bool = False,
         dispatchers: Optional[List[T_Dispatcher]] = None,
         decorators: Optional[List[Decorator]] = None,
+        executor: Optional[Executor] = None,
+        max_instances: int = 1,
+        coalesce: bool = False,
+        misfire_grace_time: Optional[float] = 0.0,
+        priority: int = 0,
+        group: Optional[str] = None,
+        limiter: Optional["ExecutionLimiter"] = None,
+        timeout: Optional[float] = None,
+        id: Optional[str] = None,
+        store: Optional["JobStore"] = None,
+        lock: Optional["LockBackend"] = None,
+        clock: Optional[Clock] = None,
+        hooks: Optional[ExecutionHooks] = None,
+        retry: Optional[RetryPolicy] = None,
     ) -> None:
+        if max_instances < 1:
+            raise ValueError("max_instances must be at least 1")
+        if executor is not None and inspect.iscoroutinefunction(target):
+            raise TypeError("coroutine functions must be executed on the event loop")
+        self.id = id or f"{target.__module__}.{target.__qualname__}"
         self.target = target
-        self.timer = timer
         self.broadcast = broadcast
         self.loop = loop or asyncio.get_running_loop()
-        self.cancelable = cancelable
+        self.clock = clock or system_clock
+        self._bind(timer)
+        self._flags = (_CANCELABLE if cancelable else 0) | (
+            _COALESCE if coalesce else 0
+        )
         self.task = None
-        self.stopped = False
-        self.dispatchers = dispatchers or []
-        self.decorators = decorators or []
-        self.sleep_record = EnteredRecord()
-        self.run_record = EnteredRecord()
+        self.engine = None
+        self.executor = executor
+        self._exec_target = None
+        self._dispatchers = dispatchers or ()
+        self._decorators = decorators or ()
+        self.max_instances = max_instances
+        self.misfire_grace_time = misfire_grace_time
+        self.next_fire_time = None
+        self.last_fire_time = None
+        self.executions = _NO_EXECUTIONS
+        self.priority = priority
+        self.group = group
+        self.limiter = limiter
+        self.timeout = timeout
+        self._abandoned = None
+        self.metrics = TaskMetrics()
+        self.hooks = hooks
+        self.retry = retry
+        self.store = store
+        self.lock = lock
+        self._timer_iter = None
+        self._pending = None
+        self._waiter = None
+        self._resumed = None
+        self._fire_offset = 0.0
+        self._retry = None
+        self._fire_attempt = 1
+
+    def __repr__(self) -> str:
+        return f"<SchedulerTask id={self.id!r}>"
+
+    def _bind(self, timer: Timer) -> None:
+        self.timer = timer
+        self.jitter = getattr(timer, "jitter", 0.0)
+        spread = getattr(timer, "spread", 0.0)
+        # 由任务 id 决定的固定偏移, 使用 crc32 而非 hash() 以保证在不同进程中一致
+        self.spread_offset = (
+            spread * zlib.crc32(self.id.encode()) / 2**32 if spread else 0.0
+        )
+        bind = getattr(timer, "bind", None)
+        if bind is not None:  # 使计时器与计划器使用同一个时钟
+            bind(self.clock)
 
     def setup_task(self) -> asyncio.Task:
         """将本 SchedulerTask 作为 asyncio.Task 排入事件循环."""
@@ -69,53 +355,412 @@ class SchedulerTask:
         self.task = self.loop.create_task(self.run())
         return self.task
 
+    def attach(self, engine: "HeapEngine") -> None:
+        """将本 SchedulerTask 交由 HeapEngine 调度, 此时 task 属性为一个在任务结束时完成的 Future."""
+        if self.task:
+            raise AlreadyStarted("the scheduler task has been started!")
+        self.engine = engine
+        self.task = self.loop.create_future()
+
+    def restore(self, state: "JobState") -> None:
+        """从持久化的执行状态继续: 此前计划但尚未开始的执行会被补上, 并按 misfire 策略处理.
+
+        仅对提供 restore 方法的计时器 (如 IntervalTimer 与 CronTimer) 生效, 其他计时器无法得知从何处继续.
+
+        Args:
+            state (JobState): 执行状态.
+        """
+        restore: Optional[Callable[[datetime], None]] = getattr(
+            self.timer, "restore", None
+        )
+        if restore is None:
+            return
+        self.last_fire_time = state.last_fire_time
+        pending = state.next_fire_time
+        if pending is None:
+            return
+        self._timer_iter = iter(self.timer)
+        restore(pending)
+        if state.last_fire_time is None or pending > state.last_fire_time:
+            self._pending = pending
+
+    def _save(self) -> None:
+        if self.store is not None:
+            self.store.update(
+                self.id, JobState(self.next_fire_time, self.last_fire_time)
+            )
+
+    def _seek(
+        self, timer: Iterator[datetime], fire_time: datetime, t: datetime
+    ) -> datetime:
+        """跳过 fire_time 及其后所有早于 t 的时间, 每个被跳过的时间计入 misfire_count."""
+        seek: Optional[Callable[[datetime], datetime]] = getattr(timer, "seek", None)
+        if seek is None:  # 普通的可迭代对象只能逐个跳过已经过去的时间
+            value = fire_time
+            while value < t:
+                self.metrics.misfires += 1
+                value = next(timer)
+            return value
+        value = seek(t)
+        count_between = getattr(timer, "count_between", None)
+        if count_between is None:
+            self.metrics.misfires += 1
+        else:
+            self.metrics.misfires += count_between(fire_time, value)
+        return value
+
+    def plan(self) -> Optional[datetime]:
+        """从计时器中取出下一次执行的计划时间, 并应用错过执行 (misfire) 的策略.
+
+        - 早于 misfire_grace_time 宽限期的时间会被直接跳过, 每个被跳过的时间都计入 misfire_count;
+        - 宽限期内已经错过的时间会立即执行, 若启用了 coalesce, 则多个错过的时间只执行一次.
+
+        计时器的 spread 与 jitter 在此取得, 判断是否错过时比较的是叠加了偏移之后的时间,
+        因此偏移后尚未到来的执行不会被当作错过.
+
+        Returns:
+            Optional[datetime]: 计划时间 (可能略早于当前时间), 计时器耗尽或任务已停止时返回 None.
+        """
+        if self.stopped:
+            return None
+        if self._timer_iter is None:
+            self._timer_iter = iter(self.timer)
+        timer = self._timer_iter
+        self._fire_attempt = 1
+        offset = self.spread_offset
+        if self.jitter:
+            offset += random.uniform(0.0, self.jitter)
+        self._fire_offset = offset
+        if self._retry is not None:
+            fire_time = self._plan_retry(timer)
+            if fire_time is not None:
+                return fire_time
+        # 计划时间 fire_time 实际在 fire_time + offset 执行, 与提前 offset 的当前时间比较
+        now = self.clock.now() - timedelta(seconds=offset)
+        try:
+            if self._pending is not None:
+                fire_time, self._pending = self._pending, None
+            else:
+                fire_time = next(timer)
+            if self.misfire_grace_time is not None:
+                floor = now - timedelta(seconds=self.misfire_grace_time)
+                if fire_time < floor:
+                    fire_time = self._seek(timer, fire_time, floor)
+            if self.coalesce and fire_time < now:
+                fire_time = self._coalesce(timer, fire_time, now)
+        except StopIteration:
+            fire_time = None
+        self.next_fire_time = fire_time
+        self._save()
+        return fire_time
+
+    def _coalesce(
+        self, timer: Iterator[datetime], fire_time: datetime, now: datetime
+    ) -> datetime:
+        """将早于 now 的多个错过的时间合并为其中最后一个, 之后的首个时间暂存于 _pending.
+        计时器在此期间耗尽时, 合并得到的时间仍会执行一次."""
+        self._pending = None
+        for following in timer:
+            if following >= now:
+                self._pending = following
+                break
+            fire_time = following
+        return fire_time
+
+    def _plan_retry(self, timer: Iterator[datetime]) -> Optional[datetime]:
+        """若待进行的重试早于下一次常规执行, 则将其作为下一次执行的计划时间."""
+        if self._pending is None:
+            try:  # 取出的常规执行时间暂存于 _pending, 稍后仍按 misfire 策略处理
+                self._pending = next(timer)
+            except StopIteration:
+                pass
+        retry_at, attempt = self._retry  # type: ignore
+        if self._pending is not None and self._pending < retry_at:
+            return None
+        self._retry = None
+        self._fire_attempt = attempt
+        self.next_fire_time = retry_at
+        self._save()
+        return retry_at
+
+    def _replan(self) -> None:
+        """放弃正在等待的计划, 使其与新的候选时间一同重新排序."""
+        if self.is_sleeping and self._pending is None:
+            self._pending = self.next_fire_time
+        if self.engine is not None:
+            self.engine.requeue(self)
+        else:
+            self._interrupt()
+
+    def next_sleep_interval(self) -> Optional[float]:
+        """取出距下一次执行需要等待的秒数, 计时器耗尽或任务已停止时返回 None.
+
+        plan 取得的 spread 与 jitter 偏移在此叠加到计划时间上;
+        next_fire_time 仍为计时器给出的原始时间.
+        """
+        fire_time = self.plan()
+        if fire_time is None:
+            return None
+        delay = (fire_time - self.clock.now()).total_seconds() + self._fire_offset
+        return max(delay, 0.0)
+
     def sleep_interval_generator(self) -> Generator[float, None, None]:
-        for next_execute_time in self.timer:
-            if self.stopped:
-                return
-            now = datetime.now()
-            if next_execute_time >= now:
-                yield (next_execute_time - now).total_seconds()
+        interval = self.next_sleep_interval()
+        while interval is not None:
+            yield interval
+            interval = self.next_sleep_interval()
 
     def coroutine_generator(self) -> Generator[Tuple[Awaitable[Any], bool], None, None]:
         for sleep_interval in self.sleep_interval_generator():
             yield (asyncio.sleep(sleep_interval), True)
-            yield (
-                self.broadcast.Executor(
-                    target=ExecTarget(
-                        callable=self.target,
-                        inline_dispatchers=self.dispatchers,
-                        decorators=self.decorators,
-                    ),
-                ),
-                False,
+            yield (self.execute(), False)
+
+    async def execute(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        fire_time: Optional[datetime] = None,
+        attempt: int = 1,
+    ) -> None:
+        """通过 Broadcast 执行一次本任务, 并处理执行过程中抛出的异常.
+
+        Args:
+            semaphore (Optional[asyncio.Semaphore], optional): 执行前需要获取的信号量. 默认为 None.
+            fire_time (Optional[datetime], optional): 本次执行的计划时间, 用于记录开始执行的延迟. 默认为 None.
+            attempt (int, optional): 本次执行是同一次计划的第几次尝试, 用于重试策略. 默认为 1.
+        """
+        if semaphore is not None:
+            async with semaphore:
+                return await self.execute(fire_time=fire_time, attempt=attempt)
+        if self.limiter is None:
+            return await self._execute(fire_time, attempt)
+        await self.limiter.acquire(self.priority, self.group)
+        try:
+            await self._execute(fire_time, attempt)
+        finally:
+            self.limiter.release(self.group)
+
+    async def _execute_locked(
+        self,
+        semaphore: Optional[asyncio.Semaphore],
+        fire_time: datetime,
+        planned: datetime,
+        attempt: int,
+    ) -> None:
+        """仅在获得本次计划执行的租约时执行, 使多个进程中的同一任务每次只执行一次."""
+        key = f"{self.id}@{fire_time.isoformat()}"
+        if await self.lock.acquire(key):  # type: ignore
+            await self.execute(semaphore, planned, attempt)
+        else:
+            self.metrics.skipped += 1
+
+    async def _execute(self, fire_time: Optional[datetime], attempt: int = 1) -> None:
+        metrics = self.metrics
+        metrics.fires += 1
+        if fire_time is not None:
+            metrics.lateness.observe(
+                max((self.clock.now() - fire_time).total_seconds(), 0.0)
             )
+        hooks = self.hooks
+        if hooks is not None and hooks.active:
+            exception = await self._execute_hooked(hooks, fire_time)
+        else:
+            start = self.loop.time()
+            try:
+                exception = await self._execute_bounded()
+            finally:
+                metrics.duration.observe(self.loop.time() - start)
+        if exception is not None and self.retry is not None:
+            self._schedule_retry(exception, attempt)
+
+    async def _execute_hooked(
+        self, hooks: ExecutionHooks, fire_time: Optional[datetime]
+    ) -> Optional[BaseException]:
+        context = ExecutionContext(self, fire_time, self.clock.now())
+        await hooks.on_before(context)
+        start = self.loop.time()
+        try:
+            context.exception = await self._execute_bounded()
+        except asyncio.CancelledError as e:
+            context.exception = e
+            raise
+        finally:
+            context.duration = self.loop.time() - start
+            self.metrics.duration.observe(context.duration)
+            await hooks.on_after(context)
+        return context.exception
+
+    def _schedule_retry(self, exception: BaseException, attempt: int) -> None:
+        """按重试策略在稍后安排一次额外的执行, 由 plan 取出."""
+        retry = self.retry
+        if self.stopped or retry is None or not retry.should_retry(exception, attempt):
+            return
+        delay = retry.delay(attempt)
+        retry_at = self.clock.now() + timedelta(seconds=delay)
+        if self._retry is not None and self._retry[0] <= retry_at:
+            return
+        self._retry = (retry_at, attempt + 1)
+        self.metrics.retries += 1
+        self._replan()
+
+    async def _execute_bounded(self) -> Optional[BaseException]:
+        if self.timeout is None:
+            return await self._dispatch()
+        dispatch = self.loop.create_task(self._dispatch())
+        try:
+            done, _ = await asyncio.wait({dispatch}, timeout=self.timeout)
+        except asyncio.CancelledError:
+            dispatch.cancel()
+            raise
+        if done:
+            return dispatch.result()
+        self.metrics.timeouts += 1
+        if self.cancelable:
+            dispatch.cancel()
+        else:  # 无法取消的执行会被放弃, 在后台继续运行直至结束
+            self.abandoned.add(dispatch)
+            dispatch.add_done_callback(self.abandoned.discard)
+        await self.broadcast.postEvent(
+            SchedulerTaskTimeout(self, self.timeout, self.cancelable)
+        )
+        return asyncio.TimeoutError()
+
+    async def _dispatch(self) -> Optional[Exception]:
+        try:
+            await self.broadcast.Executor(target=self.exec_target)
+        except (ExecutionStop, PropagationCancelled):
+            pass
+        except Exception as e:
+            self.metrics.failures += 1
+            traceback.print_exc()
+            await self.broadcast.postEvent(ExceptionThrown(e, None))
+            return e
+
+    def spawn(self, semaphore: Optional[asyncio.Semaphore] = None) -> asyncio.Task:
+        """以 asyncio.Task 的形式开始一次执行, 并记录在 executions 中直至其结束."""
+        fire_time = self.last_fire_time = self.next_fire_time
+        self._save()
+        attempt = self._fire_attempt
+        if fire_time is None:
+            execution = self.loop.create_task(self.execute(semaphore, None, attempt))
+        else:
+            planned = fire_time + timedelta(seconds=self._fire_offset)
+            if self.lock is None:
+                coro = self.execute(semaphore, planned, attempt)
+            else:  # 租约以原始的计划时间为键, 即使各进程的 jitter 不同也能互斥
+                coro = self._execute_locked(semaphore, fire_time, planned, attempt)
+            execution = self.loop.create_task(coro)
+        if self.executions is _NO_EXECUTIONS:
+            self.executions = set()
+        self.executions.add(execution)
+        execution.add_done_callback(self.executions.discard)
+        return execution
+
+    def cancel_executions(self) -> None:
+        for execution in self.executions:
+            execution.cancel()
+
+    async def _sleep(self, delay: float) -> bool:
+        """休眠 delay 秒, 可被 pause 或 reschedule 打断.
+
+        Returns:
+            bool: 是否正常到期; 被打断时为 False.
+        """
+        self._waiter = self.loop.create_future()
+        handle = self.loop.call_later(delay, _resolve, self._waiter, True)
+        try:
+            return await self._waiter
+        finally:
+            handle.cancel()
+            self._waiter = None
+
+    def _interrupt(self) -> None:
+        if self._waiter is not None:
+            _resolve(self._waiter, False)
 
     @print_track_async
     async def run(self) -> None:
         if self.run_record.entered:
             raise AlreadyStarted("the scheduler task has been started!")
         with self.run_record:
-            for coro, waiting in self.coroutine_generator():
-                if waiting:  # 是否为 asyncio.sleep 的 coro
+            while True:
+                try:
+                    if self.paused and not self.stopped:
+                        self._resumed = self.loop.create_future()
+                        await self._resumed
+                        continue
+                    sleep_interval = self.next_sleep_interval()
+                    if sleep_interval is None:
+                        return
                     with self.sleep_record:
-                        try:
-                            await coro
+                        if not await self._sleep(sleep_interval):
                             continue
-                        except asyncio.CancelledError:
-                            return
-                try:
-                    await (coro if self.cancelable else asyncio.shield(coro))
                 except asyncio.CancelledError:
                     if self.cancelable:
+                        self.cancel_executions()
+                    return
+                self.spawn()
+                if len(self.executions) < self.max_instances:
+                    continue
+                try:  # 同时执行的数量已达上限, 等待任意一次执行结束后再取下一次的时间
+                    await asyncio.wait(
+                        self.executions, return_when=asyncio.FIRST_COMPLETED
+                    )
+                except asyncio.CancelledError:
+                    if self.cancelable:
+                        self.cancel_executions()
                         return
                     raise
-                except (ExecutionStop, PropagationCancelled):
-                    pass
-                except Exception as e:
-                    traceback.print_exc()
-                    await self.broadcast.postEvent(ExceptionThrown(e, None))
 
+    @_on_own_loop
+    def pause(self) -> None:
+        """暂停本任务; 暂停期间不会开始新的执行, 已在进行的执行不受影响.
+
+        尚未到期的下一次执行时间会被保留, 恢复时若已错过, 则按 misfire 策略处理.
+        """
+        if self.paused:
+            return
+        self.paused = True
+        self._replan()
+
+    @_on_own_loop
+    def resume(self) -> None:
+        """恢复被暂停的任务."""
+        if not self.paused:
+            return
+        self.paused = False
+        if self.engine is not None:
+            self.engine.release(self)
+        elif self._resumed is not None:
+            _resolve(self._resumed, None)
+
+    @_on_own_loop
+    def reschedule(self, timer: Timer) -> None:
+        """替换本任务的计时器, 立即按新的计时器重新计划下一次执行.
+
+        Args:
+            timer (Timer): 新的计时器.
+        """
+        self._bind(timer)
+        self._timer_iter = None
+        self._pending = None
+        self.next_fire_time = None
+        if self.engine is not None:
+            self.engine.requeue(self)
+        else:
+            self._interrupt()
+
+    @_on_own_loop
+    def finish(self) -> None:
+        """停止计划新的执行, 但不取消正在进行的执行; 正在等待的任务会立即结束等待并退出."""
+        self.stopped = True
+        if self.engine is not None:
+            self.engine.discard(self, cancel=False)
+            return
+        self._interrupt()
+        if self._resumed is not None:
+            _resolve(self._resumed, None)
+
+    @_on_own_loop
     def stop_gen_interval(self) -> None:
         if not self.stopped:
             self.stopped = True
@@ -132,8 +777,42 @@ class SchedulerTask:
         if self.task:
             await self.task
         self.task = None
+        if self.executions:
+            await asyncio.wait(self.executions)
 
+    @_on_own_loop
     def stop(self):
         """停止当前 SchedulerTask."""
-        if self.task and not self.task.cancelled():
+        if self.engine is not None:
+            self.engine.discard(self)
+        elif self.task and not self.task.cancelled():
             self.task.cancel()
+
+
+async def drain(
+    tasks: Iterable[SchedulerTask], timeout: Optional[float] = None
+) -> List[SchedulerTask]:
+    """平滑地停止一组计划任务: 不再开始新的执行, 等待正在进行的执行 (包括超时后被放弃的执行) 至多 timeout 秒,
+    然后取消仍未结束的执行, 无论任务是否 cancelable. 须在任务所属的事件循环中运行.
+
+    Args:
+        tasks (Iterable[SchedulerTask]): 计划任务.
+        timeout (Optional[float], optional): 等待的最长秒数. 默认为 None, 即一直等待.
+
+    Returns:
+        List[SchedulerTask]: 有执行被取消 (即被中断) 的任务.
+    """
+    owners: Dict[asyncio.Future, SchedulerTask] = {}
+    for task in tasks:
+        task.finish()
+        for execution in (*task.executions, *(task._abandoned or ())):
+            owners[execution] = task
+    if not owners:
+        return []
+    _, pending = await asyncio.wait(owners, timeout=timeout)
+    if not pending:
+        return []
+    for execution in pending:
+        execution.cancel()
+    await asyncio.wait(pending, timeout=_CANCEL_GRACE)  # 不响应取消的执行不再等待
+    return list({owners[execution]: None for execution in pending})
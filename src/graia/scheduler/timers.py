@@ -1,123 +1,743 @@
 """该模块提供一些便捷的 Timer"""
 
-from datetime import datetime, timedelta
-from typing import Generator, Optional
+import copy
+import math
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Iterator, Literal, Optional, Tuple, TypeVar
 
 from croniter import croniter
 
+from graia.scheduler.clock import Clock, system_clock
+from graia.scheduler.cron import CronPattern, compile_cron
+from graia.scheduler.tz import (
+    EPOCH,
+    TimeZone,
+    ZoneTable,
+    from_clock,
+    get_zone,
+    to_clock,
+    wall_seconds,
+    zone_table,
+)
 from graia.scheduler.utilles import TimeObject, to_datetime
 
-Ret = Generator[datetime, None, None]
+FixedMode = Literal["rate", "delay"]
 
+_DAY = timedelta(days=1)
+_TICK = timedelta(microseconds=1)
 
-def every(*, base: Optional[TimeObject] = None, **kwargs) -> Ret:
-    """一个简便的 datetime 生成器.
+T_SeekableTimer = TypeVar("T_SeekableTimer", bound="SeekableTimer")
+T_CronTimer = TypeVar("T_CronTimer", bound="CronTimer")
 
-    Args:
-        base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
 
-    Yields:
-        (datetime): 生成的 datetime.
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())
+    )
+
+
+class SeekableTimer(Iterator[datetime]):
+    """可快进的计时器基类.
+
+    除了像普通 Timer 一样被迭代外, 还提供 seek 方法,
+    使 SchedulerTask 在计时器落后于当前时间时无需逐个丢弃已经过去的时间.
+
+    jitter 与 spread 不改变计时器给出的时间, 而是由 SchedulerTask 在等待时叠加:
+    spread 为由任务 id 的哈希决定的 [0, spread) 秒的固定偏移, jitter 为每次重新随机的 [0, jitter] 秒的偏移.
+    二者用于错开大量在同一时刻触发的任务, 应小于相邻两次执行的间隔.
+
+    指定了 tz 的计时器在该时区的墙上时间上计算, 给出的仍是计划器时钟所用的本地时间 (不带时区).
+    """
+
+    __slots__ = ()
+
+    jitter: float = 0.0
+    spread: float = 0.0
+
+    def _set_offsets(self, jitter: float, spread: float) -> None:
+        if jitter < 0 or spread < 0:
+            raise ValueError("jitter and spread must not be negative")
+        self.jitter = jitter
+        self.spread = spread
+
+    def __iter__(self) -> "SeekableTimer":
+        return self
+
+    def clone(self: T_SeekableTimer) -> T_SeekableTimer:
+        """复制计时器的当前状态; 推进副本不会影响本计时器."""
+        if hasattr(self, "__dict__"):
+            return copy.copy(self)
+        clone = object.__new__(type(self))
+        for name in _slot_names(type(self)):
+            try:
+                setattr(clone, name, getattr(self, name))
+            except AttributeError:  # 未赋值的 slot
+                pass
+        return clone
+
+    def preview(
+        self, start: datetime, after: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        """按顺序生成本计时器之后给出的不早于 start 的时间, 不改变本计时器的状态.
+
+        Args:
+            start (datetime): 起始时间.
+            after (Optional[datetime], optional): 上一次从本计时器取出的时间,
+                供相对于当前时间推算的计时器以此为起点. 默认为 None.
+
+        Returns:
+            Iterator[datetime]: 惰性的时间序列.
+        """
+        clone = self.clone()
+        try:
+            value = clone.seek(start)
+        except StopIteration:
+            return
+        yield value
+        yield from clone
+
+    def __next__(self) -> datetime:
+        raise NotImplementedError
+
+    def seek(self, t: datetime) -> datetime:
+        """跳过所有早于 t 的时间, 返回首个不早于 t 的时间.
+
+        Args:
+            t (datetime): 目标时间.
+
+        Returns:
+            datetime: 首个不早于 t 的时间, 计时器状态会推进至该时间.
+        """
+        while True:
+            value = next(self)
+            if value >= t:
+                return value
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """本计时器在 [start, end) 中给出的时间的个数, 不改变本计时器的状态.
+
+        用于统计快进时跳过的执行次数. 基类无法重新推算已经给出的时间, 只计入 start 本身.
+
+        Args:
+            start (datetime): 本计时器给出过的时间.
+            end (datetime): 本计时器在 start 之后给出的时间.
+
+        Returns:
+            int: 时间的个数, 至少为 1.
+        """
+        return 1
+
+
+class IntervalTimer(SeekableTimer):
+    """按固定时间间隔生成 datetime 的计时器, 快进时直接通过算术跳过.
+
+    fixed 参数决定了间隔的计算方式:
+
+    - None (默认): 指定 base 时在墙上时钟上以 base 为起点推算, 否则相对于每次取值时的当前时间推算.
+    - "rate": 固定频率. 所有执行时间都位于以单调时钟 (与 loop.time 一致) 为准的固定网格上,
+        执行耗时不会导致漂移, 系统时间被调整也不会影响间隔.
+    - "delay": 固定延迟. 每次取值 (即上一次执行结束后) 再等待一个完整的间隔.
+
+    指定 tz 时 base 为该时区的时间. 以 base 推算且间隔为整数天时, 执行时间固定在该时区的同一墙上时间,
+    不随夏令时漂移: 当天被跳过的时刻在变化发生时执行, 重复出现的时刻只执行第一次;
+    其他间隔按实际经过的时间推算.
     """
-    if base is None:
+
+    __slots__ = (
+        "interval",
+        "base",
+        "current",
+        "fixed",
+        "clock",
+        "origin",
+        "index",
+        "tz",
+        "jitter",
+        "spread",
+        "_wall",
+    )
+
+    interval: timedelta
+    base: Optional[TimeObject]
+    current: Optional[datetime]
+    fixed: Optional[FixedMode]
+    clock: Clock
+    origin: Optional[float]
+    index: int
+    tz: Optional[tzinfo]
+
+    def __init__(
+        self,
+        interval: timedelta,
+        base: Optional[TimeObject] = None,
+        fixed: Optional[FixedMode] = None,
+        jitter: float = 0.0,
+        spread: float = 0.0,
+        tz: Optional[TimeZone] = None,
+    ) -> None:
+        """初始化
+
+        Args:
+            interval (timedelta): 时间间隔.
+            base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
+            fixed (Optional[Literal["rate", "delay"]], optional): 固定频率或固定延迟模式, 默认为 None.
+            jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+            spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒). 默认为 0.
+            tz (Optional[TimeZone], optional): 时区名或 tzinfo, 如 "Asia/Shanghai".
+                默认为 None, 即本地时间.
+        """
+        if interval <= timedelta(0):
+            raise ValueError("interval must be positive")
+        if fixed not in (None, "rate", "delay"):
+            raise ValueError(f"unknown fixed mode: {fixed!r}")
+        self.interval = interval
+        self.base = base
+        self.fixed = fixed
+        self.clock = system_clock
+        self.origin = None
+        self.index = -1
+        self.tz = None if tz is None else get_zone(tz)
+        self._resolve_base()
+        self._set_offsets(jitter, spread)
+
+    def _resolve_base(self) -> None:
+        self.current = self._wall = None
+        if self.base is None:
+            return
+        if self.tz is None:
+            self.current = to_datetime(self.base, self.clock)
+            return
+        wall = to_datetime(self.base, self.clock, self.tz)
+        self.current = to_clock(zone_table(self.tz).from_wall(wall))
+        if self.fixed is None and not self.interval % _DAY:
+            self._wall = wall
+
+    def bind(self, clock: Clock) -> None:
+        """绑定计时器使用的时钟, 尚未开始取值时 base 会按该时钟重新解析.
+
+        Args:
+            clock (Clock): 时钟, SchedulerTask 会绑定为计划器的时钟.
+        """
+        self.clock = clock
+        if self.base is not None and self.index < 0 and self.origin is None:
+            self._resolve_base()
+
+    @property
+    def relative(self) -> bool:
+        """下一次取值是否相对于取值时的当前时间推算, 即执行时间取决于此前的执行何时进行."""
+        return self.fixed != "rate" and (
+            self.current is None or self.fixed == "delay" and self.index >= 0
+        )
+
+    def preview(
+        self, start: datetime, after: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        """同 SeekableTimer.preview. 快进一次后按间隔直接累加, 不再逐个取值;
+        相对于当前时间推算时, 假定每次执行都在计划时间进行, 从 after 起每隔一个间隔取一次.
+        """
+        clone = self.clone()
+        step = self.interval
+        if clone.relative:
+            value = after if after is not None else clone.clock.now()
+            value += step * max(
+                1, -((value - start) // step)
+            )  # 首个不早于 start 的时间
+        else:
+            value = clone.seek(start)
+            if (
+                clone.tz is not None and clone.fixed is None
+            ):  # 带时区的网格按实际经过的时间或墙上时间推算
+                yield value
+                yield from clone
+                return
         while True:
-            yield datetime.now() + timedelta(**kwargs)
-    else:
-        current = to_datetime(base)
+            yield value
+            value += step
+
+    def _deadline_to_datetime(self, index: int) -> datetime:
+        self.index = index
+        deadline = self.origin + index * self.interval.total_seconds()  # type: ignore
+        return self.clock.now() + timedelta(seconds=deadline - self.clock.time())
+
+    def _start_rate(self) -> None:
+        first = (
+            self.interval
+            if self.current is None
+            else self.current + self.interval - self.clock.now()
+        )
+        self.origin = self.clock.time() + first.total_seconds()
+
+    def __next__(self) -> datetime:
+        if self.fixed == "rate":
+            if self.origin is None:
+                self._start_rate()
+            return self._deadline_to_datetime(self.index + 1)
+        if self.current is None or self.fixed == "delay" and self.index >= 0:
+            return self.clock.now() + self.interval
+        self.index = 0
+        if self._wall is not None:
+            self._wall += self.interval
+            table = zone_table(self.tz)  # type: ignore
+            self.current = to_clock(table.from_wall(self._wall))
+        else:
+            self.current = self._add(self.current, 1)
+        return self.current
+
+    def _add(self, value: datetime, steps: int) -> datetime:
+        if self.tz is None:
+            return value + self.interval * steps
+        # 带时区时按实际经过的时间推算, 不受本地时间夏令时的影响
+        return to_clock(from_clock(value) + (self.interval * steps).total_seconds())
+
+    def restore(self, t: datetime) -> None:
+        """从持久化的执行时间 t 继续: 以 base 推算的计时器下一次取值将位于 t 之后的网格上,
+        相对于当前时间推算的计时器则不受影响.
+
+        Args:
+            t (datetime): 此前计划的执行时间.
+        """
+        if self.fixed is None and self.current is not None:
+            self.current = t
+            if self._wall is not None:
+                self._wall = zone_table(self.tz).to_wall(from_clock(t))  # type: ignore
+
+    def seek(self, t: datetime) -> datetime:
+        if self.fixed == "rate":
+            if self.origin is None:
+                self._start_rate()
+            origin = self.origin
+            assert origin is not None
+            target = self.clock.time() + (t - self.clock.now()).total_seconds()
+            seconds = self.interval.total_seconds()
+            index = max(self.index + 1, math.ceil((target - origin) / seconds))
+            if origin + index * seconds < target:  # 浮点误差
+                index += 1
+            return self._deadline_to_datetime(index)
+        grid = self.current is not None and self.index < 0 or self.fixed is None
+        value = next(self)
+        if value < t:
+            # ceil((t - value) / interval), 精确的整数运算
+            steps = -((value - t) // self.interval)
+            if grid and self._wall is not None:
+                table = zone_table(self.tz)  # type: ignore
+                self._wall += self.interval * steps
+                value = to_clock(table.from_wall(self._wall))
+                while value < t:  # 跨越夏令时变化时可能还差一个间隔
+                    self._wall += self.interval
+                    value = to_clock(table.from_wall(self._wall))
+            else:
+                value = self._add(value, steps)
+            if self.current is not None and grid:
+                self.current = value
+        return value
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """同 SeekableTimer.count_between, 按间隔直接计算."""
+        if self.tz is None:
+            elapsed = (end - start).total_seconds()
+        else:  # 按实际经过的时间计算; 墙上时间网格的夏令时偏差由四舍五入消去
+            elapsed = from_clock(end) - from_clock(start)
+        return max(1, round(elapsed / self.interval.total_seconds()))
+
+
+class CronTimer(SeekableTimer):
+    """使用类似 crontab 的时间模式生成 datetime 的计时器.
+
+    优先使用 graia.scheduler.cron 中编译并缓存的表达式;
+    对于其不支持的语法 (如 `#`, `W`), 回退到 croniter.
+
+    指定 tz 时, 模式在该时区的墙上时间上匹配, 并按如下方式处理夏令时:
+
+    - 被跳过的时刻 (如 02:30) 上的执行在变化发生时 (03:00) 进行一次.
+    - 重复出现的时刻只在第一次出现时执行; 但每小时都匹配的模式 (小时字段为 `*`) 按实际经过的时间照常执行.
+    """
+
+    __slots__ = (
+        "pattern",
+        "base",
+        "current",
+        "compiled",
+        "clock",
+        "tz",
+        "jitter",
+        "spread",
+        "_iter",
+        "_repeat",
+    )
+
+    pattern: str
+    base: Optional[TimeObject]
+    current: Optional[datetime]
+    compiled: Optional[CronPattern]
+    clock: Clock
+    tz: Optional[tzinfo]
+
+    def __init__(
+        self,
+        pattern: str,
+        base: Optional[TimeObject] = None,
+        jitter: float = 0.0,
+        spread: float = 0.0,
+        tz: Optional[TimeZone] = None,
+    ) -> None:
+        """初始化
+
+        Args:
+            pattern (str): 时间模式
+            base (Optional[TimeObject], optional): 开始时间. 默认为首次取值时时钟的当前时间.
+            jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+            spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒). 默认为 0.
+            tz (Optional[TimeZone], optional): 时区名或 tzinfo, 如 "Asia/Shanghai".
+                默认为 None, 即本地时间.
+        """
+        self.pattern = pattern
+        self.base = base
+        self.current = None
+        self.clock = system_clock
+        self.tz = None if tz is None else get_zone(tz)
+        self._set_offsets(jitter, spread)
+        try:
+            self.compiled = compile_cron(pattern)
+            self._repeat = self.compiled.hours == (1 << 24) - 1
+        except ValueError:
+            self.compiled = None
+            self._iter = croniter(pattern, datetime.now())  # 同时校验表达式
+            self._repeat = self._iter.expanded[1] == ["*"]
+
+    def bind(self, clock: Clock) -> None:
+        """绑定计时器使用的时钟.
+
+        Args:
+            clock (Clock): 时钟, SchedulerTask 会绑定为计划器的时钟.
+        """
+        self.clock = clock
+
+    def _start(self) -> None:
+        if self.tz is not None and self.base:
+            wall = to_datetime(self.base, self.clock, self.tz)
+            self.current = to_clock(zone_table(self.tz).from_wall(wall))
+        else:
+            self.current = (
+                to_datetime(self.base, self.clock) if self.base else self.clock.now()
+            )
+        if self.compiled is None:
+            self._iter.set_current(self.current)
+
+    def clone(self: T_CronTimer) -> T_CronTimer:
+        clone = super().clone()
+        if self.compiled is None:
+            clone._iter = copy.deepcopy(self._iter)
+        return clone
+
+    def preview(
+        self, start: datetime, after: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        """同 SeekableTimer.preview. 不带时区的已编译表达式按天批量枚举匹配的时间."""
+        if self.tz is not None or self.compiled is None:
+            yield from super().preview(start, after)
+            return
+        # 与 seek 取得的首个时间相同, 但无需复制计时器
+        current = self.current
+        if current is None:
+            current = (
+                to_datetime(self.base, self.clock) if self.base else self.clock.now()
+            )
+        value = self.compiled.next(current if current >= start else start - _TICK)
+        yield value
+        yield from self.compiled.iterate(value)
+
+    def _match(self, wall: datetime) -> datetime:
+        if self.compiled is not None:
+            return self.compiled.next(wall)
+        return croniter(self.pattern, wall).get_next(datetime)
+
+    def _next_in_zone(self, timestamp: float) -> float:
+        """求严格晚于 timestamp 的下一次执行的时间戳.
+
+        在偏移变化表的各段内, 墙上时间与时间戳只差一个固定的偏移, 因此匹配只需在墙上时间上进行;
+        匹配结果超出当前段时, 再按夏令时的规则转入下一段.
+        """
+        table: ZoneTable = zone_table(self.tz)  # type: ignore
+        index = table.segment(timestamp)
+        offset = table.offsets[index]
+        wall = self._match(EPOCH + timedelta(seconds=timestamp + offset))
         while True:
-            current += timedelta(**kwargs)
-            yield current
+            end = table.starts[index + 1]
+            if wall_seconds(wall) - offset < end:
+                return wall_seconds(wall) - offset
+            table.segment(end)  # 确保下一段之后还有一段
+            index += 1
+            following = table.offsets[index]
+            if following > offset and wall_seconds(wall) < end + following:
+                return end  # 匹配落在被跳过的墙上时间中
+            if following < offset and self._repeat:
+                wall = self._match(EPOCH + timedelta(seconds=end + following) - _TICK)
+            offset = following
+
+    def __next__(self) -> datetime:
+        if self.current is None:
+            self._start()
+        current = self.current
+        assert current is not None
+        if self.tz is not None:
+            self.current = to_clock(self._next_in_zone(from_clock(current)))
+        elif self.compiled is not None:
+            self.current = self.compiled.next(current)
+        else:
+            self.current = self._iter.get_next(datetime)
+        return self.current
+
+    def restore(self, t: datetime) -> None:
+        """从持久化的执行时间 t 继续, 下一次取值为 t 之后的首个匹配时间.
+
+        Args:
+            t (datetime): 此前计划的执行时间.
+        """
+        self.current = t
+        if self.compiled is None:
+            self._iter.set_current(t)
+
+    def seek(self, t: datetime) -> datetime:
+        if self.current is None:
+            self._start()
+        if self.current >= t:  # type: ignore
+            return next(self)
+        if self.tz is not None:
+            self.current = to_clock(self._next_in_zone(from_clock(t) - 0.5))
+            return self.current
+        if self.compiled is not None:
+            self.current = self.compiled.next(t - timedelta(microseconds=1))
+            return self.current
+        # croniter 总是返回严格晚于起点的时间, 且会舍弃起点的亚秒部分
+        self._iter.set_current(t - timedelta(seconds=1))
+        return super().seek(t)
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """同 SeekableTimer.count_between, 从 start 起逐个取值计数."""
+        if self.tz is None and self.compiled is not None:
+            times: Iterator[datetime] = self.compiled.iterate(start)
+        else:
+            clone = self.clone()
+            clone.restore(start)
+            times = clone
+        count = 1
+        for value in times:
+            if value >= end:
+                break
+            count += 1
+        return count
+
+
+def every(
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+    **kwargs,
+) -> IntervalTimer:
+    """一个简便的 datetime 生成器.
+
+    Args:
+        base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
+    """
+    return IntervalTimer(timedelta(**kwargs), base, fixed, jitter, spread, tz)
 
 
-def every_second(*, base: Optional[TimeObject] = None) -> Ret:
+def every_second(
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每秒钟执行一次
 
     Args:
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(seconds=1, base=base)
+    return every(seconds=1, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz)
 
 
-def every_minute(*, base: Optional[TimeObject] = None) -> Ret:
+def every_minute(
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每分钟执行一次.
 
     Args:
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(minutes=1, base=base)
+    return every(minutes=1, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz)
 
 
-def every_hour(*, base: Optional[TimeObject] = None):
+def every_hour(
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每小时执行一次.
 
     Args:
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(hours=1, base=base)
+    return every(hours=1, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz)
 
 
 every_hours = every_hour  # Backward compatibility
 
 
-def every_custom_seconds(seconds: int, *, base: Optional[TimeObject] = None) -> Ret:
+def every_custom_seconds(
+    seconds: int,
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每 seconds 秒执行一次
 
     Args:
         seconds (int): 距离下一次执行的时间间隔, 单位为秒
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(seconds=seconds, base=base)
-
-
-def every_custom_minutes(minutes: int, *, base: Optional[TimeObject] = None) -> Ret:
+    return every(
+        seconds=seconds, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz
+    )
+
+
+def every_custom_minutes(
+    minutes: int,
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每 minutes 分执行一次
 
     Args:
         minutes (int): 距离下一次执行的时间间隔, 单位为分
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(minutes=minutes, base=base)
-
-
-def every_custom_hours(hours: int, *, base: Optional[TimeObject] = None) -> Ret:
+    return every(
+        minutes=minutes, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz
+    )
+
+
+def every_custom_hours(
+    hours: int,
+    *,
+    base: Optional[TimeObject] = None,
+    fixed: Optional[FixedMode] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> IntervalTimer:
     """每 hours 小时执行一次
 
     Args:
         hours (int): 距离下一次执行的时间间隔, 单位为小时
         base (Optional[TimeObject], optional): 若为 None (默认), 则会相对于当前时间推算. 否则基于 base 推算.
-
-    Yields:
-        (datetime): 生成的 datetime.
+        fixed (Optional[FixedMode], optional): "rate" 为固定频率, "delay" 为固定延迟,
+            详见 IntervalTimer. 默认为 None.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 IntervalTimer.
+            默认为 None, 即本地时间.
+
+    Returns:
+        IntervalTimer: 生成 datetime 的计时器.
     """
-    yield from every(hours=hours, base=base)
-
-
-def crontabify(pattern: str, base: Optional[TimeObject] = None) -> Ret:
+    return every(
+        hours=hours, base=base, fixed=fixed, jitter=jitter, spread=spread, tz=tz
+    )
+
+
+def crontabify(
+    pattern: str,
+    base: Optional[TimeObject] = None,
+    jitter: float = 0.0,
+    spread: float = 0.0,
+    tz: Optional[TimeZone] = None,
+) -> CronTimer:
     """使用类似 crontab 的方式生成计时器
 
     Args:
         pattern (str): 时间模式
-        base (Optional[TimeObject], optional): 开始时间. 默认为 datetime.now().
+        base (Optional[TimeObject], optional): 开始时间. 默认为首次取值时时钟的当前时间.
+        jitter (float, optional): 每次执行随机推迟的最大秒数. 默认为 0.
+        spread (float, optional): 按任务 id 固定推迟的时间窗口 (秒), 详见 SeekableTimer. 默认为 0.
+        tz (Optional[TimeZone], optional): 时区名或 tzinfo, 详见 CronTimer. 默认为 None, 即本地时间.
 
-    Yields:
-        (datetime): 生成的 datetime.
+    Returns:
+        CronTimer: 生成 datetime 的计时器.
     """
-    base = to_datetime(base) if base else datetime.now()
-    crontab_iter = croniter(pattern, base)
-    while True:
-        yield crontab_iter.get_next(datetime)
+    return CronTimer(pattern, base, jitter, spread, tz)
@@ -0,0 +1,158 @@
+"""时区支持: 预先计算的 UTC 偏移变化表, 以及墙上时间与时间戳之间的换算"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+TimeZone = Union[str, tzinfo]
+
+EPOCH = datetime(1970, 1, 1)
+_DAY = 86400.0
+_SCAN_STEP = _DAY
+
+
+def get_zone(tz: TimeZone) -> tzinfo:
+    """将时区名 (如 "Asia/Shanghai") 或 tzinfo 转换为 tzinfo.
+
+    Raises:
+        ImportError: Python 3.8 上未安装 backports.zoneinfo.
+    """
+    if isinstance(tz, tzinfo):
+        return tz
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:  # Python 3.8
+        try:
+            from backports.zoneinfo import ZoneInfo  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "time zone names require zoneinfo, please install graia-scheduler[tz]"
+            ) from None
+    return ZoneInfo(tz)
+
+
+def wall_seconds(wall: datetime) -> float:
+    """将不带时区的墙上时间视作 UTC, 转换为自纪元起的秒数."""
+    return (wall - EPOCH).total_seconds()
+
+
+def to_clock(timestamp: float) -> datetime:
+    """将时间戳转换为计划器时钟使用的本地时间 (不带时区)."""
+    return datetime.fromtimestamp(timestamp)
+
+
+def from_clock(value: datetime) -> float:
+    """将计划器时钟使用的本地时间 (或带时区的时间) 转换为时间戳."""
+    return value.timestamp()
+
+
+class ZoneTable:
+    """某个时区的 UTC 偏移变化表.
+
+    变化点按年惰性计算: 先以一天为步长扫描 utcoffset, 再二分至秒. 之后求任意时刻的偏移只需一次二分查找,
+    不再调用 tzinfo, 因此跨越夏令时的计时器求下一次执行时间的开销与不带时区时相近.
+    相隔不足一天的两次偏移变化 (历史上极少见) 会被忽略.
+    """
+
+    zone: tzinfo
+    starts: List[float]
+    """各段的起始时间戳, 升序."""
+    offsets: List[float]
+    """各段的 UTC 偏移 (秒)."""
+    first_year: int
+    last_year: int
+
+    def __init__(self, zone: tzinfo) -> None:
+        self.zone = zone
+        year = datetime.now().year
+        self.first_year = self.last_year = year
+        self.starts, self.offsets = self._scan(year)
+
+    def _offset(self, timestamp: float) -> float:
+        value = (
+            datetime.fromtimestamp(timestamp, timezone.utc)
+            .astimezone(self.zone)
+            .utcoffset()
+        )
+        return value.total_seconds() if value is not None else 0.0
+
+    def _scan(self, year: int) -> Tuple[List[float], List[float]]:
+        start = (datetime(year, 1, 1) - EPOCH).total_seconds()
+        end = (datetime(year + 1, 1, 1) - EPOCH).total_seconds()
+        starts, offsets = [start], [self._offset(start)]
+        current = start
+        while current < end:
+            following = min(current + _SCAN_STEP, end)
+            offset = self._offset(following)
+            if offset != offsets[-1]:
+                low, high = current, following  # 偏移在 (low, high] 内变化
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._offset(middle) == offset:
+                        high = middle
+                    else:
+                        low = middle
+                starts.append(high)
+                offsets.append(offset)
+            current = following
+        return starts, offsets
+
+    def _extend(self, timestamp: float) -> None:
+        # 每年的第一段总是保留 (即使偏移未变), 因此 timestamp 早于最后一段的起点时, 其所在段之后必有下一段
+        while timestamp >= self.starts[-1]:
+            self.last_year += 1
+            starts, offsets = self._scan(self.last_year)
+            self.starts += starts
+            self.offsets += offsets
+        while timestamp < self.starts[0]:
+            self.first_year -= 1
+            starts, offsets = self._scan(self.first_year)
+            self.starts[:0] = starts
+            self.offsets[:0] = offsets
+
+    def segment(self, timestamp: float) -> int:
+        """返回 timestamp 所在的段的序号, 该段之后至少还有一段."""
+        if not self.starts[0] <= timestamp < self.starts[-1]:
+            self._extend(timestamp)
+        return bisect_right(self.starts, timestamp) - 1
+
+    def offset(self, timestamp: float) -> float:
+        """timestamp 时的 UTC 偏移 (秒)."""
+        return self.offsets[self.segment(timestamp)]
+
+    def to_wall(self, timestamp: float) -> datetime:
+        """时间戳对应的本时区墙上时间 (不带时区)."""
+        return EPOCH + timedelta(seconds=timestamp + self.offset(timestamp))
+
+    def from_wall(self, wall: datetime) -> float:
+        """本时区墙上时间对应的时间戳.
+
+        重复出现的墙上时间 (夏令时结束) 取第一次出现; 被跳过的墙上时间 (夏令时开始) 取变化发生的时刻,
+        如欧洲中部时间的 02:30 被视为 03:00.
+        """
+        seconds = wall_seconds(wall)
+        index = self.segment(seconds)
+        nearby = {
+            self.offsets[candidate]
+            for candidate in (index - 1, index, index + 1)
+            if candidate >= 0
+        }
+        candidates = [
+            seconds - offset
+            for offset in nearby
+            if self.offset(seconds - offset) == offset
+        ]
+        if candidates:
+            return min(candidates)
+        return self.starts[self.segment(seconds - self.offset(seconds - _DAY))]
+
+
+@lru_cache(maxsize=None)
+def _table(zone: tzinfo) -> ZoneTable:
+    return ZoneTable(zone)
+
+
+def zone_table(tz: TimeZone) -> ZoneTable:
+    """获取时区的偏移变化表, 同一时区共享同一个表."""
+    return _table(get_zone(tz))
@@ -1,5 +1,8 @@
 from datetime import datetime, time
-from typing import Union
+from typing import Any, Optional, Union, overload
+
+from .clock import Clock, system_clock
+from .tz import TimeZone, to_clock, zone_table
 
 
 class EnteredRecord:
@@ -13,6 +16,59 @@ class EnteredRecord:
         self.entered = False
 
 
+class Flag:
+    """读写宿主对象 _flags 位域中某一位的 bool 属性."""
+
+    __slots__ = ("bit",)
+
+    def __init__(self, bit: int) -> None:
+        self.bit = bit
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "Flag": ...
+
+    @overload
+    def __get__(self, instance: Any, owner: type) -> bool: ...
+
+    def __get__(self, instance: Any, owner: type) -> Union["Flag", bool]:
+        if instance is None:
+            return self
+        return bool(instance._flags & self.bit)
+
+    def __set__(self, instance: Any, value: bool) -> None:
+        if value:
+            instance._flags |= self.bit
+        else:
+            instance._flags &= ~self.bit
+
+
+class FlagRecord:
+    """与 EnteredRecord 用法相同, 但状态保存在宿主对象 _flags 位域中的某一位上, 宿主无需为其常驻一个对象."""
+
+    __slots__ = ("owner", "bit")
+
+    def __init__(self, owner: Any, bit: int) -> None:
+        self.owner = owner
+        self.bit = bit
+
+    @property
+    def entered(self) -> bool:
+        return bool(self.owner._flags & self.bit)
+
+    @entered.setter
+    def entered(self, value: bool) -> None:
+        if value:
+            self.owner._flags |= self.bit
+        else:
+            self.owner._flags &= ~self.bit
+
+    def __enter__(self) -> None:
+        self.entered = True
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.entered = False
+
+
 def print_track_async(func):
     async def wrapper(*args, **kwargs):
         try:
@@ -30,29 +86,47 @@ TimeObject = Union[datetime, time, str, float]
 
 def to_datetime(
     base: TimeObject,
+    clock: Optional[Clock] = None,
+    tz: Optional[TimeZone] = None,
 ) -> datetime:
-    """将适宜的对象转化为 datetime 类型.
+    """将适宜的对象转化为不带时区的 datetime.
 
     Args:
         base (TimeObject): 要转化的对象, 字符串应为 ISO 时间 / 日期格式, 浮点数为时间戳.
+        clock (Optional[Clock], optional): 仅给出时刻时, 用于确定日期的时钟. 默认为系统时钟.
+        tz (Optional[TimeZone], optional): 若提供, 结果为该时区的墙上时间, 仅给出时刻时使用该时区的当前日期.
+            默认为 None, 即计划器时钟所用的本地时间.
 
     Raises:
         ValueError: 字符串格式错误.
 
     Returns:
-        datetime: 转化成的 datetime.
+        datetime: 转化成的 datetime. 带时区的输入会被换算, 不带时区的输入视为已是目标时区的时间.
     """
-    start = datetime.now()
-    if isinstance(base, datetime):
-        return base
-    elif isinstance(base, time):
-        return datetime.fromisoformat(f"{start.date()} {base.isoformat()}")
-    elif isinstance(base, float):
-        return datetime.fromtimestamp(base)
-    else:
+    start = (clock or system_clock).now()
+    if tz is not None:
+        start = zone_table(tz).to_wall(start.timestamp())
+    if isinstance(base, time):
+        base = f"{start.date()} {base.isoformat()}"
+    elif isinstance(base, (int, float)):  # 类型注解中的 float 也接受 int
+        return (
+            zone_table(tz).to_wall(base)
+            if tz is not None
+            else datetime.fromtimestamp(base)
+        )
+    elif not isinstance(base, datetime):
         if "-" in base:  # Base is from datetime.isoformat()
-            return datetime.fromisoformat(base)
+            pass
         elif ":" in base:  # Base is from time.isoformat()
-            return datetime.fromisoformat(f"{start.date()} {base}")
+            base = f"{start.date()} {base}"
         else:
             raise ValueError("Expected an ISO style time string!")
+    if isinstance(base, str):
+        base = datetime.fromisoformat(base)
+    if base.tzinfo is None:
+        return base
+    return (
+        zone_table(tz).to_wall(base.timestamp())
+        if tz is not None
+        else to_clock(base.timestamp())
+    )
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+from croniter import croniter
+
+from graia.scheduler.cron import compile_cron
+
+BASE = datetime(2024, 1, 1)
+
+
+def _croniter_times(pattern: str, count: int):
+    iterator = croniter(pattern, BASE)
+    return [iterator.get_next(datetime) for _ in range(count)]
+
+
+def _compiled_times(pattern: str, count: int):
+    compiled = compile_cron(pattern)
+    value, result = BASE, []
+    for _ in range(count):
+        value = compiled.next(value)
+        result.append(value)
+    return result
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "0 9 13 * */1",
+        "0 9 13 * */2",
+        "0 9 */1 * 1",
+        "0 9 */2 * 1",
+        "0 9 */1 * */1",
+        "0 9 */3 * */2",
+        "0 9 1-31 * 5",
+        "0 9 13 * 0-6",
+        "0 9 13 * 0-7",
+        "0 9 13 * *",
+        "0 9 * * 1",
+        "0 9 13 * 5",
+    ],
+)
+def test_day_and_weekday_parity_with_croniter(pattern: str):
+    assert _compiled_times(pattern, 40) == _croniter_times(pattern, 40)
+
+
+def test_star_step_weekday_does_not_widen_day():
+    times = _compiled_times("0 9 13 * */1", 3)
+    assert [value.day for value in times] == [13, 13, 13]
+
+
+def test_question_mark_is_unrestricted():
+    assert _compiled_times("0 9 13 * ?", 5) == _compiled_times("0 9 13 * *", 5)
+    assert _compiled_times("0 9 ? * 1", 5) == _compiled_times("0 9 * * 1", 5)
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_drain_interrupts_executions_after_timeout(mode: Literal["task", "heap"]):
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock)
+    done: List[str] = []
+
+    async def quick():
+        await asyncio.sleep(3)
+        done.append("quick")
+
+    async def stuck():
+        await asyncio.sleep(1000)
+        done.append("stuck")
+
+    times = [START + timedelta(seconds=seconds) for seconds in (10, 20)]
+    scheduler.add_task(quick, times, id="quick")
+    scheduler.add_task(stuck, times, id="stuck", cancelable=False)
+    scheduler.add_task(stuck, times, id="stuck2", group="b")
+    scheduler.add_task(quick, [START + timedelta(hours=1)], id="idle")
+    scheduler.schedule_after(30, done.append, "oneshot")
+
+    async def main():
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(12)
+        interrupted = await scheduler.drain(5)
+        await runner
+        return interrupted
+
+    try:
+        interrupted = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    # 不再开始新的执行; 超时后无论是否 cancelable, 仍未结束的执行都被取消
+    assert sorted(task.id for task in interrupted) == ["stuck", "stuck2"]
+    assert done == ["quick"]
+    assert clock.now() == START + timedelta(seconds=17)
+    assert all(task.stopped for task in scheduler.schedule_tasks)
+
+
+def test_drain_without_timeout_waits_for_executions():
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+    done: List[datetime] = []
+
+    async def slow():
+        await asyncio.sleep(100)
+        done.append(clock.now())
+
+    scheduler.add_task(slow, [START + timedelta(seconds=10)], id="slow")
+
+    async def main():
+        runner = asyncio.create_task(scheduler.run(forever=True))
+        await asyncio.sleep(20)
+        interrupted = await scheduler.drain()
+        await runner
+        return interrupted
+
+    try:
+        assert loop.run_until_complete(main()) == []
+    finally:
+        loop.close()
+    assert done == [START + timedelta(seconds=110)]
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, List, Literal, Tuple
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.timers import IntervalTimer, crontabify
+
+START = datetime(2024, 1, 1)
+
+
+def _simulate(
+    mode: Literal["task", "heap"],
+    setup: Callable[[GraiaScheduler, List[Tuple[str, datetime]]], None],
+    duration: timedelta,
+    **options,
+) -> List[Tuple[str, datetime]]:
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock, **options)
+    fired: List[Tuple[str, datetime]] = []
+    setup(scheduler, fired)
+    loop.call_at(duration.total_seconds(), scheduler.stop)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    return fired
+
+
+def _recorder(fired: List[Tuple[str, datetime]], id: str, clock: VirtualClock):
+    return lambda: fired.append((id, clock.now()))
+
+
+def _mixed(scheduler: GraiaScheduler, fired: List[Tuple[str, datetime]]):
+    clock: VirtualClock = scheduler.clock  # type: ignore
+    timers = {
+        "hourly": crontabify("15 * * * *", START),
+        "weekdays": crontabify("*/20 9-17 * * 1-5", START),
+        "interval": IntervalTimer(timedelta(minutes=7), base=START),
+        "rate": IntervalTimer(timedelta(seconds=45), fixed="rate"),
+        "list": [START + timedelta(hours=hours) for hours in (1, 5, 30)],
+    }
+    for id, timer in timers.items():
+        scheduler.add_task(_recorder(fired, id, clock), timer, id=id)
+
+
+def test_heap_mode_fires_like_task_mode():
+    duration = timedelta(days=2)
+    heap = _simulate("heap", _mixed, duration)
+    task = _simulate("task", _mixed, duration)
+    assert sorted(heap) == sorted(task)
+    assert len(heap) > 4000
+
+
+def test_wakeup_tolerance_batches_without_firing_early():
+    def setup(scheduler: GraiaScheduler, fired: List[Tuple[str, datetime]]):
+        clock: VirtualClock = scheduler.clock  # type: ignore
+        for second in (1, 3, 9, 11):
+            times = [START + timedelta(seconds=second)]
+            scheduler.add_task(_recorder(fired, str(second), clock), times)
+
+    fired = _simulate("heap", setup, timedelta(minutes=1), wakeup_tolerance=5.0)
+    assert [(id, (time - START).total_seconds()) for id, time in fired] == [
+        ("1", 5.0),
+        ("3", 5.0),
+        ("9", 10.0),
+        ("11", 15.0),
+    ]
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_pause_resume_and_reschedule(mode: Literal["task", "heap"]):
+    def setup(scheduler: GraiaScheduler, fired: List[Tuple[str, datetime]]):
+        clock: VirtualClock = scheduler.clock  # type: ignore
+        task = scheduler.add_task(
+            _recorder(fired, "tick", clock), crontabify("* * * * *", START), id="tick"
+        )
+        loop = scheduler.loop
+        loop.call_at(150, task.pause)
+        loop.call_at(400, task.resume)
+        loop.call_at(500, task.reschedule, crontabify("*/5 * * * *", START))
+
+    fired = _simulate(mode, setup, timedelta(minutes=20))
+    assert [time - START for _, time in fired] == [
+        timedelta(minutes=minutes) for minutes in (1, 2, 7, 8, 10, 15)
+    ]
+
+
+def test_batch_concurrency_limits_one_wakeup():
+    running = 0
+    peak = 0
+
+    def setup(scheduler: GraiaScheduler, fired: List[Tuple[str, datetime]]):
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(1)
+            running -= 1
+
+        for index in range(10):
+            scheduler.add_task(job, [START + timedelta(seconds=1)], id=str(index))
+
+    _simulate("heap", setup, timedelta(minutes=1), batch_concurrency=3)
+    assert peak == 3
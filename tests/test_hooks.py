@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal, Tuple
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.event import SchedulerTaskFinished, SchedulerTaskStarted
+from graia.scheduler.hooks import ExecutionContext
+from graia.scheduler.task import SchedulerTask
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_hooks_see_each_execution(mode: Literal["task", "heap"]):
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    broadcast = Broadcast()
+    broadcast._loop = loop  # 执行失败时 ExceptionThrown 在 broadcast 的事件循环上广播
+    scheduler = GraiaScheduler(loop, broadcast, mode=mode, clock=clock)
+    calls: List[Tuple[str, str, ExecutionContext]] = []
+
+    @scheduler.before_execution
+    def before(context: ExecutionContext):
+        context.extra["span"] = context.id
+        calls.append(("before", context.id, context))
+
+    @scheduler.on_execution_error
+    async def error(context: ExecutionContext):
+        await asyncio.sleep(0)
+        calls.append(("error", context.id, context))
+
+    @scheduler.after_execution
+    def after(context: ExecutionContext):
+        calls.append(("after", context.extra["span"], context))
+
+    @scheduler.after_execution
+    def broken(context: ExecutionContext):
+        raise RuntimeError("钩子的异常不影响执行")
+
+    async def ok():
+        await asyncio.sleep(5)
+
+    def fail():
+        raise ValueError
+
+    fire = [START + timedelta(minutes=1)]
+    scheduler.add_task(ok, fire, id="ok")
+    scheduler.add_task(fail, [START + timedelta(minutes=2)], id="fail")
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert [(stage, id) for stage, id, _ in calls] == [
+        ("before", "ok"),
+        ("after", "ok"),
+        ("before", "fail"),
+        ("error", "fail"),
+        ("after", "fail"),
+    ]
+    ok_context, fail_context = calls[1][2], calls[4][2]
+    assert ok_context.planned == ok_context.started == fire[0]
+    assert ok_context.duration == pytest.approx(5.0)
+    assert ok_context.exception is None
+    assert isinstance(fail_context.exception, ValueError)
+
+
+def test_removed_hooks_deactivate_the_execution_path():
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast())
+        assert not scheduler.hooks.active
+        hook = scheduler.before_execution(lambda context: None)
+        assert scheduler.hooks.active
+        scheduler.hooks.remove("before", hook)
+        assert not scheduler.hooks.active
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_lifecycle_events(mode: Literal["task", "heap"]):
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    broadcast = Broadcast()
+    broadcast._loop = loop  # 默认使用 creart 创建的事件循环, 而不是虚拟时钟的
+    scheduler = GraiaScheduler(
+        loop, broadcast, mode=mode, clock=clock, lifecycle_events=True
+    )
+    received: List[Tuple[str, str, bool]] = []
+
+    @broadcast.receiver(SchedulerTaskStarted)
+    async def on_started(task: SchedulerTask, context: ExecutionContext):
+        received.append(("started", task.id, context.duration is None))
+
+    @broadcast.receiver(SchedulerTaskFinished)
+    async def on_finished(task: SchedulerTask, context: ExecutionContext):
+        received.append(("finished", task.id, context.duration is None))
+
+    async def job():
+        await asyncio.sleep(1)
+
+    times = [START + timedelta(minutes=minute) for minute in (1, 2)]
+    scheduler.add_task(job, times, id="job")
+    loop.call_at(600, scheduler.stop)
+    try:
+        loop.run_until_complete(scheduler.run(forever=True))
+    finally:
+        loop.close()
+    assert received == [("started", "job", True), ("finished", "job", False)] * 2
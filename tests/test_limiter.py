@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal, Optional
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.limiter import ExecutionLimiter
+
+
+async def _hold(
+    limiter: ExecutionLimiter,
+    order: List[str],
+    name: str,
+    priority: int = 0,
+    group: Optional[str] = None,
+):
+    await limiter.acquire(priority, group)
+    order.append(name)
+    await asyncio.sleep(0)
+    limiter.release(group)
+
+
+def test_waiters_are_served_by_priority_then_arrival():
+    async def main():
+        limiter = ExecutionLimiter(1)
+        order: List[str] = []
+        await limiter.acquire()
+        waiters = [
+            asyncio.create_task(_hold(limiter, order, name, priority))
+            for name, priority in (("low", 0), ("high", 5), ("mid", 1), ("low2", 0))
+        ]
+        await asyncio.sleep(0)
+        assert limiter.pending == 4
+        limiter.release()
+        await asyncio.gather(*waiters)
+        assert limiter.active == 0
+        return order
+
+    assert asyncio.run(main()) == ["high", "mid", "low", "low2"]
+
+
+def test_full_group_does_not_block_other_groups():
+    async def main():
+        limiter = ExecutionLimiter(group_limits={"a": 1})
+        order: List[str] = []
+        await limiter.acquire(group="a")
+        blocked = asyncio.create_task(_hold(limiter, order, "a", priority=9, group="a"))
+        other = asyncio.create_task(_hold(limiter, order, "b", group="b"))
+        await other
+        assert order == ["b"] and not blocked.done()
+        limiter.release("a")
+        await blocked
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert limiter.active == 0 and limiter.group_active == {"a": 0, "b": 0}
+
+
+def test_cancelled_waiter_gives_up_its_place():
+    async def main():
+        limiter = ExecutionLimiter(1)
+        order: List[str] = []
+        await limiter.acquire()
+        cancelled = asyncio.create_task(_hold(limiter, order, "cancelled", 5))
+        waiting = asyncio.create_task(_hold(limiter, order, "waiting"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        limiter.release()
+        await waiting
+        assert limiter.active == 0 and limiter.pending == 0
+        return order
+
+    assert asyncio.run(main()) == ["waiting"]
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_scheduler_limits_concurrent_executions(mode: Literal["task", "heap"]):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(
+        loop,
+        Broadcast(),
+        mode=mode,
+        clock=clock,
+        max_concurrency=2,
+        group_concurrency={"slow": 1},
+    )
+    started: List[str] = []
+    running = {"all": 0, "slow": 0}
+    peak = {"all": 0, "slow": 0}
+
+    def make_job(id: str, group: Optional[str], duration: float):
+        async def job():
+            started.append(id)
+            keys = ["all"] if group is None else ["all", group]
+            for key in keys:
+                running[key] += 1
+                peak[key] = max(peak[key], running[key])
+            await asyncio.sleep(duration)
+            for key in keys:
+                running[key] -= 1
+
+        return job
+
+    # first 与 slow1 先占满名额, 其余的执行在一秒后到达并排队
+    jobs = [
+        ("first", None, 0, 0, 10),
+        ("slow1", "slow", 0, 0, 15),
+        ("slow2", "slow", 9, 1, 10),
+        ("low", None, 0, 1, 10),
+        ("high", None, 5, 1, 10),
+    ]
+    for id, group, priority, delay, duration in jobs:
+        fire = [clock.now() + timedelta(minutes=1, seconds=delay)]
+        job = make_job(id, group, duration)
+        scheduler.add_task(job, fire, priority=priority, group=group, id=id)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert peak == {"all": 2, "slow": 1}
+    # first 结束时 slow2 所在的分组仍满, 名额先给 high; slow1 结束后才轮到 slow2
+    assert sorted(started[:2]) == ["first", "slow1"]
+    assert started[2:] == ["high", "slow2", "low"]
+    assert clock.now() == datetime(2024, 1, 1, 0, 1, 30)
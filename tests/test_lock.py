@@ -0,0 +1,73 @@
+import asyncio
+import multiprocessing
+import os
+from collections import Counter
+from pathlib import Path
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.lock import SQLiteLockBackend
+from graia.scheduler.timers import crontabify
+
+PROCESSES = 4
+DURATION = 3.5
+
+
+def test_sqlite_lease_is_granted_once(tmp_path: Path):
+    path = str(tmp_path / "leases.db")
+    first, second = SQLiteLockBackend(path), SQLiteLockBackend(path)
+
+    async def acquire():
+        return [
+            await first.acquire("job@1"),
+            await second.acquire("job@1"),
+            await second.acquire("job@2"),
+        ]
+
+    try:
+        assert asyncio.run(acquire()) == [True, False, True]
+    finally:
+        first.close()
+        second.close()
+
+
+async def _worker(path: str, queue: "multiprocessing.Queue[tuple]") -> None:
+    loop = asyncio.get_running_loop()
+    lock = SQLiteLockBackend(path)
+    scheduler = GraiaScheduler(loop, Broadcast(), lock=lock)
+
+    def report():
+        queue.put((task.last_fire_time, os.getpid()))
+
+    task = scheduler.add_task(report, crontabify("* * * * * *"), id="report")
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(DURATION)
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+    lock.close()
+
+
+def _run_worker(path: str, queue: "multiprocessing.Queue[tuple]") -> None:
+    asyncio.run(_worker(path, queue))
+
+
+def test_each_occurrence_runs_once_across_processes(tmp_path: Path):
+    path = str(tmp_path / "leases.db")
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_run_worker, args=(path, queue))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    fires = [queue.get(timeout=30) for _ in range(int(DURATION) - 1)]
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+    while not queue.empty():
+        fires.append(queue.get())
+    occurrences = Counter(fire_time for fire_time, _ in fires)
+    assert len(occurrences) >= int(DURATION) - 1
+    assert all(count == 1 for count in occurrences.values())
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Literal
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.timers import IntervalTimer, crontabify, every_custom_seconds
+
+
+@pytest.fixture
+def scheduler():
+    loop = asyncio.new_event_loop()
+    try:
+        yield GraiaScheduler(loop, Broadcast())
+    finally:
+        loop.close()
+
+
+def test_misfires_count_every_skipped_interval(scheduler: GraiaScheduler):
+    base = datetime.now().replace(microsecond=0) - timedelta(weeks=1)
+    task = scheduler.add_task(lambda: None, every_custom_seconds(1, base=base))
+    fire_time = task.plan()
+    assert fire_time is not None and fire_time >= datetime.now() - timedelta(seconds=1)
+    skipped = (fire_time - base).total_seconds() - 1  # base 本身不是执行时间
+    assert task.misfire_count == pytest.approx(skipped, abs=1)
+    assert task.misfire_count > 600000
+
+
+def test_misfires_count_every_skipped_rate_tick():
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+    timer = IntervalTimer(timedelta(seconds=1), fixed="rate")
+    task = scheduler.add_task(lambda: None, timer)
+    try:
+        assert task.plan() is not None
+        clock.advance(3600)  # 事件循环停顿了一小时
+        task.plan()
+    finally:
+        loop.close()
+    assert task.misfire_count == pytest.approx(3600, abs=2)
+
+
+def test_misfires_count_every_skipped_cron_minute(scheduler: GraiaScheduler):
+    base = datetime.now().replace(second=0, microsecond=0) - timedelta(days=1)
+    task = scheduler.add_task(lambda: None, crontabify("* * * * *", base))
+    fire_time = task.plan()
+    assert fire_time is not None
+    assert task.misfire_count == (fire_time - base) // timedelta(minutes=1) - 1
+
+
+def test_misfires_count_every_skipped_plain_iterable(scheduler: GraiaScheduler):
+    now = datetime.now()
+    times = [now - timedelta(minutes=index) for index in range(5, 0, -1)]
+    task = scheduler.add_task(lambda: None, times + [now + timedelta(hours=1)])
+    assert task.plan() == now + timedelta(hours=1)
+    assert task.misfire_count == 5
+
+
+def test_exported_misfires_after_stall():
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+    scheduler.add_task(
+        lambda: None, every_custom_seconds(1, base=clock.now()), id="tick"
+    )
+
+    async def stall():
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(2.5)
+        clock.advance(3600)  # 事件循环停顿了一小时
+        await asyncio.sleep(2)
+        scheduler.stop()
+        await scheduler.join()
+        await runner
+
+    try:
+        loop.run_until_complete(stall())
+    finally:
+        loop.close()
+    exported = scheduler.export_prometheus()
+    line = 'graia_scheduler_misfires_total{task="tick"} '
+    value = next(row for row in exported.splitlines() if row.startswith(line))
+    assert int(value[len(line) :]) == pytest.approx(3600, abs=2)
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_spread_offset_is_applied_before_misfire_check(mode: Literal["task", "heap"]):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock)
+
+    async def job():
+        await asyncio.sleep(40)  # 偏移加上执行耗时超过了下一个整分
+
+    timer = crontabify("* * * * *", clock.now(), spread=59.9)
+    task = scheduler.add_task(job, timer, id="minutely")
+    assert task.spread_offset > 20
+
+    async def run_for(minutes: int):
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(minutes * 60)
+        scheduler.stop()
+        await scheduler.join()
+        await runner
+
+    try:
+        loop.run_until_complete(run_for(10))
+    finally:
+        loop.close()
+    assert task.misfire_count == 0
+    assert task.metrics.fires == 9  # 01:28.5, 02:28.5, ..., 09:28.5
+
+
+def test_coalesce_keeps_last_missed_time_of_exhausted_timer(
+    scheduler: GraiaScheduler,
+):
+    now = datetime.now()
+    times = [now - timedelta(seconds=20), now - timedelta(seconds=10)]
+    task = scheduler.add_task(lambda: None, times, misfire_grace_time=60, coalesce=True)
+    assert task.plan() == times[-1]
+    assert task.plan() is None
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+
+START = datetime(2024, 1, 1)
+
+
+def _scheduler() -> Tuple[GraiaScheduler, VirtualClock]:
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    broadcast = Broadcast()
+    broadcast._loop = loop  # 执行失败时 ExceptionThrown 在 broadcast 的事件循环上广播
+    return GraiaScheduler(loop, broadcast, clock=clock), clock
+
+
+def test_oneshots_run_once_in_order():
+    scheduler, clock = _scheduler()
+    fired: List[Tuple[str, float]] = []
+
+    def record(name: str, suffix: str = ""):
+        fired.append((name + suffix, (clock.now() - START).total_seconds()))
+
+    async def slow(name: str):
+        await asyncio.sleep(5)
+        record(name)
+
+    def fail():
+        raise ValueError("异常不影响其他任务")
+
+    scheduler.schedule_after(30, record, "after", suffix="!")
+    scheduler.schedule_at(START + timedelta(seconds=10), record, "at")
+    scheduler.schedule_after(timedelta(seconds=20), slow, "slow")
+    scheduler.schedule_after(15, fail)
+    cancelled = scheduler.schedule_after(25, record, "cancelled")
+    assert len(scheduler.oneshots) == 5
+    assert cancelled.when == START + timedelta(seconds=25)
+    assert cancelled.cancel() and not cancelled.cancel()
+    assert cancelled.cancelled and not cancelled.pending
+    assert len(scheduler.oneshots) == 4
+    try:
+        # 没有计划任务时, run 在所有一次性任务执行完毕后返回
+        scheduler.loop.run_until_complete(scheduler.run())
+    finally:
+        scheduler.loop.close()
+    assert fired == [("at", 10.0), ("slow", 25.0), ("after!", 30.0)]
+    assert len(scheduler.oneshots) == 0
+
+
+def test_overdue_oneshots_run_at_start():
+    scheduler, clock = _scheduler()
+    fired: List[datetime] = []
+    scheduler.schedule_at(START - timedelta(hours=1), lambda: fired.append(clock.now()))
+    loop = scheduler.loop
+    loop.call_at(60, lambda: loop.create_task(scheduler.run()))
+    try:
+        loop.run_until_complete(asyncio.sleep(120))
+    finally:
+        loop.close()
+    assert fired == [START + timedelta(minutes=1)]
+
+
+def test_cancelled_entries_are_compacted():
+    scheduler, _ = _scheduler()
+    oneshots = scheduler.oneshots
+    oneshots.compact_threshold = 4
+    jobs = [scheduler.schedule_after(index + 1, lambda: None) for index in range(10)]
+    for job in jobs[:5]:
+        job.cancel()
+    assert len(oneshots.queue) == 10 and len(oneshots) == 5
+    jobs[5].cancel()  # 被取消的条目超过一半, 压缩堆
+    assert len(oneshots.queue) == len(oneshots) == 4
+    try:
+        scheduler.loop.run_until_complete(scheduler.run())
+    finally:
+        scheduler.loop.close()
+    assert not any(job.pending for job in jobs)
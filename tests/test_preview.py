@@ -0,0 +1,135 @@
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.preview import UpcomingFire
+from graia.scheduler.timers import IntervalTimer, SeekableTimer, crontabify
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(datetime(2024, 1, 1, 12, 0, 30))
+
+
+@pytest.fixture
+def scheduler(clock: VirtualClock):
+    loop = clock.new_event_loop()
+    try:
+        yield GraiaScheduler(loop, Broadcast(), clock=clock)
+    finally:
+        loop.close()
+
+
+def _expected(timer: SeekableTimer, start: datetime, count: int):
+    clone = timer.clone()
+    values = [clone.seek(start)]
+    values.extend(next(clone) for _ in range(count - 1))
+    return values
+
+
+def test_upcoming_fires_match_the_timer(scheduler: GraiaScheduler):
+    rng = random.Random(0)
+    timers = {}
+    for index in range(40):
+        pattern = (
+            f"{rng.choice(['*', '*/5', str(rng.randrange(60))])} "
+            f"{rng.choice(['*', '*/3', str(rng.randrange(24))])} "
+            f"{rng.choice(['*', '1,15', '*/7'])} * {rng.choice(['*', '1-5'])}"
+        )
+        timers[f"cron{index}"] = crontabify(pattern, "2024-01-01 00:00")
+    timers["grid"] = IntervalTimer(timedelta(minutes=7), base="2024-01-01 00:00")
+    timers["rate"] = IntervalTimer(timedelta(minutes=7), fixed="rate")
+    for id, timer in timers.items():
+        scheduler.add_task(lambda: None, timer, id=id)
+    fires = scheduler.upcoming_fires(20)
+    start = scheduler.clock.now()
+    for id, timer in timers.items():
+        assert fires[id] == _expected(timer, start, 20), id
+
+
+def test_preview_does_not_advance_timers(scheduler: GraiaScheduler):
+    timer = crontabify("*/5 * * * *", "2024-01-01 00:00")
+    task = scheduler.add_task(lambda: None, timer, id="cron")
+    planned = task.plan()
+    assert planned == datetime(2024, 1, 1, 12, 5)
+    assert scheduler.upcoming_fires(3)["cron"] == [
+        datetime(2024, 1, 1, 12, 5),
+        datetime(2024, 1, 1, 12, 10),
+        datetime(2024, 1, 1, 12, 15),
+    ]
+    assert scheduler.upcoming_fires(3) == scheduler.upcoming_fires(3)
+    assert task.plan() == datetime(2024, 1, 1, 12, 10)
+
+
+def test_upcoming_fires_until(scheduler: GraiaScheduler):
+    scheduler.add_task(
+        lambda: None, crontabify("*/10 * * * *", "2024-01-01 00:00"), id="cron"
+    )
+    assert scheduler.upcoming_fires(None, timedelta(minutes=30))["cron"] == [
+        datetime(2024, 1, 1, 12, 10),
+        datetime(2024, 1, 1, 12, 20),
+        datetime(2024, 1, 1, 12, 30),
+    ]
+    with pytest.raises(ValueError):
+        scheduler.upcoming_fires(None)
+
+
+def test_timeline_merges_tasks_in_order(scheduler: GraiaScheduler):
+    scheduler.add_task(
+        lambda: None, crontabify("*/20 * * * *", "2024-01-01 00:00"), id="a"
+    )
+    scheduler.add_task(
+        lambda: None, crontabify("*/30 * * * *", "2024-01-01 00:00"), id="b"
+    )
+    paused = scheduler.add_task(
+        lambda: None, crontabify("* * * * *", "2024-01-01 00:00"), id="paused"
+    )
+    paused.pause()
+    assert scheduler.timeline(timedelta(hours=1)) == [
+        UpcomingFire(datetime(2024, 1, 1, 12, 20), "a"),
+        UpcomingFire(datetime(2024, 1, 1, 12, 30), "b"),
+        UpcomingFire(datetime(2024, 1, 1, 12, 40), "a"),
+        UpcomingFire(datetime(2024, 1, 1, 13, 0), "a"),
+        UpcomingFire(datetime(2024, 1, 1, 13, 0), "b"),
+    ]
+    assert len(scheduler.timeline(timedelta(days=1), limit=4)) == 4
+
+
+def test_upcoming_fires_of_plain_iterables(scheduler: GraiaScheduler):
+    now = scheduler.clock.now()
+    times = [now + timedelta(minutes=index) for index in range(-2, 3)]
+    scheduler.add_task(lambda: None, times, id="list")
+    iterator = scheduler.add_task(lambda: None, iter(times), id="iterator")
+    assert scheduler.upcoming_fires()["list"] == times[2:]
+    # 迭代器无法复制, 只能给出已计划的时间
+    assert scheduler.upcoming_fires()["iterator"] == []
+    iterator.plan()
+    assert scheduler.upcoming_fires()["iterator"] == [times[2]]
+
+
+def test_upcoming_fires_with_sleeping_loop(clock: VirtualClock):
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+    scheduler.add_task(
+        lambda: None, crontabify("*/15 * * * *", "2024-01-01 00:00"), id="cron"
+    )
+
+    async def preview():
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(60)
+        fires = scheduler.upcoming_fires(2)
+        scheduler.stop()
+        await scheduler.join()
+        await runner
+        return fires
+
+    try:
+        fires = loop.run_until_complete(preview())
+    finally:
+        loop.close()
+    assert fires["cron"] == [datetime(2024, 1, 1, 12, 15), datetime(2024, 1, 1, 12, 30)]
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.retry import RetryPolicy
+from graia.scheduler.task import SchedulerTask
+
+START = datetime(2024, 1, 1)
+
+
+def test_policy_backs_off_exponentially():
+    policy = RetryPolicy(
+        max_attempts=5, initial_delay=2.0, multiplier=3.0, max_delay=30.0, jitter=0.0
+    )
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [2.0, 6.0, 18.0, 30.0]
+    assert policy.should_retry(ValueError(), 4)
+    assert not policy.should_retry(ValueError(), 5)
+    assert not RetryPolicy(retry_on=(KeyError,)).should_retry(ValueError(), 1)
+    jittered = RetryPolicy(initial_delay=10.0, jitter=0.5)
+    assert all(5.0 <= jittered.delay(1) <= 15.0 for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    "options", [{"max_attempts": 0}, {"initial_delay": -1.0}, {"jitter": 1.5}]
+)
+def test_invalid_policy(options):
+    with pytest.raises(ValueError):
+        RetryPolicy(**options)
+
+
+def _run(mode: Literal["task", "heap"], times: List[datetime], job, **options):
+    clock = VirtualClock(START)
+    loop = clock.new_event_loop()
+    broadcast = Broadcast()
+    broadcast._loop = loop  # 执行失败时 ExceptionThrown 在 broadcast 的事件循环上广播
+    scheduler = GraiaScheduler(loop, broadcast, mode=mode, clock=clock)
+    task = scheduler.add_task(job(clock), times, id="job", **options)
+    loop.call_at(3600, scheduler.stop)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    return task
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_failed_execution_is_retried(mode: Literal["task", "heap"]):
+    attempts: List[datetime] = []
+
+    def job(clock: VirtualClock):
+        def flaky():
+            attempts.append(clock.now())
+            if len(attempts) < 3:
+                raise ValueError
+
+        return flaky
+
+    policy = RetryPolicy(initial_delay=10.0, jitter=0.0)
+    task = _run(mode, [START + timedelta(minutes=1)], job, retry=policy)
+    assert [(time - START).total_seconds() for time in attempts] == [60, 70, 90]
+    assert task.metrics.retries == 2
+    assert task.metrics.fires == 3
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_earlier_regular_fire_runs_before_retry(mode: Literal["task", "heap"]):
+    attempts: List[datetime] = []
+
+    def job(clock: VirtualClock):
+        def failing():
+            attempts.append(clock.now())
+            raise ValueError
+
+        return failing
+
+    times = [START + timedelta(seconds=seconds) for seconds in (60, 65)]
+    policy = RetryPolicy(max_attempts=2, initial_delay=10.0, jitter=0.0)
+    task = _run(mode, times, job, retry=policy)
+    # 60 秒的执行失败后于 70 秒重试; 65 秒的常规执行先进行, 其重试晚于已有的重试而被忽略
+    assert [(time - START).total_seconds() for time in attempts] == [60, 65, 70]
+    assert task.metrics.retries == 1
+
+
+def test_timeout_is_retried():
+    attempts: List[datetime] = []
+
+    def job(clock: VirtualClock):
+        async def slow():
+            attempts.append(clock.now())
+            if len(attempts) < 2:
+                await asyncio.sleep(60)
+
+        return slow
+
+    task: SchedulerTask = _run(
+        "task",
+        [START + timedelta(minutes=1)],
+        job,
+        timeout=5.0,
+        cancelable=True,
+        retry=RetryPolicy(
+            initial_delay=1.0, jitter=0.0, retry_on=(asyncio.TimeoutError,)
+        ),
+    )
+    assert [(time - START).total_seconds() for time in attempts] == [60, 66]
+    assert task.timeout_count == 1
@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.timers import IntervalTimer
+
+
+def test_schedule_tasks_is_read_only():
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast())
+        task = scheduler.add_task(lambda: None, IntervalTimer(timedelta(hours=1)))
+        tasks = scheduler.schedule_tasks
+        assert list(tasks) == [task]
+        with pytest.raises(TypeError):
+            tasks.remove(task)  # type: ignore
+        with pytest.raises(TypeError):
+            tasks.append(task)  # type: ignore
+        assert scheduler.schedule_tasks == (task,)
+    finally:
+        loop.close()
+
+
+def _times(start: datetime, *minutes: int) -> List[datetime]:
+    return [start + timedelta(minutes=minute) for minute in minutes]
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_run_returns_when_all_tasks_finish(mode: Literal["task", "heap"]):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock)
+    fired = []
+
+    async def job():
+        await asyncio.sleep(30)
+        fired.append(clock.now())
+
+    scheduler.add_task(job, _times(clock.now(), 1, 2))
+    scheduler.add_task(lambda: None, _times(clock.now(), 3))
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    # 返回前等待最后一次执行结束
+    assert fired == [datetime(2024, 1, 1, 0, 1, 30), datetime(2024, 1, 1, 0, 2, 30)]
+    assert clock.now() == datetime(2024, 1, 1, 0, 3)
+    assert not scheduler.running
+
+
+def test_run_without_tasks_returns_immediately():
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast())
+        loop.run_until_complete(asyncio.wait_for(scheduler.run(), 1))
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_run_waits_for_oneshots_and_runtime_tasks(mode: Literal["task", "heap"]):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock)
+    fired = []
+
+    def add_later():
+        fired.append("oneshot")
+        scheduler.add_task(
+            lambda: fired.append("late"), _times(clock.now(), 5), id="late"
+        )
+
+    scheduler.add_task(lambda: fired.append("early"), _times(clock.now(), 1))
+    scheduler.schedule_after(timedelta(minutes=2), add_later)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert fired == ["early", "oneshot", "late"]
+    assert clock.now() == datetime(2024, 1, 1, 0, 7)
+
+
+def test_removing_the_last_task_ends_run():
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+    scheduler.add_task(lambda: None, IntervalTimer(timedelta(minutes=1)), id="tick")
+    loop.call_at(600, scheduler.remove_task, "tick")
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert clock.now() == datetime(2024, 1, 1, 0, 10)
+    assert not scheduler.tasks
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+def test_run_forever_keeps_running_until_stop(mode: Literal["task", "heap"]):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), mode=mode, clock=clock)
+    fired = []
+    scheduler.add_task(lambda: fired.append("early"), _times(clock.now(), 1))
+
+    async def main():
+        runner = asyncio.create_task(scheduler.run(forever=True))
+        await asyncio.sleep(3600)
+        assert not runner.done()
+        scheduler.add_task(
+            lambda: fired.append("late"), _times(clock.now(), 1), id="late"
+        )
+        await asyncio.sleep(120)
+        scheduler.stop()
+        await runner
+
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert fired == ["early", "late"]
+
+
+def test_sharded_run_returns_when_all_tasks_finish():
+    async def main():
+        scheduler = GraiaScheduler(asyncio.get_running_loop(), Broadcast(), shards=2)
+        now = datetime.now()
+        for index in range(4):
+            times = [now + timedelta(milliseconds=20 * step) for step in range(1, 4)]
+            scheduler.add_task(
+                lambda: None, times, misfire_grace_time=None, id=str(index)
+            )
+        await asyncio.wait_for(scheduler.run(), 5)
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    assert all(task.metrics.fires == 3 for task in scheduler.schedule_tasks)
+    assert all(shard.thread is None for shard in scheduler.shards)
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import timedelta
+from typing import Optional
+
+import pytest
+from graia.broadcast import Broadcast
+from graia.broadcast.builtin.event import ExceptionThrown
+from graia.broadcast.entities.dispatcher import BaseDispatcher
+from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.timers import IntervalTimer
+
+
+def test_shards_create_event_loops_only_when_started():
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast(), shards=2)
+        assert all(shard.loop is None for shard in scheduler.shards)
+    finally:
+        loop.close()
+
+
+async def _run_sharded():
+    scheduler = GraiaScheduler(asyncio.get_running_loop(), Broadcast(), shards=2)
+    interval = IntervalTimer(timedelta(milliseconds=20), fixed="rate")
+    early = scheduler.add_task(lambda: None, interval, id="early")
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.05)
+    late_timer = IntervalTimer(timedelta(milliseconds=20), fixed="rate")
+    late = scheduler.add_task(lambda: None, late_timer, id="late")
+    await asyncio.sleep(0.2)
+    early.pause()  # 从主线程转交给分片的事件循环
+    await asyncio.sleep(0.05)
+    paused_fires = early.metrics.fires
+    await asyncio.sleep(0.1)
+    shard_loops = {shard.loop for shard in scheduler.shards}
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+    return early, late, shard_loops, paused_fires
+
+
+def test_sharded_tasks_run_on_shard_loops():
+    early, late, shard_loops, paused_fires = asyncio.run(_run_sharded())
+    assert early.loop in shard_loops and late.loop in shard_loops
+    assert early.metrics.fires > 0 and late.metrics.fires > 0
+    assert early.metrics.fires == paused_fires
+
+
+class _Answer(BaseDispatcher):
+    async def catch(self, interface: DispatcherInterface):
+        if interface.name == "answer":
+            return 42
+
+
+async def _run_with_dispatcher(shards: Optional[int]):
+    broadcast = Broadcast()
+    broadcast.prelude_dispatchers.append(_Answer())
+    scheduler = GraiaScheduler(asyncio.get_running_loop(), broadcast, shards=shards)
+    answers = []
+    failures = []
+
+    @broadcast.receiver(ExceptionThrown)
+    async def record(event: ExceptionThrown):
+        failures.append(event.exception)
+
+    def job(answer: int):
+        answers.append(answer)
+
+    timer = IntervalTimer(timedelta(milliseconds=20), fixed="rate")
+    scheduler.add_task(job, timer, id="answer")
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.1)
+    scheduler.stop()
+    await scheduler.join()
+    await runner
+    return answers, failures
+
+
+@pytest.mark.parametrize("shards", [None, 2])
+def test_sharded_tasks_use_scheduler_broadcast_dispatchers(shards: Optional[int]):
+    answers, failures = asyncio.run(_run_with_dispatcher(shards))
+    assert not failures
+    assert answers and set(answers) == {42}
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.store import JobState, SQLiteJobStore
+from graia.scheduler.timers import IntervalTimer, crontabify
+
+START = datetime(2024, 1, 1)
+
+
+def test_sqlite_store_round_trip(tmp_path: Path):
+    path = str(tmp_path / "jobs.db")
+    store = SQLiteJobStore(path, max_pending=2)
+    state = JobState(START + timedelta(hours=1), START)
+    store.update("a", state)
+    assert store.load("a") == state  # 尚未写入时从积压的变更中读取
+    store.update("b", JobState(None, None))  # 积压达到 max_pending, 立即写入
+    assert not store._dirty
+    store.update("c", state)
+    store.remove("b")
+    store.close()
+
+    reopened = SQLiteJobStore(path)
+    try:
+        assert reopened.load("a") == state
+        assert reopened.load("b") is None
+        assert reopened.load("c") == state
+    finally:
+        reopened.close()
+
+
+def _run(
+    path: str,
+    start: datetime,
+    until: datetime,
+    timer_factory,
+    **options,
+) -> Tuple[List[Tuple[datetime, Optional[datetime]]], int]:
+    clock = VirtualClock(start)
+    loop = clock.new_event_loop()
+    store = SQLiteJobStore(path)
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock, store=store)
+    fired: List[Tuple[datetime, Optional[datetime]]] = []
+
+    def job():
+        fired.append((clock.now(), task.last_fire_time))
+
+    task = scheduler.add_task(job, timer_factory(), id="job", **options)
+    loop.call_at((until - start).total_seconds(), scheduler.stop)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+        store.close()
+    return fired, task.misfire_count
+
+
+def _every_ten_minutes():
+    return IntervalTimer(timedelta(minutes=10), base=START)
+
+
+def test_restored_task_coalesces_missed_fires(tmp_path: Path):
+    path = str(tmp_path / "jobs.db")
+    fired, _ = _run(path, START, START + timedelta(minutes=35), _every_ten_minutes)
+    assert [planned for _, planned in fired] == [
+        START + timedelta(minutes=minutes) for minutes in (10, 20, 30)
+    ]
+    # 停机半小时后重启: 0:40, 0:50, 1:00 均已错过, 合并为一次立即执行
+    fired, misfires = _run(
+        path,
+        START + timedelta(minutes=65),
+        START + timedelta(minutes=75),
+        _every_ten_minutes,
+        coalesce=True,
+        misfire_grace_time=None,
+    )
+    assert fired == [
+        (START + timedelta(minutes=65), START + timedelta(minutes=60)),
+        (START + timedelta(minutes=70), START + timedelta(minutes=70)),
+    ]
+    assert misfires == 0
+
+
+def test_restored_task_skips_missed_fires(tmp_path: Path):
+    path = str(tmp_path / "jobs.db")
+
+    def hourly():
+        return crontabify("0 * * * *", START)
+
+    _run(path, START, START + timedelta(minutes=90), hourly)
+    fired, misfires = _run(
+        path,
+        START + timedelta(hours=4, minutes=30),
+        START + timedelta(hours=6, minutes=30),
+        hourly,
+    )
+    assert [planned for _, planned in fired] == [
+        START + timedelta(hours=5),
+        START + timedelta(hours=6),
+    ]
+    assert misfires == 3  # 2:00, 3:00, 4:00
+
+
+def test_removed_task_forgets_its_state(tmp_path: Path):
+    path = str(tmp_path / "jobs.db")
+    store = SQLiteJobStore(path)
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = GraiaScheduler(loop, Broadcast(), store=store)
+        task = scheduler.add_task(lambda: None, _every_ten_minutes(), id="job")
+        task.plan()
+        assert store.load("job") is not None
+        scheduler.remove_task("job")
+        assert store.load("job") is None
+    finally:
+        loop.close()
+        store.close()
@@ -0,0 +1,74 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Literal
+
+import pytest
+from graia.broadcast import Broadcast
+
+from graia.scheduler import GraiaScheduler
+from graia.scheduler.clock import VirtualClock
+from graia.scheduler.event import SchedulerTaskTimeout
+from graia.scheduler.task import SchedulerTask
+
+
+@pytest.mark.parametrize("mode", ["task", "heap"])
+@pytest.mark.parametrize("cancelable", [True, False])
+def test_timed_out_executions(mode: Literal["task", "heap"], cancelable: bool):
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    broadcast = Broadcast()
+    broadcast._loop = loop  # 默认使用 creart 创建的事件循环, 而不是虚拟时钟的
+    scheduler = GraiaScheduler(loop, broadcast, mode=mode, clock=clock)
+    finished: List[datetime] = []
+    events: List[SchedulerTaskTimeout] = []
+
+    @broadcast.receiver(SchedulerTaskTimeout)
+    async def on_timeout(event: SchedulerTaskTimeout, task: SchedulerTask):
+        assert task is event.task
+        events.append(event)
+
+    async def job():
+        await asyncio.sleep(80)
+        finished.append(clock.now())
+
+    times = [datetime(2024, 1, 1, 0, minute) for minute in (1, 2)]
+    task = scheduler.add_task(
+        job, times, cancelable=cancelable, timeout=30.0, id="slow"
+    )
+    abandoned = []
+    loop.call_at(100, lambda: abandoned.append(len(task.abandoned)))
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert task.timeout_count == task.metrics.timeouts == 2
+    assert [(event.timeout, event.cancelled) for event in events] == [
+        (30.0, cancelable)
+    ] * 2
+    # 超时不占用 max_instances 的名额, 第二次执行按时开始
+    assert task.metrics.fires == 2
+    assert task.metrics.duration.sum == pytest.approx(60.0)
+    if cancelable:
+        assert finished == [] and abandoned == [0]
+    else:  # 被放弃的执行在后台继续运行, run 不等待它们结束
+        assert abandoned == [1]
+        assert finished == [datetime(2024, 1, 1, 0, 2, 20)]
+        assert len(task.abandoned) == 1
+
+
+def test_execution_within_timeout_is_not_counted():
+    clock = VirtualClock(datetime(2024, 1, 1))
+    loop = clock.new_event_loop()
+    scheduler = GraiaScheduler(loop, Broadcast(), clock=clock)
+
+    async def job():
+        await asyncio.sleep(10)
+
+    fire = [clock.now() + timedelta(minutes=1)]
+    task = scheduler.add_task(job, fire, timeout=30.0)
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+    assert task.timeout_count == 0
+    assert task.metrics.duration.sum == pytest.approx(10.0)
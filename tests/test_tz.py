@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+
+from graia.scheduler.timers import SeekableTimer, crontabify, every
+from graia.scheduler.utilles import to_datetime
+
+
+def _utc(value: datetime) -> str:
+    return datetime.fromtimestamp(value.timestamp(), timezone.utc).strftime(
+        "%Y-%m-%d %H:%M"
+    )
+
+
+# 计时器与其期望的前若干次执行时间 (UTC)
+CASES = [
+    pytest.param(
+        crontabify("30 2 * * *", "2024-03-29 12:00", tz="Europe/Berlin"),
+        ["2024-03-30 01:30", "2024-03-31 01:00", "2024-04-01 00:30"],
+        id="berlin daily 02:30 across spring gap",
+    ),
+    pytest.param(
+        crontabify("30 2 * * *", "2024-10-26 12:00", tz="Europe/Berlin"),
+        ["2024-10-27 00:30", "2024-10-28 01:30"],
+        id="berlin daily 02:30 across autumn fold",
+    ),
+    pytest.param(
+        crontabify("*/30 * * * *", "2024-03-31 01:00", tz="Europe/Berlin"),
+        [
+            "2024-03-31 00:30",
+            "2024-03-31 01:00",
+            "2024-03-31 01:30",
+            "2024-03-31 02:00",
+        ],
+        id="berlin half-hourly across spring gap",
+    ),
+    pytest.param(
+        crontabify("*/30 * * * *", "2024-10-27 02:00", tz="Europe/Berlin"),
+        [
+            "2024-10-27 00:30",
+            "2024-10-27 01:00",
+            "2024-10-27 01:30",
+            "2024-10-27 02:00",
+            "2024-10-27 02:30",
+        ],
+        id="berlin half-hourly across autumn fold",
+    ),
+    pytest.param(
+        crontabify("15,45 2 * * *", "2024-10-27 01:00", tz="Europe/Berlin"),
+        ["2024-10-27 00:15", "2024-10-27 00:45", "2024-10-28 01:15"],
+        id="berlin 02:15 and 02:45 across autumn fold",
+    ),
+    pytest.param(
+        crontabify("0 9 * * 1-5", "2024-03-08 12:00", tz="America/New_York"),
+        ["2024-03-11 13:00", "2024-03-12 13:00"],
+        id="new york weekdays 09:00 across spring gap",
+    ),
+    pytest.param(
+        crontabify("30 1 * * *", "2024-11-02 12:00", tz="America/New_York"),
+        ["2024-11-03 05:30", "2024-11-04 06:30"],
+        id="new york 01:30 across autumn fold",
+    ),
+    pytest.param(
+        crontabify("0 9 * * *", "2024-03-30 12:00", tz="Asia/Shanghai"),
+        ["2024-03-31 01:00", "2024-04-01 01:00"],
+        id="shanghai daily 09:00",
+    ),
+    pytest.param(
+        crontabify("0 2 * * *", "2024-10-05 12:00", tz="Australia/Lord_Howe"),
+        ["2024-10-05 15:30", "2024-10-06 15:00"],
+        id="lord howe 02:00 across half-hour gap",
+    ),
+    pytest.param(
+        every(days=1, base="2024-03-29 02:30", tz="Europe/Berlin"),
+        ["2024-03-30 01:30", "2024-03-31 01:00", "2024-04-01 00:30"],
+        id="berlin every day at 02:30 across spring gap",
+    ),
+    pytest.param(
+        every(days=1, base="2024-10-26 02:30", tz="Europe/Berlin"),
+        ["2024-10-27 00:30", "2024-10-28 01:30"],
+        id="berlin every day at 02:30 across autumn fold",
+    ),
+    pytest.param(
+        every(hours=1, base="2024-10-27 01:00", tz="Europe/Berlin"),
+        ["2024-10-27 00:00", "2024-10-27 01:00", "2024-10-27 02:00"],
+        id="berlin every hour across autumn fold",
+    ),
+]
+
+
+@pytest.mark.parametrize(("timer", "expected"), CASES)
+def test_zoned_timer_across_dst(timer: SeekableTimer, expected: List[str]):
+    assert [_utc(next(timer)) for _ in expected] == expected
+
+
+def test_seek_into_spring_gap():
+    timer = crontabify("30 2 * * *", "2024-03-01 12:00", tz="Europe/Berlin")
+    t = datetime.fromtimestamp(datetime(2024, 3, 31, tzinfo=timezone.utc).timestamp())
+    assert _utc(timer.seek(t)) == "2024-03-31 01:00"
+
+
+def test_integer_timestamp_in_zone():
+    assert to_datetime(1700000000, tz="Asia/Shanghai") == datetime(
+        2023, 11, 15, 6, 13, 20
+    )